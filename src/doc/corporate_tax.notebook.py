@@ -50,3 +50,11 @@ print(taxCalculation)
 
 # %%
 taxCalculation.tax_due
+
+# %% [markdown]
+# To compare many scenarios at once, the tax due can be calculated over arrays of taxable amounts and years:
+
+# %%
+import numpy as np
+
+taxBandsByYear.calculate_batch(np.array([100_000.00, 300_000.00, 500_000.00]), 2025)
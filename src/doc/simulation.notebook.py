@@ -26,6 +26,7 @@ from financial_simulator.lib.factories.bank_accounts import (
     create_ing_business_current,
 )
 from financial_simulator.lib.providers import NeverProvider
+from financial_simulator.lib.recorders import BalanceRecorder
 from financial_simulator.lib.util.data import plot_account_balances
 
 # %% [markdown]
@@ -128,18 +129,24 @@ engine = FinancialSimulator(
     current_date=initial_date, current_entities=(jack, jill, widgets_ltd)
 )
 
-days = list(islice(engine, 5000))
+recorder = BalanceRecorder(
+    account_paths=(
+        ("assets", "bank_accounts", "current"),
+        ("assets", "bank_accounts", "savings"),
+    )
+).record(islice(engine, 5000))
 
 # %% [markdown]
 # ## Current account balances
 
 # %%
 fig = plot_account_balances(
-    days=days,
-    account_path=("assets", "bank_accounts", "current"),
-    columns=("Jack", "Jill", "Widgets LTD"),
+    balances=recorder.account_balances(
+        account_path=("assets", "bank_accounts", "current"),
+        entity_labels=("Jack", "Jill", "Widgets LTD"),
+        is_debit_account=True,
+    ),
     title="Current Account Balances",
-    is_debit_account=True,
 )
 fig.write_image("simulation.assets/current_account_balances.png")
 fig.show()
@@ -152,11 +159,12 @@ fig.show()
 
 # %%
 fig = plot_account_balances(
-    days=days,
-    account_path=("assets", "bank_accounts", "savings"),
-    columns=("Jack", "Jill", "Widgets LTD"),
+    balances=recorder.account_balances(
+        account_path=("assets", "bank_accounts", "savings"),
+        entity_labels=("Jack", "Jill", "Widgets LTD"),
+        is_debit_account=True,
+    ),
     title="Savings Account Balances",
-    is_debit_account=True,
 )
 fig.write_image("simulation.assets/savings_account_balances.png")
 fig.show()
@@ -223,7 +223,7 @@ print_provided(
 # %% [markdown]
 # ### create_sequence_provider
 #
-# This factory takes a mapping of days to values and returns a `Provider` that will provide the given values on the specified days.
+# This factory takes a mapping of days to values and returns a `SequenceProvider` that will provide the given values on the specified days. The days are kept sorted with a cursor on the next one, so each day costs the same however long the sequence is.
 
 # %%
 sequence_days = [START_DATE + timedelta(days=i) for i in range(9)]
@@ -7,6 +7,7 @@ from .dashboard import add_dashboard_command
 from .decrypt import add_decrypt_command
 from .encrypt import add_encrypt_command
 from .init import add_init_command
+from .simulate import add_simulate_command
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ def cli():
     add_encrypt_command(sub_parsers)
     add_decrypt_command(sub_parsers)
     add_dashboard_command(sub_parsers)
+    add_simulate_command(sub_parsers)
     args = parser.parse_args()
     if args.func is None:
         parser.print_help()
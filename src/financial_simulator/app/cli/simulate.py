@@ -0,0 +1,51 @@
+from argparse import Namespace
+from typing import Any
+
+from prettytable import PrettyTable, TableStyle
+
+from financial_simulator.app.config import Config
+from financial_simulator.app.dummy_days import create_dummy_scenario
+from financial_simulator.lib.scenarios import run_scenarios
+
+
+def simulate(args: Namespace, config: Config):
+    scenarios = tuple(
+        create_dummy_scenario(f"dummy_{index}") for index in range(args.scenarios)
+    )
+    scenario_run = run_scenarios(scenarios, max_workers=args.workers)
+    table = PrettyTable()
+    table.set_style(TableStyle.SINGLE_BORDER)
+    table.field_names = ["Worker", "Scenarios", "Days", "Seconds", "Days/second"]
+    table.align = "r"
+    for throughput in scenario_run.throughput:
+        table.add_row(
+            [
+                throughput.worker,
+                throughput.scenarios,
+                throughput.days,
+                f"{throughput.elapsed:.2f}",
+                f"{throughput.days_per_second:.1f}",
+            ]
+        )
+    print(table)
+    print(f"Simulated {len(scenarios)} scenarios in {scenario_run.elapsed:.2f}s")
+
+
+def add_simulate_command(subparsers: Any):
+    sub_parser = subparsers.add_parser(
+        "simulate", help="Simulate scenarios in parallel and report throughput"
+    )
+    sub_parser.add_argument(
+        "-n",
+        "--scenarios",
+        help="Number of scenarios to simulate",
+        type=int,
+        default=4,
+    )
+    sub_parser.add_argument(
+        "-w",
+        "--workers",
+        help="Maximum number of worker processes, defaults to the number of CPUs",
+        type=int,
+    )
+    sub_parser.set_defaults(func=simulate)
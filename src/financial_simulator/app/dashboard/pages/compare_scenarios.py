@@ -38,20 +38,22 @@ dash.register_page(
     Input("savings-account-balances", "figure"),
 )
 def initialize_charts(_0, _1):
-    days = init_dummy_days()
+    recorder = init_dummy_days()
     current_account_balances_figure = plot_account_balances(
-        days=days,
-        account_path=("assets", "bank_accounts", "current"),
-        columns=("Jack", "Jill", "Widgets LTD"),
+        balances=recorder.account_balances(
+            account_path=("assets", "bank_accounts", "current"),
+            entity_labels=("Jack", "Jill", "Widgets LTD"),
+            is_debit_account=True,
+        ),
         title="Savings Account Balances",
-        is_debit_account=True,
     )
     savings_account_balances_figure = plot_account_balances(
-        days=days,
-        account_path=("assets", "bank_accounts", "savings"),
-        columns=("Jack", "Jill", "Widgets LTD"),
+        balances=recorder.account_balances(
+            account_path=("assets", "bank_accounts", "savings"),
+            entity_labels=("Jack", "Jill", "Widgets LTD"),
+            is_debit_account=True,
+        ),
         title="Savings Account Balances",
-        is_debit_account=True,
     )
     return current_account_balances_figure, savings_account_balances_figure
 
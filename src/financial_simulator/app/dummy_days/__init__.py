@@ -1,5 +1,11 @@
-from .init_dummy_days import init_dummy_days
+from .init_dummy_days import (
+    create_dummy_entities,
+    create_dummy_scenario,
+    init_dummy_days,
+)
 
 __all__ = [
+    "create_dummy_entities",
+    "create_dummy_scenario",
     "init_dummy_days",
 ]
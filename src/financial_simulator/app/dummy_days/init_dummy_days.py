@@ -1,10 +1,10 @@
 from datetime import date
 from decimal import Decimal
 from itertools import islice
-from typing import Sequence, Tuple
+from typing import Sequence
 
 from financial_simulator import FinancialSimulator
-from financial_simulator.lib.accounting import Books, Change, Transaction
+from financial_simulator.lib.accounting import Change, Transaction, create_books
 from financial_simulator.lib.entities import Corporation, Entity, Individual
 from financial_simulator.lib.factories.bank_accounts import (
     create_abn_amro_personal_current,
@@ -12,14 +12,21 @@ from financial_simulator.lib.factories.bank_accounts import (
     create_ing_business_current,
 )
 from financial_simulator.lib.providers import NeverProvider
+from financial_simulator.lib.recorders import BalanceRecorder
+from financial_simulator.lib.scenarios import Scenario
 
+INITIAL_DATE = date(2019, 12, 31)
+NUMBER_OF_DAYS = 5000
+ACCOUNT_PATHS = (
+    ("assets", "bank_accounts", "current"),
+    ("assets", "bank_accounts", "savings"),
+)
 
-def init_dummy_days() -> Sequence[Tuple[date, Sequence[Entity]]]:
-    initial_date = date(2019, 12, 31)
 
+def create_dummy_entities(initial_date: date) -> Sequence[Entity]:
     jack = Individual(
         name="jack",
-        books=Books.create(
+        books=create_books(
             Transaction(
                 transaction_date=initial_date,
                 description="Initial transaction",
@@ -51,7 +58,7 @@ def init_dummy_days() -> Sequence[Tuple[date, Sequence[Entity]]]:
 
     jill = Individual(
         name="jill",
-        books=Books.create(
+        books=create_books(
             Transaction(
                 transaction_date=initial_date,
                 description="Initial transaction",
@@ -83,7 +90,7 @@ def init_dummy_days() -> Sequence[Tuple[date, Sequence[Entity]]]:
 
     widgets_ltd = Corporation(
         name="widgets_ltd",
-        books=Books.create(
+        books=create_books(
             Transaction(
                 transaction_date=initial_date,
                 description="Initial transaction",
@@ -110,7 +117,24 @@ def init_dummy_days() -> Sequence[Tuple[date, Sequence[Entity]]]:
         salaries=(),
     )
 
+    return jack, jill, widgets_ltd
+
+
+def create_dummy_scenario(name: str = "dummy") -> Scenario:
+    return Scenario(
+        name=name,
+        initial_date=INITIAL_DATE,
+        entities=create_dummy_entities(INITIAL_DATE),
+        number_of_days=NUMBER_OF_DAYS,
+        account_paths=ACCOUNT_PATHS,
+    )
+
+
+def init_dummy_days() -> BalanceRecorder:
     fs = FinancialSimulator(
-        current_date=initial_date, current_entities=(jack, jill, widgets_ltd)
+        current_date=INITIAL_DATE,
+        current_entities=create_dummy_entities(INITIAL_DATE),
+    )
+    return BalanceRecorder(account_paths=ACCOUNT_PATHS).record(
+        islice(fs, NUMBER_OF_DAYS)
     )
-    return list(islice(fs, 5000))
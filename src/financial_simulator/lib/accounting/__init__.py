@@ -1,11 +1,19 @@
 from .account import Account
+from .account_path import AccountPath
 from .books import Books
 from .change import Change
+from .create_books import create_books
+from .flat_books import FlatBooks
+from .journal import Journal
 from .transaction import Transaction
 
 __all__ = [
     "Books",
+    "FlatBooks",
     "Transaction",
     "Account",
+    "AccountPath",
     "Change",
+    "Journal",
+    "create_books",
 ]
@@ -1,6 +1,7 @@
-from dataclasses import dataclass, replace
+from copy import copy
+from dataclasses import dataclass, field, replace
 from decimal import Decimal
-from typing import Self, Sequence
+from typing import Dict, List, Mapping, Self, Sequence
 
 from .change import Change
 
@@ -11,43 +12,88 @@ class Account:
     sub_accounts: Sequence[Self]
     balance: Decimal = Decimal("0.0")
     total_balance: Decimal = Decimal("0.0")
+    # Position of each sub account by name, built from the sub accounts when
+    # an account is created and carried, extended with any new sub accounts,
+    # by the copies made as changes are entered
+    sub_account_index: Mapping[str, int] = field(init=False, compare=False, repr=False)
 
-    def __add_sub_account_if_new(self, sub_account_name: str) -> Self:
-        if sub_account_name in (sub_account.name for sub_account in self.sub_accounts):
-            return self
-        return replace(
+    def __post_init__(self):
+        object.__setattr__(
             self,
-            sub_accounts=tuple(self.sub_accounts)
-            + (Account(name=sub_account_name, sub_accounts=()),),
+            "sub_account_index",
+            {
+                sub_account.name: position
+                for position, sub_account in enumerate(self.sub_accounts)
+            },
         )
 
-    def __propagate_change(self, sub_account_name: str, change: Change) -> Self:
-        return replace(
-            self,
-            sub_accounts=tuple(
-                sub_account.__enter_change(change)
-                if sub_account.name == sub_account_name
-                else sub_account
-                for sub_account in self.sub_accounts
-            ),
+    def __enter_changes(self, changes: Sequence[Change], depth: int) -> Self:
+        # Amounts are added in the order of the changes so that the result is
+        # exactly the same as entering the changes one at a time
+        balance = self.balance
+        total_balance = self.total_balance
+        sub_account_changes: Dict[str, List[Change]] = {}
+        for change in changes:
+            total_balance += change.amount
+            if depth == len(change.account_path):
+                balance += change.amount
+            else:
+                sub_account_changes.setdefault(change.account_path[depth], []).append(
+                    change
+                )
+        if not sub_account_changes:
+            return self.__copy(balance, total_balance, self.sub_accounts)
+        # only the changed spines of the tree are copied, the other sub accounts
+        # are shared with the previous version
+        sub_account_index = self.sub_account_index
+        sub_accounts = list(self.sub_accounts)
+        for sub_account_name, sub_changes in sub_account_changes.items():
+            position = sub_account_index.get(sub_account_name)
+            if position is None:
+                position = len(sub_accounts)
+                sub_account_index = {**sub_account_index, sub_account_name: position}
+                sub_accounts.append(type(self)(name=sub_account_name, sub_accounts=()))
+            sub_accounts[position] = sub_accounts[position].__enter_changes(
+                sub_changes, depth + 1
+            )
+        return self.__copy(
+            balance, total_balance, tuple(sub_accounts), sub_account_index
         )
 
-    def __enter_change(self, change: Change) -> Self:
-        account = replace(self, total_balance=self.total_balance + change.amount)
-        if len(change.account_path) == 0:
-            return replace(account, balance=self.balance + change.amount)
-        sub_account_name = change.account_path[0]
-        change = replace(change, account_path=change.account_path[1:])
-        return account.__add_sub_account_if_new(
-            sub_account_name=sub_account_name
-        ).__propagate_change(sub_account_name=sub_account_name, change=change)
+    def __copy(
+        self,
+        balance: Decimal,
+        total_balance: Decimal,
+        sub_accounts: Sequence[Self],
+        sub_account_index: Mapping[str, int] | None = None,
+    ) -> Self:
+        # unlike replace, copying does not run __post_init__, so the index
+        # is not rebuilt for every change that is entered
+        account = copy(self)
+        object.__setattr__(account, "balance", balance)
+        object.__setattr__(account, "total_balance", total_balance)
+        object.__setattr__(account, "sub_accounts", sub_accounts)
+        if sub_account_index is not None:
+            object.__setattr__(account, "sub_account_index", sub_account_index)
+        return account
 
-    def enter_transaction(self, changes: Sequence[Change]) -> Self:
+    def __find(self, account_path: Sequence[str]) -> Self | None:
         account = self
-        for change in changes:
-            account = account.__enter_change(change=change)
+        for sub_account_name in account_path:
+            position = account.sub_account_index.get(sub_account_name)
+            if position is None:
+                return None
+            account = account.sub_accounts[position]
         return account
 
+    def enter_changes(self, changes: Sequence[Change]) -> Self:
+        if not changes:
+            return self
+        return self.__enter_changes(changes, 0)
+
+    def enter_transaction(self, changes: Sequence[Change]) -> Self:
+        return self.enter_changes(changes)
+
     def get_open_changes(self) -> Sequence[Change]:
         change = Change(amount=self.balance, account_path=())
         sub_accounts_and_changes = tuple(
@@ -64,19 +110,11 @@ class Account:
         )
 
     def get_balance(self, account_path: Sequence[str]) -> Decimal:
-        if account_path:
-            for sub_account in self.sub_accounts:
-                if sub_account.name == account_path[0]:
-                    return sub_account.get_balance(account_path[1:])
-            # for unknown accounts, we will return zero
-            return Decimal("0.0")
-        return self.balance
+        account = self.__find(account_path)
+        # for unknown accounts, we will return zero
+        return Decimal("0.0") if account is None else account.balance
 
     def get_total_balance(self, account_path: Sequence[str]) -> Decimal:
-        if account_path:
-            for sub_account in self.sub_accounts:
-                if sub_account.name == account_path[0]:
-                    return sub_account.get_total_balance(account_path[1:])
-            # for unknown accounts, we will return zero
-            return Decimal("0.0")
-        return self.total_balance
+        account = self.__find(account_path)
+        # for unknown accounts, we will return zero
+        return Decimal("0.0") if account is None else account.total_balance
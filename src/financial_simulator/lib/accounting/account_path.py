@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from sys import intern
+from typing import ClassVar, Dict, Iterable, Tuple
+
+# The most account paths that are kept interned, the oldest are forgotten
+# beyond this so that generated account names cannot grow the table forever
+MAX_INTERNED_ACCOUNT_PATHS = 65536
+
+
+class AccountPath(Tuple[str, ...]):
+    # Account paths are interned so that equal paths are the same object and
+    # their hash is only calculated once, no matter how often they are used
+    # to look up balances
+    __interned: ClassVar[Dict[Tuple[str, ...], AccountPath]] = {}
+    __hash: int
+
+    def __new__(cls, names: Iterable[str]) -> AccountPath:
+        key = tuple(names)
+        account_path = cls.__interned.get(key)
+        if account_path is None:
+            account_path = super().__new__(cls, (intern(name) for name in key))
+            account_path.__hash = tuple.__hash__(account_path)
+            if len(cls.__interned) >= MAX_INTERNED_ACCOUNT_PATHS:
+                del cls.__interned[next(iter(cls.__interned))]
+            cls.__interned[key] = account_path
+        return account_path
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __reduce__(self):
+        # string hashes differ between processes so never pickle the hash
+        return AccountPath, (tuple(self),)
@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import Sequence
 
 from .account import Account
+from .journal import Journal
 from .transaction import Transaction
 
 
@@ -16,7 +17,9 @@ class Books:
 
     @classmethod
     def create(cls, initial_transaction: Transaction) -> Books:
-        books = cls(journal=(), ledger=Account(name="ledger", sub_accounts=()))
+        books = cls(
+            journal=Journal.create(), ledger=Account(name="ledger", sub_accounts=())
+        )
         return books.enter_transaction(initial_transaction)
 
     @classmethod
@@ -25,18 +28,34 @@ class Books:
 
     def enter_transaction(self, transaction: Transaction) -> Books:
         return Books(
-            journal=tuple(self.journal) + (transaction,),
+            journal=Journal.of(self.journal).append(transaction),
             ledger=self.ledger.enter_transaction(transaction.changes),
         )
 
+    def enter_transactions(self, transactions: Sequence[Transaction]) -> Books:
+        if not transactions:
+            return self
+        return Books(
+            journal=Journal.of(self.journal).extend(transactions),
+            ledger=self.ledger.enter_changes(
+                tuple(
+                    change
+                    for transaction in transactions
+                    for change in transaction.changes
+                )
+            ),
+        )
+
     def open_journal(self, transaction_date: date) -> Books:
         return replace(
             self,
-            journal=(
-                Transaction.create_open(
-                    transaction_date=transaction_date,
-                    changes=self.ledger.get_open_changes(),
-                ),
+            journal=Journal.create(
+                (
+                    Transaction.create_open(
+                        transaction_date=transaction_date,
+                        changes=self.ledger.get_open_changes(),
+                    ),
+                )
             ),
         )
 
@@ -0,0 +1,13 @@
+from financial_simulator.lib.numeric import NumericBackend, get_numeric_backend
+
+from .books import Books
+from .flat_books import FlatBooks
+from .transaction import Transaction
+
+
+def create_books(initial_transaction: Transaction) -> Books | FlatBooks:
+    # books for the current numeric backend, the float64 backend keeps money
+    # as scaled int64 balances
+    if get_numeric_backend() is NumericBackend.FLOAT64:
+        return FlatBooks.create(initial_transaction)
+    return Books.create(initial_transaction)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .account import Account
+from .account_path import AccountPath
+from .change import Change
+from .journal import Journal
+from .transaction import Transaction
+
+# Amounts are held as integer multiples of 1 / DEFAULT_SCALE
+DEFAULT_SCALE = 10**6
+
+LEDGER_NAME = "ledger"
+
+
+def _key(account_path: Sequence[str]) -> Tuple[str, ...]:
+    # use tuples as they are, so that interned account paths keep their hash
+    return account_path if isinstance(account_path, tuple) else tuple(account_path)
+
+
+@dataclass(frozen=True)
+class FlatLedgerLayout:
+    # Maps every account path to a slot in the balance arrays. Slot 0 is the
+    # ledger itself and an account always has a higher slot than its parent
+    account_paths: Tuple[AccountPath, ...]
+    slots: Mapping[Tuple[str, ...], int]
+    parents: Tuple[int, ...]
+    lineages: Tuple[npt.NDArray[np.intp], ...]
+
+    @classmethod
+    def create(cls) -> FlatLedgerLayout:
+        return cls(
+            account_paths=(AccountPath(()),),
+            slots={(): 0},
+            parents=(-1,),
+            lineages=(np.array([0], dtype=np.intp),),
+        )
+
+    def __len__(self) -> int:
+        return len(self.account_paths)
+
+    def with_account(self, account_path: Sequence[str]) -> Tuple[FlatLedgerLayout, int]:
+        slot = self.slots.get(_key(account_path))
+        if slot is not None:
+            return self, slot
+        layout, parent = self.with_account(account_path[:-1])
+        slot = len(layout)
+        return (
+            FlatLedgerLayout(
+                account_paths=layout.account_paths + (AccountPath(account_path),),
+                slots={**layout.slots, _key(account_path): slot},
+                parents=layout.parents + (parent,),
+                lineages=layout.lineages
+                + (np.append(layout.lineages[parent], slot).astype(np.intp),),
+            ),
+            slot,
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class FlatBooks:
+    # An alternative to Books for large simulations that holds the ledger as
+    # arrays of scaled integer balances indexed by account slot, instead of a
+    # tree of Account objects. It has the same interface as Books
+    journal: Sequence[Transaction]
+    layout: FlatLedgerLayout
+    balances: npt.NDArray[np.int64]
+    total_balances: npt.NDArray[np.int64]
+    scale: int = DEFAULT_SCALE
+
+    @classmethod
+    def create(
+        cls, initial_transaction: Transaction, scale: int = DEFAULT_SCALE
+    ) -> FlatBooks:
+        books = cls(
+            journal=Journal.create(),
+            layout=FlatLedgerLayout.create(),
+            balances=np.zeros(1, dtype=np.int64),
+            total_balances=np.zeros(1, dtype=np.int64),
+            scale=scale,
+        )
+        return books.enter_transaction(initial_transaction)
+
+    @classmethod
+    def create_empty(cls, initial_date: date, scale: int = DEFAULT_SCALE) -> FlatBooks:
+        return cls.create(Transaction.create_empty_open(initial_date), scale=scale)
+
+    def __to_scaled(self, changes: Sequence[Change]) -> Sequence[int]:
+        exact = [change.amount * self.scale for change in changes]
+        scaled = [int(amount.to_integral_value(ROUND_HALF_EVEN)) for amount in exact]
+        # rounding each change separately can leave the transaction out of
+        # balance, so move the difference a unit at a time onto the changes
+        # that were rounded furthest in that direction
+        residual = sum(scaled)
+        while residual:
+            step = 1 if residual > 0 else -1
+            index = max(
+                range(len(scaled)),
+                key=lambda index: (scaled[index] - exact[index]) * step,
+            )
+            scaled[index] -= step
+            residual -= step
+        return scaled
+
+    def __from_scaled(self, amount: np.int64) -> Decimal:
+        return Decimal(int(amount)) / self.scale
+
+    def enter_transaction(self, transaction: Transaction) -> FlatBooks:
+        return self.enter_transactions((transaction,))
+
+    def enter_transactions(self, transactions: Sequence[Transaction]) -> FlatBooks:
+        if not transactions:
+            return self
+        changes = tuple(
+            change for transaction in transactions for change in transaction.changes
+        )
+        layout = self.layout
+        slots: List[int] = []
+        for change in changes:
+            layout, slot = layout.with_account(change.account_path)
+            slots.append(slot)
+        balances = np.zeros(len(layout), dtype=np.int64)
+        balances[: len(self.balances)] = self.balances
+        total_balances = np.zeros(len(layout), dtype=np.int64)
+        total_balances[: len(self.total_balances)] = self.total_balances
+        amounts = (
+            amount
+            for transaction in transactions
+            for amount in self.__to_scaled(transaction.changes)
+        )
+        for slot, amount in zip(slots, amounts):
+            balances[slot] += amount
+            total_balances[layout.lineages[slot]] += amount
+        return FlatBooks(
+            journal=Journal.of(self.journal).extend(transactions),
+            layout=layout,
+            balances=balances,
+            total_balances=total_balances,
+            scale=self.scale,
+        )
+
+    def open_journal(self, transaction_date: date) -> FlatBooks:
+        return FlatBooks(
+            journal=Journal.create(
+                (
+                    Transaction.create_open(
+                        transaction_date=transaction_date,
+                        changes=self.get_open_changes(),
+                    ),
+                )
+            ),
+            layout=self.layout,
+            balances=self.balances,
+            total_balances=self.total_balances,
+            scale=self.scale,
+        )
+
+    @property
+    def ledger(self) -> Account:
+        # Build the equivalent tree of accounts, children always have higher
+        # slots than their parents so we can build it from the leaves up
+        sub_accounts: Dict[int, List[Account]] = {}
+        account = Account(name=LEDGER_NAME, sub_accounts=())
+        for slot in reversed(range(len(self.layout))):
+            account_path = self.layout.account_paths[slot]
+            account = Account(
+                name=account_path[-1] if account_path else LEDGER_NAME,
+                sub_accounts=tuple(reversed(sub_accounts.pop(slot, []))),
+                balance=self.__from_scaled(self.balances[slot]),
+                total_balance=self.__from_scaled(self.total_balances[slot]),
+            )
+            sub_accounts.setdefault(self.layout.parents[slot], []).append(account)
+        return account
+
+    def get_open_changes(self) -> Sequence[Change]:
+        return self.ledger.get_open_changes()
+
+    def get_balance(self, account_path: Sequence[str]) -> Decimal:
+        slot = self.layout.slots.get(_key(account_path))
+        # for unknown accounts, we will return zero
+        if slot is None:
+            return Decimal("0.0")
+        return self.__from_scaled(self.balances[slot])
+
+    def get_total_balance(self, account_path: Sequence[str]) -> Decimal:
+        slot = self.layout.slots.get(_key(account_path))
+        # for unknown accounts, we will return zero
+        if slot is None:
+            return Decimal("0.0")
+        return self.__from_scaled(self.total_balances[slot])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FlatBooks):
+            return NotImplemented
+        return self.journal == other.journal and self.ledger == other.ledger
+
+    def __hash__(self) -> int:
+        return hash(self.journal)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import Sequence as AbstractSequence
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Iterator, List, Sequence, Tuple, overload
+
+from .transaction import Transaction
+
+SEGMENT_SIZE = 64
+
+
+@dataclass(frozen=True, eq=False, repr=False)
+class Journal(Sequence[Transaction]):
+    # A persistent, append only sequence of transactions. Transactions are
+    # held in segments of up to SEGMENT_SIZE and each full segment links back
+    # to the journal before it, so appending only ever copies the last segment
+    # and every earlier version of the journal shares its segments
+    previous: Journal | None
+    segment: Tuple[Transaction, ...]
+    length: int
+
+    @classmethod
+    def create(cls, transactions: Iterable[Transaction] = ()) -> Journal:
+        return cls(previous=None, segment=(), length=0).extend(transactions)
+
+    @classmethod
+    def of(cls, transactions: Sequence[Transaction]) -> Journal:
+        if isinstance(transactions, Journal):
+            return transactions
+        return cls.create(transactions)
+
+    def append(self, transaction: Transaction) -> Journal:
+        if len(self.segment) < SEGMENT_SIZE:
+            return Journal(
+                previous=self.previous,
+                segment=self.segment + (transaction,),
+                length=self.length + 1,
+            )
+        return Journal(previous=self, segment=(transaction,), length=self.length + 1)
+
+    def extend(self, transactions: Iterable[Transaction]) -> Journal:
+        journal = self
+        pending = tuple(transactions)
+        while pending:
+            space = SEGMENT_SIZE - len(journal.segment)
+            if space == 0:
+                journal = Journal(previous=journal, segment=(), length=journal.length)
+                space = SEGMENT_SIZE
+            added, pending = pending[:space], pending[space:]
+            journal = Journal(
+                previous=journal.previous,
+                segment=journal.segment + added,
+                length=journal.length + len(added),
+            )
+        return journal
+
+    def between(
+        self, from_date: date | None = None, until_date: date | None = None
+    ) -> Sequence[Transaction]:
+        # Transactions are entered in date order so we can stop walking back
+        # through the segments as soon as one ends before the range starts
+        segments: List[Tuple[Transaction, ...]] = []
+        journal: Journal | None = self
+        while journal is not None:
+            segment = journal.segment
+            if (
+                from_date is not None
+                and segment
+                and segment[-1].transaction_date < from_date
+            ):
+                break
+            segments.append(segment)
+            journal = journal.previous
+        return tuple(
+            transaction
+            for segment in reversed(segments)
+            for transaction in segment
+            if (from_date is None or transaction.transaction_date >= from_date)
+            and (until_date is None or transaction.transaction_date < until_date)
+        )
+
+    def __segments(self) -> Sequence[Tuple[Transaction, ...]]:
+        segments: List[Tuple[Transaction, ...]] = []
+        journal: Journal | None = self
+        while journal is not None:
+            segments.append(journal.segment)
+            journal = journal.previous
+        segments.reverse()
+        return segments
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return (transaction for segment in self.__segments() for transaction in segment)
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> Transaction: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Transaction]: ...
+
+    def __getitem__(self, index: int | slice) -> Transaction | Sequence[Transaction]:
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Journal index out of range")
+        # every segment before the last is full so we know which one to look in
+        journal = self
+        for _ in range((self.length - 1) // SEGMENT_SIZE - index // SEGMENT_SIZE):
+            journal = journal.previous  # type: ignore
+        return journal.segment[index % SEGMENT_SIZE]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, AbstractSequence) and not isinstance(other, str):
+            return len(self) == len(other) and tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"Journal({tuple(self)!r})"
+
+    def __reduce__(self):
+        return Journal.create, (tuple(self),)
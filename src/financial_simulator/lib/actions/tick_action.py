@@ -7,3 +7,6 @@ from .action import Action
 @dataclass(frozen=True)
 class TickAction(Action):
     current_date: date
+    # the number of days since the previous tick, greater than 1 when the
+    # simulator has skipped days on which no entity had anything to do
+    days: int = 1
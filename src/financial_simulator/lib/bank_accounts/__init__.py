@@ -1,6 +1,15 @@
-from .bank_account import BankAccount, BankFee
+from .bank_account import (
+    BankAccount,
+    BankFee,
+    next_bank_account_activity,
+    precompute_bank_account_rates,
+    tick_bank_accounts,
+)
 
 __all__ = [
     "BankAccount",
     "BankFee",
+    "next_bank_account_activity",
+    "precompute_bank_account_rates",
+    "tick_bank_accounts",
 ]
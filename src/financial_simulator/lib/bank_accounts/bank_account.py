@@ -1,14 +1,14 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Self, Sequence, Tuple
+from typing import Iterable, List, Self, Sequence, Tuple
 
-from financial_simulator.lib.providers import Provider
+from financial_simulator.lib.providers import AlwaysProvider, Provider
 from financial_simulator.lib.rates import Rate
 from financial_simulator.lib.schedules import Schedule
 from financial_simulator.lib.util.immutable import provider_get, schedule_check
 
-from ..accounting import Books, Change, Transaction
+from ..accounting import Books, Change, FlatBooks, Transaction
 
 
 @dataclass
@@ -17,6 +17,22 @@ class BankFee:
     amount: Decimal
 
 
+def _get_balance(
+    books: Books | FlatBooks,
+    transactions: Sequence[Transaction],
+    account_path: Sequence[str],
+) -> Decimal:
+    # The balance of the account including transactions that have not been
+    # entered in the books yet
+    balance = books.get_balance(account_path)
+    account_path = tuple(account_path)
+    for transaction in transactions:
+        for change in transaction.changes:
+            if tuple(change.account_path) == account_path:
+                balance += change.amount
+    return balance
+
+
 @dataclass(frozen=True)
 class BankAccount:
     asset_account: Sequence[str]
@@ -30,70 +46,98 @@ class BankAccount:
     interest_payment_schedule: Schedule | None = None
 
     def __check_apply_interest(
-        self, current_date: date, books: Books
-    ) -> Tuple[Self, Books]:
+        self,
+        current_date: date,
+        books: Books | FlatBooks,
+        transactions: Tuple[Transaction, ...],
+    ) -> Tuple[Self, Tuple[Transaction, ...]]:
         bank_account, scheduled = schedule_check(
             self, "interest_payment_schedule", current_date
         )
         if scheduled:
-            interest_receivable = books.get_balance(
-                bank_account.interest_receivable_account
+            interest_receivable = _get_balance(
+                books, transactions, bank_account.interest_receivable_account
             )
-            return bank_account, books.enter_transaction(
+            return bank_account, transactions + (
                 Transaction(
                     transaction_date=current_date,
                     description="Interest applied",
                     changes=(
                         Change(
-                            amount=interest_receivable,
+                            amount=-interest_receivable,
                             account_path=bank_account.interest_receivable_account,
                         ),
                         Change(
-                            amount=-interest_receivable,
+                            amount=interest_receivable,
                             account_path=bank_account.asset_account,
                         ),
                     ),
-                )
+                ),
             )
-        return bank_account, books
+        return bank_account, transactions
 
-    def __accrue_interest(self, current_date: date, books: Books) -> Tuple[Self, Books]:
+    def __accrue_interest(
+        self,
+        current_date: date,
+        days: int,
+        books: Books | FlatBooks,
+        transactions: Tuple[Transaction, ...],
+    ) -> Tuple[Self, Tuple[Transaction, ...]]:
         bank_account, rates = provider_get(
             self, self.rate_provider, "rate_provider", current_date
         )
         if rates:
-            rate_calculation = rates[0].calculate(
-                current_date,
-                books.get_balance(bank_account.asset_account),
-                books.get_balance(bank_account.interest_receivable_account),
+            # assets are debit balances, so they are negated to give the rate
+            # the amounts held and accrued
+            balance = -_get_balance(books, transactions, bank_account.asset_account)
+            accrued = -_get_balance(
+                books, transactions, bank_account.interest_receivable_account
             )
-            return bank_account, books.enter_transaction(
+            if days > 1 and isinstance(self.rate_provider, AlwaysProvider):
+                # the rate was provided on each of the skipped days as well, the
+                # balance did not change as nothing else was due on them
+                interest = rates[0].calculate_span(
+                    current_date - timedelta(days=days - 1),
+                    current_date,
+                    balance,
+                    accrued,
+                )
+            else:
+                interest = (
+                    rates[0].calculate(current_date, balance, accrued).calculation
+                )
+            return bank_account, transactions + (
                 Transaction(
                     transaction_date=current_date,
                     description="Interest accrued",
                     changes=(
                         Change(
-                            amount=rate_calculation.accrued,
+                            amount=interest,
                             account_path=bank_account.interest_income_account,
                         ),
                         Change(
-                            amount=-rate_calculation.accrued,
+                            amount=-interest,
                             account_path=bank_account.interest_receivable_account,
                         ),
                     ),
-                )
+                ),
             )
-        return bank_account, books
+        return bank_account, transactions
 
     def __check_apply_fees(
-        self, current_date: date, books: Books
-    ) -> Tuple[Self, Books]:
+        self,
+        current_date: date,
+        books: Books | FlatBooks,
+        transactions: Tuple[Transaction, ...],
+    ) -> Tuple[Self, Tuple[Transaction, ...]]:
         bank_account, scheduled = schedule_check(
             self, "fee_payment_schedule", current_date
         )
         if scheduled:
-            fees_payable = books.get_balance(bank_account.fees_payable_account)
-            return bank_account, books.enter_transaction(
+            fees_payable = _get_balance(
+                books, transactions, bank_account.fees_payable_account
+            )
+            return bank_account, transactions + (
                 Transaction(
                     transaction_date=current_date,
                     description="Fees applied",
@@ -106,32 +150,112 @@ class BankAccount:
                             amount=fees_payable, account_path=bank_account.asset_account
                         ),
                     ),
-                )
-            )
-        return bank_account, books
-
-    def __enter_fee(self, current_date: date, fee: BankFee, books: Books) -> Books:
-        return books.enter_transaction(
-            Transaction(
-                transaction_date=current_date,
-                description=fee.description,
-                changes=(
-                    Change(amount=-fee.amount, account_path=self.fee_expenses_account),
-                    Change(amount=fee.amount, account_path=self.fees_payable_account),
                 ),
             )
+        return bank_account, transactions
+
+    def __create_fee_transaction(self, current_date: date, fee: BankFee) -> Transaction:
+        return Transaction(
+            transaction_date=current_date,
+            description=fee.description,
+            changes=(
+                Change(amount=-fee.amount, account_path=self.fee_expenses_account),
+                Change(amount=fee.amount, account_path=self.fees_payable_account),
+            ),
         )
 
-    def __accrue_fees(self, current_date: date, books: Books) -> Tuple[Self, Books]:
+    def __accrue_fees(
+        self, current_date: date, transactions: Tuple[Transaction, ...]
+    ) -> Tuple[Self, Tuple[Transaction, ...]]:
         bank_account, fees = provider_get(
             self, self.fees_provider, "fees_provider", current_date
         )
-        for fee in fees:
-            books = bank_account.__enter_fee(current_date, fee, books)
-        return bank_account, books
-
-    def on_tick(self, current_date: date, books: Books) -> Tuple[Self, Books]:
-        bank_account, books = self.__accrue_interest(current_date, books)
-        bank_account, books = bank_account.__accrue_fees(current_date, books)
-        bank_account, books = bank_account.__check_apply_interest(current_date, books)
-        return bank_account.__check_apply_fees(current_date, books)
+        return bank_account, transactions + tuple(
+            bank_account.__create_fee_transaction(current_date, fee) for fee in fees
+        )
+
+    def next_activity(self, after: date) -> date | None:
+        # The earliest date after the given date on which the account needs to
+        # be ticked, or None if it never will again. A rate that is provided
+        # every day is accrued over the skipped days in closed form, so it
+        # does not need a tick of its own
+        return min(
+            (
+                next_date
+                for next_date in (
+                    None
+                    if self.rate_provider is None
+                    or isinstance(self.rate_provider, AlwaysProvider)
+                    else self.rate_provider.next_emission(after),
+                    None
+                    if self.fees_provider is None
+                    else self.fees_provider.next_emission(after),
+                    None
+                    if self.interest_payment_schedule is None
+                    else self.interest_payment_schedule.next_occurrence(after),
+                    None
+                    if self.fee_payment_schedule is None
+                    else self.fee_payment_schedule.next_occurrence(after),
+                )
+                if next_date is not None
+            ),
+            default=None,
+        )
+
+    def on_tick(
+        self, current_date: date, books: Books | FlatBooks, days: int = 1
+    ) -> Tuple[Self, Books | FlatBooks]:
+        # All of the day's transactions are entered in the books in one batch.
+        # Days is the number of days since the previous tick, the days skipped
+        # in between had nothing due other than accruing interest
+        bank_account, transactions = self.__accrue_interest(
+            current_date, days, books, ()
+        )
+        bank_account, transactions = bank_account.__accrue_fees(
+            current_date, transactions
+        )
+        bank_account, transactions = bank_account.__check_apply_interest(
+            current_date, books, transactions
+        )
+        bank_account, transactions = bank_account.__check_apply_fees(
+            current_date, books, transactions
+        )
+        return bank_account, books.enter_transactions(transactions)
+
+
+def tick_bank_accounts(
+    bank_accounts: Sequence[BankAccount],
+    current_date: date,
+    days: int,
+    books: Books | FlatBooks,
+) -> Tuple[Tuple[BankAccount, ...], Books | FlatBooks]:
+    ticked: List[BankAccount] = []
+    for bank_account in bank_accounts:
+        bank_account, books = bank_account.on_tick(current_date, books, days)
+        ticked.append(bank_account)
+    return tuple(ticked), books
+
+
+def precompute_bank_account_rates(
+    bank_accounts: Sequence[BankAccount], years: Iterable[int]
+):
+    # only fixed rates are known up front, provided rates may change daily
+    years = tuple(years)
+    for bank_account in bank_accounts:
+        if isinstance(bank_account.rate_provider, AlwaysProvider):
+            bank_account.rate_provider.value.precompute_daily_rates(years)
+
+
+def next_bank_account_activity(
+    bank_accounts: Sequence[BankAccount], after: date
+) -> date | None:
+    return min(
+        (
+            next_activity
+            for next_activity in (
+                bank_account.next_activity(after) for bank_account in bank_accounts
+            )
+            if next_activity is not None
+        ),
+        default=None,
+    )
@@ -0,0 +1,14 @@
+from .changes import content_hash, find_changes, first_changed_date, graft_changes
+from .checkpoint import CHECKPOINT_VERSION, Checkpoint, CheckpointError
+from .checkpointer import Checkpointer
+
+__all__ = [
+    "CHECKPOINT_VERSION",
+    "Checkpoint",
+    "CheckpointError",
+    "Checkpointer",
+    "content_hash",
+    "find_changes",
+    "first_changed_date",
+    "graft_changes",
+]
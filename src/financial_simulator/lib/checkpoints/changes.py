@@ -0,0 +1,193 @@
+from dataclasses import fields, is_dataclass, replace
+from datetime import date, timedelta
+from decimal import Decimal
+from hashlib import sha256
+from types import CodeType, FunctionType
+from typing import Any, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from financial_simulator.lib.providers import Provider
+from financial_simulator.lib.schedules import Schedule
+
+GraphPath = Tuple[str | int, ...]
+Leaf = Provider[Any] | Schedule | None
+
+
+def _update_hash(digest: Any, value: Any):
+    digest.update(type(value).__qualname__.encode())
+    if value is None or isinstance(value, (bool, int, float, str, Decimal, date)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, bytes):
+        digest.update(value)
+    elif is_dataclass(value):
+        for value_field in fields(value):
+            if value_field.compare:
+                digest.update(value_field.name.encode())
+                _update_hash(digest, getattr(value, value_field.name))
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _update_hash(digest, key)
+            _update_hash(digest, item)
+    elif isinstance(value, (tuple, list)):
+        digest.update(str(len(value)).encode())
+        for item in value:
+            _update_hash(digest, item)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, CodeType):
+        # nested code objects, such as those of lambdas and comprehensions,
+        # are hashed by content as their repr holds their address
+        digest.update(value.co_code)
+        _update_hash(digest, value.co_names)
+        _update_hash(digest, value.co_consts)
+    elif isinstance(value, FunctionType):
+        # functions are identified by their code, defaults and captured values
+        digest.update(f"{value.__module__}.{value.__qualname__}".encode())
+        _update_hash(digest, value.__code__)
+        _update_hash(digest, value.__defaults__)
+        _update_hash(digest, value.__kwdefaults__)
+        _update_hash(
+            digest, tuple(cell.cell_contents for cell in value.__closure__ or ())
+        )
+    else:
+        digest.update(repr(value).encode())
+
+
+def content_hash(value: Any) -> str:
+    # A hash of the content of an object graph that is stable across
+    # processes, unlike hash() which is salted for strings
+    digest = sha256()
+    _update_hash(digest, value)
+    return digest.hexdigest()
+
+
+def _is_leaf(value: Any) -> bool:
+    return isinstance(value, (Provider, Schedule))
+
+
+def find_changes(
+    old: Any, new: Any, path: GraphPath = ()
+) -> Iterator[Tuple[GraphPath, Any, Any]]:
+    # Yields the paths at which two object graphs differ, descending into
+    # dataclasses and sequences but stopping at providers and schedules
+    if old is new or old == new:
+        return
+    if _is_leaf(old) or _is_leaf(new):
+        yield path, old, new
+    elif is_dataclass(old) and type(old) is type(new):
+        for value_field in fields(old):
+            if value_field.compare:
+                yield from find_changes(
+                    getattr(old, value_field.name),
+                    getattr(new, value_field.name),
+                    path + (value_field.name,),
+                )
+    elif (
+        isinstance(old, (tuple, list))
+        and type(old) is type(new)
+        and len(old) == len(new)
+    ):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from find_changes(old_item, new_item, path + (index,))
+    else:
+        yield path, old, new
+
+
+def step_leaf(leaf: Leaf, current_date: date) -> Tuple[Leaf, Any]:
+    # Steps a provider or schedule by a day, returning its next state and
+    # its output, a completed provider or schedule becomes None
+    if leaf is None:
+        return None, None
+    if isinstance(leaf, Provider):
+        provider_and_provided = leaf.get(current_date)
+        if provider_and_provided is None:
+            return None, None
+        provider, provided = provider_and_provided
+        return provider, tuple(provided)
+    schedule_and_scheduled = leaf.check(current_date)
+    if schedule_and_scheduled is None:
+        return None, None
+    return schedule_and_scheduled
+
+
+def advance_leaf(leaf: Leaf, initial_date: date, until_date: date) -> Leaf:
+    current_date = initial_date
+    while leaf is not None and current_date < until_date:
+        current_date += timedelta(days=1)
+        leaf, _ = step_leaf(leaf, current_date)
+    return leaf
+
+
+def first_changed_date(
+    old: Any, new: Any, initial_date: date, until_date: date
+) -> date | None:
+    # The earliest date after the initial date, up to the until date, on
+    # which two object graphs can behave differently. Providers and schedules
+    # are stepped side by side to find the first day their outputs differ,
+    # any other difference could change the simulation from the first day
+    first_day = initial_date + timedelta(days=1)
+    earliest: date | None = None
+    for _, old_value, new_value in find_changes(old, new):
+        if not (
+            (old_value is None or _is_leaf(old_value))
+            and (new_value is None or _is_leaf(new_value))
+        ):
+            return first_day
+        current_date = initial_date
+        limit_date = until_date if earliest is None else earliest
+        while current_date < limit_date and not (
+            old_value is None and new_value is None
+        ):
+            current_date += timedelta(days=1)
+            old_value, old_output = step_leaf(old_value, current_date)
+            new_value, new_output = step_leaf(new_value, current_date)
+            if old_output != new_output or (old_value is None) != (new_value is None):
+                earliest = current_date
+                break
+    return earliest
+
+
+def get_path(value: Any, path: GraphPath) -> Any:
+    for key in path:
+        value = getattr(value, key) if isinstance(key, str) else value[key]
+    return value
+
+
+def replace_path(value: Any, path: GraphPath, replacement: Any) -> Any:
+    if not path:
+        return replacement
+    key, rest = path[0], path[1:]
+    if isinstance(key, str):
+        return replace(
+            value, **{key: replace_path(getattr(value, key), rest, replacement)}
+        )
+    items = list(value)
+    items[key] = replace_path(items[key], rest, replacement)
+    return type(value)(items)
+
+
+def graft_changes(
+    changes: Sequence[Tuple[GraphPath, Any, Any]],
+    entities: Sequence[Any],
+    initial_date: date,
+    current_date: date,
+) -> Sequence[Any] | None:
+    # Replaces the changed providers and schedules in entities checkpointed
+    # on the current date with the new ones advanced to the same date.
+    # Returns None if the checkpointed values cannot be matched up, for
+    # instance if an entity does not step a provider every day
+    for path, old_value, new_value in changes:
+        try:
+            checkpointed_value = get_path(entities, path)
+        except (AttributeError, IndexError, TypeError):
+            return None
+        if checkpointed_value == advance_leaf(old_value, initial_date, current_date):
+            replacement = advance_leaf(new_value, initial_date, current_date)
+        elif checkpointed_value == old_value:
+            replacement = new_value
+        else:
+            return None
+        entities = replace_path(entities, path, replacement)
+    return entities
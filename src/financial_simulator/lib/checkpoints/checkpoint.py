@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pickle
+import struct
+import zlib
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Sequence
+
+from financial_simulator.lib.entities import Entity
+
+# Checkpoint files start with a fixed size header holding the magic bytes,
+# the format version and the checkpoint date as an ordinal, so that a
+# checkpoint can be identified and dated without decoding the entities
+CHECKPOINT_MAGIC = b"FSCP"
+CHECKPOINT_VERSION = 1
+HEADER = struct.Struct(">4sHI")
+
+
+class CheckpointError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    current_date: date
+    entities: Sequence[Entity]
+
+    def to_bytes(self) -> bytes:
+        return HEADER.pack(
+            CHECKPOINT_MAGIC, CHECKPOINT_VERSION, self.current_date.toordinal()
+        ) + zlib.compress(
+            pickle.dumps(tuple(self.entities), protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    @staticmethod
+    def read_date(data: bytes) -> date:
+        if len(data) < HEADER.size:
+            raise CheckpointError("Checkpoint is truncated")
+        magic, version, ordinal = HEADER.unpack_from(data)
+        if magic != CHECKPOINT_MAGIC:
+            raise CheckpointError("Not a checkpoint")
+        if version != CHECKPOINT_VERSION:
+            raise CheckpointError(f"Unsupported checkpoint version: {version}")
+        return date.fromordinal(ordinal)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> Checkpoint:
+        current_date = Checkpoint.read_date(data)
+        try:
+            entities = pickle.loads(zlib.decompress(data[HEADER.size :]))
+        except Exception as error:
+            # a payload that still decompresses can fail to unpickle in any
+            # number of ways, they are all reported as a corrupt checkpoint
+            raise CheckpointError("Checkpoint is corrupt") from error
+        return Checkpoint(current_date=current_date, entities=entities)
+
+    def write(self, path: Path):
+        # write to a temporary file first so that an interrupted write never
+        # leaves a partial checkpoint behind
+        temporary_path = path.with_name(path.name + ".tmp")
+        temporary_path.write_bytes(self.to_bytes())
+        temporary_path.replace(path)
+
+    @staticmethod
+    def read(path: Path) -> Checkpoint:
+        return Checkpoint.from_bytes(path.read_bytes())
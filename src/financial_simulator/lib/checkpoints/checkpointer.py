@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Sequence
+
+from financial_simulator.lib.entities import Entity
+
+from .checkpoint import Checkpoint
+
+CHECKPOINT_SUFFIX = ".fscp"
+
+
+@dataclass
+class Checkpointer:
+    directory: Path
+    interval_days: int = 30
+    # the number of most recent checkpoints to keep, None to keep them all
+    retention: int | None = 3
+    last_checkpoint_date: date | None = field(default=None, init=False)
+
+    def __post_init__(self):
+        if self.interval_days < 1:
+            raise ValueError("interval_days must be at least 1")
+        if self.retention is not None and self.retention < 1:
+            raise ValueError("retention must be at least 1")
+        self.directory = Path(self.directory)
+
+    def path(self, checkpoint_date: date) -> Path:
+        return (
+            self.directory
+            / f"checkpoint-{checkpoint_date.isoformat()}{CHECKPOINT_SUFFIX}"
+        )
+
+    def paths(self) -> Sequence[Path]:
+        # iso dates sort lexically, so the paths are in date order
+        return sorted(self.directory.glob(f"checkpoint-*{CHECKPOINT_SUFFIX}"))
+
+    def latest(self) -> Checkpoint | None:
+        paths = self.paths()
+        return Checkpoint.read(paths[-1]) if paths else None
+
+    def start(self, current_date: date):
+        # intervals are counted from the date that a simulation starts or
+        # resumes from, a checkpoint of that state would not be new
+        self.last_checkpoint_date = current_date
+
+    def checkpoint(self, current_date: date, entities: Sequence[Entity]) -> bool:
+        if (
+            self.last_checkpoint_date is not None
+            and (current_date - self.last_checkpoint_date).days < self.interval_days
+        ):
+            return False
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # the entities are immutable so the checkpoint can hold them as is
+        Checkpoint(current_date=current_date, entities=entities).write(
+            self.path(current_date)
+        )
+        self.last_checkpoint_date = current_date
+        if self.retention is not None:
+            for path in self.paths()[: -self.retention]:
+                path.unlink()
+        return True
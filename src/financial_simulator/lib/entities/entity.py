@@ -1,21 +1,34 @@
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
-from typing import Self, Sequence, Tuple
+from datetime import date, timedelta
+from typing import Iterable, Self, Sequence, Tuple
 
-from financial_simulator.lib.accounting import Books
+from financial_simulator.lib.accounting import Books, FlatBooks
 from financial_simulator.lib.actions import Action
 
 
 @dataclass(frozen=True)
 class Entity(metaclass=ABCMeta):
     name: str
-    books: Books
+    books: Books | FlatBooks
 
     def dispatch(self, action: Action) -> Tuple[Self, Sequence[Action]]:
         if action.target is None or action.target == self.name:
             return self._on_action(action)
         return self, ()
 
+    def next_tick(self, after: date) -> date | None:
+        # The earliest date after the given date on which this entity needs
+        # to be ticked, or None if it will never need to be ticked again.
+        # Entities that can look ahead should override this so that the
+        # simulator can skip the days in between, by default we need every day
+        return after + timedelta(days=1)
+
+    def precompute_daily_rates(self, years: Iterable[int]):
+        # Entities with fixed rates should override this so that the daily
+        # rates for the simulation horizon are calculated before it starts
+        pass
+
     @abstractmethod
     def _on_action(self, action: Action) -> Tuple[Self, Sequence[Action]]:
         raise NotImplementedError
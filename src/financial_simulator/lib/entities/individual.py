@@ -1,9 +1,15 @@
-from dataclasses import dataclass
-from typing import Self, Sequence, Tuple
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import Iterable, Self, Sequence, Tuple
 
-from financial_simulator.lib.actions import Action
+from financial_simulator.lib.actions import Action, TickAction
 from financial_simulator.lib.amounts import Amount
-from financial_simulator.lib.bank_accounts import BankAccount
+from financial_simulator.lib.bank_accounts import (
+    BankAccount,
+    next_bank_account_activity,
+    precompute_bank_account_rates,
+    tick_bank_accounts,
+)
 from financial_simulator.lib.entities.entity import Entity
 from financial_simulator.lib.investments.investment import Investment
 from financial_simulator.lib.loans import Loan
@@ -19,5 +25,16 @@ class Individual(Entity):
     properties: Sequence[Property]
     loans: Sequence[Loan]
 
+    def next_tick(self, after: date) -> date | None:
+        return next_bank_account_activity(self.bank_accounts, after)
+
+    def precompute_daily_rates(self, years: Iterable[int]):
+        precompute_bank_account_rates(self.bank_accounts, years)
+
     def _on_action(self, action: Action) -> Tuple[Self, Sequence[Action]]:
+        if isinstance(action, TickAction):
+            bank_accounts, books = tick_bank_accounts(
+                self.bank_accounts, action.current_date, action.days, self.books
+            )
+            return replace(self, bank_accounts=bank_accounts, books=books), ()
         return self, ()
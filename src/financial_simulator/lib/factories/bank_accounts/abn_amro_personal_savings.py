@@ -1,31 +1,40 @@
 from calendar import APRIL, JANUARY, JULY, OCTOBER
 from decimal import Decimal
 
+from financial_simulator.lib.accounting import AccountPath
 from financial_simulator.lib.bank_accounts import BankAccount
 from financial_simulator.lib.providers import AlwaysProvider, NeverProvider
 from financial_simulator.lib.rates import ContinuousRate, create_banded_rate
-from financial_simulator.lib.schedules import AllSchedule, NeverSchedule, YearlySchedule
+from financial_simulator.lib.schedules import AnySchedule, NeverSchedule, YearlySchedule
 
 
 def create_abn_amro_personal_savings(name: str):
     return BankAccount(
-        asset_account=("assets", "bank_accounts", name),
-        interest_income_account=("income", "assets", "bank_accounts", "interest", name),
-        interest_receivable_account=("receivable", "bank_accounts", "interest", name),
-        fee_expenses_account=("expenses", "assets", "bank_accounts", "fees", name),
-        fees_payable_account=("payable", "assets", "bank_accounts", "fees", name),
+        asset_account=AccountPath(("assets", "bank_accounts", name)),
+        interest_income_account=AccountPath(
+            ("income", "assets", "bank_accounts", "interest", name)
+        ),
+        interest_receivable_account=AccountPath(
+            ("receivable", "bank_accounts", "interest", name)
+        ),
+        fee_expenses_account=AccountPath(
+            ("expenses", "assets", "bank_accounts", "fees", name)
+        ),
+        fees_payable_account=AccountPath(
+            ("payable", "assets", "bank_accounts", "fees", name)
+        ),
         fees_provider=NeverProvider(),
         fee_payment_schedule=NeverSchedule(),
         rate_provider=AlwaysProvider(
             create_banded_rate(
                 {
-                    Decimal("0.0"): ContinuousRate(Decimal("1.25")),
-                    Decimal("500000.0"): ContinuousRate(Decimal("1.45")),
+                    Decimal("0.0"): ContinuousRate(Decimal("0.0125")),
+                    Decimal("500000.0"): ContinuousRate(Decimal("0.0145")),
                     Decimal("1000000.0"): ContinuousRate(Decimal("0.0")),
                 }
             )
         ),
-        interest_payment_schedule=AllSchedule(
+        interest_payment_schedule=AnySchedule(
             (
                 YearlySchedule(JANUARY, 1),
                 YearlySchedule(APRIL, 1),
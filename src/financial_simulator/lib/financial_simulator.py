@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Iterator, Sequence, Tuple
+from typing import Dict, Iterator, List, Mapping, Self, Sequence, Tuple
 
 from financial_simulator.lib.actions import Action, TickAction
+from financial_simulator.lib.checkpoints import Checkpoint, Checkpointer
 from financial_simulator.lib.entities import Entity
 
 
@@ -10,22 +11,96 @@ from financial_simulator.lib.entities import Entity
 class FinancialSimulator(Iterator[Tuple[date, Sequence[Entity]]]):
     current_date: date
     current_entities: Sequence[Entity]
+    skip_idle_days: bool = False
+    checkpointer: Checkpointer | None = None
+    # the last date to simulate, the simulation stops before going past it
+    final_date: date | None = None
+    # the number of actions dispatched on the current day to only their
+    # target entity and to all entities respectively
+    routed_actions: int = field(default=0, init=False)
+    broadcast_actions: int = field(default=0, init=False)
+    routes: Mapping[str, Tuple[int, ...]] = field(init=False, repr=False)
 
-    def __dispatch(self, action: Action) -> Iterator[Action]:
-        self.current_entities, action_sequences = zip(
-            *(entity.dispatch(action) for entity in self.current_entities)
+    def __post_init__(self):
+        # entities keep their names as they are replaced, so the positions of
+        # the entities that an action can target only need to be found once
+        routes: Dict[str, Tuple[int, ...]] = {}
+        for position, entity in enumerate(self.current_entities):
+            routes[entity.name] = routes.get(entity.name, ()) + (position,)
+        self.routes = routes
+        if self.checkpointer is not None:
+            self.checkpointer.start(self.current_date)
+
+    @classmethod
+    def resume(
+        cls,
+        checkpoint: Checkpoint,
+        skip_idle_days: bool = False,
+        checkpointer: Checkpointer | None = None,
+        final_date: date | None = None,
+    ) -> Self:
+        return cls(
+            current_date=checkpoint.current_date,
+            current_entities=checkpoint.entities,
+            skip_idle_days=skip_idle_days,
+            checkpointer=checkpointer,
+            final_date=final_date,
         )
-        return (
-            action for action_sequence in action_sequences for action in action_sequence
+
+    def __dispatch(self, entities: List[Entity], action: Action) -> Iterator[Action]:
+        if action.target is None:
+            self.broadcast_actions += 1
+            updated_entities, action_sequences = zip(
+                *(entity.dispatch(action) for entity in entities)
+            )
+            entities[:] = updated_entities
+            return (
+                action
+                for action_sequence in action_sequences
+                for action in action_sequence
+            )
+        self.routed_actions += 1
+        # actions for unknown targets are dropped, as every entity would ignore them
+        actions: List[Action] = []
+        for position in self.routes.get(action.target, ()):
+            entities[position], action_sequence = entities[position].dispatch(action)
+            actions.extend(action_sequence)
+        return iter(actions)
+
+    def __next_date(self) -> date:
+        if not self.skip_idle_days:
+            return self.current_date + timedelta(days=1)
+        next_ticks = tuple(
+            next_tick
+            for next_tick in (
+                entity.next_tick(self.current_date) for entity in self.current_entities
+            )
+            if next_tick is not None
         )
+        # if no entity will ever need to be ticked again then the simulation is over
+        if not next_ticks:
+            raise StopIteration
+        return min(next_ticks)
 
     def __next__(self) -> Tuple[date, Sequence[Entity]]:
-        self.current_date = self.current_date + timedelta(days=1)
-        actions = (TickAction(None, self.current_date),)
+        next_date = self.__next_date()
+        if self.final_date is not None and next_date > self.final_date:
+            raise StopIteration
+        days = (next_date - self.current_date).days
+        self.current_date = next_date
+        self.routed_actions = 0
+        self.broadcast_actions = 0
+        entities = list(self.current_entities)
+        actions: Tuple[Action, ...] = (TickAction(None, self.current_date, days),)
         while actions:
             actions = tuple(
                 action
-                for action_iterator in (self.__dispatch(action) for action in actions)
+                for action_iterator in (
+                    self.__dispatch(entities, action) for action in actions
+                )
                 for action in action_iterator
             )
+        self.current_entities = tuple(entities)
+        if self.checkpointer is not None:
+            self.checkpointer.checkpoint(self.current_date, self.current_entities)
         return self.current_date, self.current_entities
@@ -0,0 +1,17 @@
+from .monte_carlo_account import MonteCarloAccount
+from .monte_carlo_simulation import (
+    DEFAULT_PERCENTILES,
+    MonteCarloResult,
+    MonteCarloSimulation,
+)
+from .rate_models import ConstantRateModel, RateModel, VasicekRateModel
+
+__all__ = [
+    "DEFAULT_PERCENTILES",
+    "ConstantRateModel",
+    "MonteCarloAccount",
+    "MonteCarloResult",
+    "MonteCarloSimulation",
+    "RateModel",
+    "VasicekRateModel",
+]
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Sequence
+
+from financial_simulator.lib.bank_accounts import BankFee
+from financial_simulator.lib.providers import Provider
+from financial_simulator.lib.schedules import Schedule
+
+from .rate_models import RateModel
+
+
+@dataclass(frozen=True)
+class MonteCarloAccount:
+    # The Monte Carlo counterpart of a BankAccount, interest accrues daily on
+    # every path at the path's rate and is paid into the balance on the
+    # interest payment schedule, fees accrue from the fees provider and are
+    # paid from the balance on the fee payment schedule. With a period count
+    # interest is simple within each period, like a PeriodicRate, otherwise
+    # accrued interest also earns interest, like a ContinuousRate
+    account_path: Sequence[str]
+    initial_balance: Decimal
+    rate_model: RateModel
+    period_count: int | None = None
+    interest_payment_schedule: Schedule | None = None
+    fees_provider: Provider[BankFee] | None = None
+    fee_payment_schedule: Schedule | None = None
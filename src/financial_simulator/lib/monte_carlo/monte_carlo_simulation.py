@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Mapping, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from pandas import DataFrame
+
+from financial_simulator.lib.util.date import days_in_year
+from financial_simulator.lib.util.immutable import provider_get, schedule_check
+
+from .monte_carlo_account import MonteCarloAccount
+
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+
+
+@dataclass(frozen=True, eq=False)
+class MonteCarloResult:
+    dates: npt.NDArray[np.datetime64]
+    percentiles: Sequence[float]
+    # one array per account path with a row per day and a column per percentile
+    bands: Mapping[Tuple[str, ...], npt.NDArray[np.float64]]
+    final_balances: Mapping[Tuple[str, ...], npt.NDArray[np.float64]]
+
+    def to_data_frame(self, account_path: Sequence[str]) -> DataFrame:
+        bands = self.bands[tuple(account_path)]
+        return DataFrame(
+            {"Date": self.dates}
+            | {
+                f"P{percentile:g}": bands[:, index]
+                for index, percentile in enumerate(self.percentiles)
+            }
+        )
+
+
+@dataclass
+class _AccountState:
+    account: MonteCarloAccount
+    generator: np.random.Generator
+    rates: npt.NDArray[np.float64]
+    balances: npt.NDArray[np.float64]
+    accrued: npt.NDArray[np.float64]
+    fees_payable: float = 0.0
+
+    def __daily_rates(self, year: int) -> npt.NDArray[np.float64]:
+        days = days_in_year(year)
+        if self.account.period_count is None:
+            return np.expm1(np.log1p(self.rates) / days)
+        period_count = self.account.period_count
+        return period_count * np.expm1(np.log1p(self.rates) / period_count) / days
+
+    def tick(self, current_date: date):
+        account = self.account
+        self.rates = account.rate_model.step(
+            self.rates, 1 / days_in_year(current_date.year), self.generator
+        )
+        daily_rates = self.__daily_rates(current_date.year)
+        if account.period_count is None:
+            self.accrued += daily_rates * (self.balances + self.accrued)
+        else:
+            self.accrued += daily_rates * self.balances
+        account, fees = provider_get(
+            account, account.fees_provider, "fees_provider", current_date
+        )
+        self.fees_payable += sum(float(fee.amount) for fee in fees)
+        account, pay_interest = schedule_check(
+            account, "interest_payment_schedule", current_date
+        )
+        if pay_interest:
+            self.balances += self.accrued
+            self.accrued[:] = 0.0
+        account, pay_fees = schedule_check(
+            account, "fee_payment_schedule", current_date
+        )
+        if pay_fees:
+            self.balances -= self.fees_payable
+            self.fees_payable = 0.0
+        self.account = account
+
+
+@dataclass(frozen=True)
+class MonteCarloSimulation:
+    # Evolves all of the paths for every account together, one day at a
+    # time. Schedules and providers are deterministic so they are evaluated
+    # once per day and applied to all paths as array operations
+    initial_date: date
+    number_of_days: int
+    accounts: Sequence[MonteCarloAccount]
+    paths: int = 10000
+    seed: int | None = None
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES
+
+    def run(self) -> MonteCarloResult:
+        # every account draws from its own stream so that adding an account
+        # does not change the paths of the others
+        seed_sequences = np.random.SeedSequence(self.seed).spawn(len(self.accounts))
+        states = tuple(
+            _AccountState(
+                account=account,
+                generator=np.random.default_rng(seed_sequence),
+                rates=account.rate_model.initial(self.paths),
+                balances=np.full(
+                    self.paths, float(account.initial_balance), dtype=np.float64
+                ),
+                accrued=np.zeros(self.paths, dtype=np.float64),
+            )
+            for account, seed_sequence in zip(self.accounts, seed_sequences)
+        )
+        bands = tuple(
+            np.empty((self.number_of_days, len(self.percentiles)), dtype=np.float64)
+            for _ in states
+        )
+        current_date = self.initial_date
+        for day in range(self.number_of_days):
+            current_date += timedelta(days=1)
+            for state, account_bands in zip(states, bands):
+                state.tick(current_date)
+                account_bands[day] = np.percentile(state.balances, self.percentiles)
+        account_paths = tuple(tuple(account.account_path) for account in self.accounts)
+        return MonteCarloResult(
+            dates=np.arange(
+                np.datetime64(self.initial_date + timedelta(days=1), "D"),
+                np.datetime64(current_date + timedelta(days=1), "D"),
+            ),
+            percentiles=tuple(self.percentiles),
+            bands=dict(zip(account_paths, bands)),
+            final_balances={
+                account_path: state.balances
+                for account_path, state in zip(account_paths, states)
+            },
+        )
@@ -0,0 +1,70 @@
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(frozen=True)
+class RateModel(metaclass=ABCMeta):
+    # A stochastic model of an annual rate, evolved for all paths at once
+
+    @abstractmethod
+    def initial(self, paths: int) -> npt.NDArray[np.float64]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def step(
+        self,
+        rates: npt.NDArray[np.float64],
+        dt: float,
+        generator: np.random.Generator,
+    ) -> npt.NDArray[np.float64]:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class ConstantRateModel(RateModel):
+    annual_rate: float
+
+    def initial(self, paths: int) -> npt.NDArray[np.float64]:
+        return np.full(paths, self.annual_rate, dtype=np.float64)
+
+    def step(
+        self,
+        rates: npt.NDArray[np.float64],
+        dt: float,
+        generator: np.random.Generator,
+    ) -> npt.NDArray[np.float64]:
+        return rates
+
+
+@dataclass(frozen=True)
+class VasicekRateModel(RateModel):
+    # dr = reversion * (mean - r) * dt + volatility * dW, stepped with the
+    # exact discretisation so that the step size does not bias the paths
+    initial_rate: float
+    mean: float
+    reversion: float
+    volatility: float
+
+    def initial(self, paths: int) -> npt.NDArray[np.float64]:
+        return np.full(paths, self.initial_rate, dtype=np.float64)
+
+    def step(
+        self,
+        rates: npt.NDArray[np.float64],
+        dt: float,
+        generator: np.random.Generator,
+    ) -> npt.NDArray[np.float64]:
+        if self.reversion == 0:
+            decay = 1.0
+            deviation = self.volatility * np.sqrt(dt)
+        else:
+            decay = np.exp(-self.reversion * dt)
+            deviation = self.volatility * np.sqrt((1 - decay**2) / (2 * self.reversion))
+        return (
+            self.mean
+            + (rates - self.mean) * decay
+            + deviation * generator.standard_normal(len(rates))
+        )
@@ -0,0 +1,18 @@
+from .backend import (
+    NumericBackend,
+    get_divergence_monitor,
+    get_numeric_backend,
+    numeric_backend,
+    set_numeric_backend,
+)
+from .divergence import DivergenceMonitor, DivergenceReport
+
+__all__ = [
+    "DivergenceMonitor",
+    "DivergenceReport",
+    "NumericBackend",
+    "get_divergence_monitor",
+    "get_numeric_backend",
+    "numeric_backend",
+    "set_numeric_backend",
+]
@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Iterator
+
+from .divergence import DivergenceMonitor
+
+
+class NumericBackend(Enum):
+    # DECIMAL keeps every amount exact. FLOAT64 calculates rates and bands
+    # in float64 and keeps money in books as scaled int64
+    DECIMAL = "decimal"
+    FLOAT64 = "float64"
+
+
+_backend: ContextVar[NumericBackend] = ContextVar(
+    "numeric_backend", default=NumericBackend.DECIMAL
+)
+_divergence_monitor: ContextVar[DivergenceMonitor | None] = ContextVar(
+    "divergence_monitor", default=None
+)
+
+
+def get_numeric_backend() -> NumericBackend:
+    return _backend.get()
+
+
+def get_divergence_monitor() -> DivergenceMonitor | None:
+    return _divergence_monitor.get()
+
+
+def set_numeric_backend(
+    backend: NumericBackend, divergence_monitor: DivergenceMonitor | None = None
+):
+    _backend.set(backend)
+    _divergence_monitor.set(divergence_monitor)
+
+
+@contextmanager
+def numeric_backend(
+    backend: NumericBackend, divergence_monitor: DivergenceMonitor | None = None
+) -> Iterator[NumericBackend]:
+    backend_token = _backend.set(backend)
+    monitor_token = _divergence_monitor.set(divergence_monitor)
+    try:
+        yield backend
+    finally:
+        _divergence_monitor.reset(monitor_token)
+        _backend.reset(backend_token)
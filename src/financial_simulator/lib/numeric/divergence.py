@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from threading import Lock
+from typing import Any
+
+
+@dataclass(frozen=True)
+class DivergenceReport:
+    samples: int
+    max_divergence: Decimal
+    max_relative_divergence: Decimal
+    worst_date: date | None
+    worst_source: Any
+
+
+@dataclass(eq=False)
+class DivergenceMonitor:
+    # Compares fast results with an exact Decimal reference on sampled days,
+    # every sample_every_days days counted from the first day of the calendar
+    sample_every_days: int = 30
+    samples: int = field(default=0, init=False)
+    max_divergence: Decimal = field(default=Decimal("0.0"), init=False)
+    max_relative_divergence: Decimal = field(default=Decimal("0.0"), init=False)
+    worst_date: date | None = field(default=None, init=False)
+    worst_source: Any = field(default=None, init=False)
+    lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.sample_every_days < 1:
+            raise ValueError("sample_every_days must be at least 1")
+
+    def is_sampled(self, current_date: date) -> bool:
+        return current_date.toordinal() % self.sample_every_days == 0
+
+    def record(self, current_date: date, source: Any, fast: Decimal, exact: Decimal):
+        divergence = abs(fast - exact)
+        relative_divergence = divergence / abs(exact) if exact else divergence
+        with self.lock:
+            self.samples += 1
+            if divergence > self.max_divergence:
+                self.max_divergence = divergence
+                self.worst_date = current_date
+                self.worst_source = source
+            self.max_relative_divergence = max(
+                self.max_relative_divergence, relative_divergence
+            )
+
+    def report(self) -> DivergenceReport:
+        with self.lock:
+            return DivergenceReport(
+                samples=self.samples,
+                max_divergence=self.max_divergence,
+                max_relative_divergence=self.max_relative_divergence,
+                worst_date=self.worst_date,
+                worst_source=self.worst_source,
+            )
@@ -9,6 +9,7 @@ from .never_provider import NeverProvider
 from .next_provider import NextProvider
 from .provider import Provider
 from .scheduled_provider import ScheduledProvider
+from .sequence_provider import SequenceProvider
 
 __all__ = [
     "Provider",
@@ -22,4 +23,5 @@ __all__ = [
     "NeverProvider",
     "NextProvider",
     "ScheduledProvider",
+    "SequenceProvider",
 ]
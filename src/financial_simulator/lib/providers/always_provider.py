@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from typing import Self, Sequence, Tuple, TypeVar
 
 from .provider import Provider
@@ -13,3 +13,6 @@ class AlwaysProvider(Provider[T]):
 
     def get(self, current_date: date) -> Tuple[Self, Sequence[T]] | None:
         return self, (self.value,)
+
+    def next_emission(self, after: date) -> date | None:
+        return after + timedelta(days=1)
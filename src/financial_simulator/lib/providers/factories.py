@@ -1,19 +1,15 @@
 from datetime import date
 from typing import Mapping, TypeVar
 
-from financial_simulator.lib.schedules import DaySchedule
-
-from .merge_provider import MergeProvider
 from .provider import Provider
-from .scheduled_provider import ScheduledProvider
+from .sequence_provider import SequenceProvider
 
 T = TypeVar("T")
 
 
 def create_sequence_provider(days: Mapping[date, T]) -> Provider[T]:
-    return MergeProvider(
-        providers=tuple(
-            ScheduledProvider(schedule=DaySchedule(day), value=value)
-            for day, value in days.items()
-        )
+    sorted_days = sorted(days.items())
+    return SequenceProvider(
+        days=tuple(day for day, _ in sorted_days),
+        values=tuple(value for _, value in sorted_days),
     )
@@ -23,3 +23,6 @@ class FlatMapProvider(Generic[T, U], Provider[T]):
             for t_sequence in (self.transform(u_value) for u_value in u_sequence)
             for t_value in t_sequence
         )
+
+    def next_emission(self, after: date) -> date | None:
+        return self.provider.next_emission(after)
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from typing import Callable, Self, Sequence, Tuple, TypeVar
 
-from .provider import Provider
+from .provider import LOOK_AHEAD_DAYS, Provider
 
 T = TypeVar("T")
 
@@ -16,3 +16,15 @@ class FunctionProvider(Provider[T]):
         if result is None:
             return None
         return self, result
+
+    def next_emission(self, after: date) -> date | None:
+        # We know nothing about the function so we have to try each day in
+        # turn, up to the end of the look ahead window
+        for days in range(1, LOOK_AHEAD_DAYS + 1):
+            current_date = after + timedelta(days=days)
+            result = self.function(current_date)
+            if result is None:
+                return None
+            if result:
+                return current_date
+        return after + timedelta(days=LOOK_AHEAD_DAYS + 1)
@@ -21,3 +21,6 @@ class MapProvider(Generic[T, U], Provider[T]):
         return replace(self, provider=provider), tuple(
             self.transform(value) for value in sequence
         )
+
+    def next_emission(self, after: date) -> date | None:
+        return self.provider.next_emission(after)
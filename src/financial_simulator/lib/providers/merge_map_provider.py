@@ -1,8 +1,10 @@
 from dataclasses import dataclass, replace
 from datetime import date
-from typing import Callable, Generic, Self, Sequence, Tuple, TypeVar
+from heapq import heappop, heappush
+from operator import itemgetter
+from typing import Callable, Generic, List, Self, Sequence, Tuple, TypeVar
 
-from .provider import Provider
+from .provider import Provider, earliest_emission
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -12,10 +14,27 @@ U = TypeVar("U")
 class MergeMapProvider(Generic[T, U], Provider[T]):
     transform: Callable[[date, U], Provider[T]]
     provider: Provider[U] | None
+    # sub providers that have not been polled yet, they are polled on the
+    # next call and then queued
     sub_providers: Sequence[Provider[T]] = ()
+    # a heap of (next emission, sub provider number, sub provider) so that
+    # only the sub providers that are due are polled, sub providers that will
+    # never provide values again are dropped rather than queued
+    queue: Tuple[Tuple[date, int, Provider[T]], ...] = ()
+    # the number of sub providers that have been queued so far, also used to
+    # number them so that they are polled in the order they were created
+    queued_sub_providers: int = 0
+
+    @property
+    def live_sub_providers(self) -> int:
+        return len(self.sub_providers) + len(self.queue)
+
+    @property
+    def total_sub_providers(self) -> int:
+        return len(self.sub_providers) + self.queued_sub_providers
 
     def get(self, current_date: date) -> Tuple[Self, Sequence[T]] | None:
-        sub_providers = tuple(self.sub_providers)
+        sub_providers = list(self.sub_providers)
         provider = self.provider
         # Get new sub providers if our provider has not completed
         if provider is not None:
@@ -26,24 +45,66 @@ class MergeMapProvider(Generic[T, U], Provider[T]):
             else:
                 provider, sequence = provided
                 # for each U, transform to a new Provider
-                new_sub_providers = (
+                sub_providers.extend(
                     self.transform(current_date, value) for value in sequence
                 )
-                # create a new sequence of sub providers
-                sub_providers = sub_providers + tuple(new_sub_providers)
-        # get the values from all the sub providers that have not completed
-        sub_provided = tuple(
-            sub_provided
-            for sub_provided in (
-                sub_provider.get(current_date) for sub_provider in sub_providers
+        queue = self.queue
+        queued_sub_providers = self.queued_sub_providers
+        values: List[T] = []
+        if sub_providers or (queue and queue[0][0] <= current_date):
+            heap = list(queue)
+            due: List[Tuple[date, int, Provider[T]]] = []
+            while heap and heap[0][0] <= current_date:
+                due.append(heappop(heap))
+            due.sort(key=itemgetter(1))
+            due.extend(
+                (current_date, queued_sub_providers + number, sub_provider)
+                for number, sub_provider in enumerate(sub_providers)
             )
-            if sub_provided is not None
-        )
+            queued_sub_providers += len(sub_providers)
+            # get the values from the due sub providers and queue them again
+            # until their next emission unless they have completed
+            for _, number, sub_provider in due:
+                sub_provided = sub_provider.get(current_date)
+                if sub_provided is None:
+                    continue
+                queued_provider, values_sequence = sub_provided
+                values.extend(values_sequence)
+                next_emission = queued_provider.next_emission(current_date)
+                if next_emission is not None:
+                    heappush(heap, (next_emission, number, queued_provider))
+            queue = tuple(heap)
         # if the provider and sub providers have all completed, then we have completed
-        if provider is None and not sub_provided:
+        if provider is None and not queue and not values:
             return None
-        sub_providers, sequences = zip(*sub_provided) if sub_provided else ((), ())
         return (
-            replace(self, provider=provider, sub_providers=sub_providers),
-            tuple(value for sequence in sequences for value in sequence),
+            replace(
+                self,
+                provider=provider,
+                sub_providers=(),
+                queue=queue,
+                queued_sub_providers=queued_sub_providers,
+            ),
+            tuple(values),
+        )
+
+    def next_emission(self, after: date) -> date | None:
+        # new sub providers are created when our provider provides values and
+        # may provide values themselves on the same day
+        providers: Tuple[Provider, ...] = tuple(self.sub_providers)
+        if self.provider is not None:
+            providers = (self.provider,) + providers
+        if self.queue and self.queue[0][0] > after:
+            # none of the queued sub providers can provide values before the
+            # earliest of their next emissions
+            next_emission = earliest_emission(providers, after)
+            queued_emission = self.queue[0][0]
+            return (
+                queued_emission
+                if next_emission is None
+                else min(next_emission, queued_emission)
+            )
+        return earliest_emission(
+            providers + tuple(sub_provider for _, _, sub_provider in self.queue),
+            after,
         )
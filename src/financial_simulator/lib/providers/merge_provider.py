@@ -2,7 +2,7 @@ from dataclasses import dataclass, replace
 from datetime import date
 from typing import Self, Sequence, Tuple, TypeVar
 
-from .provider import Provider
+from .provider import Provider, earliest_emission
 
 T = TypeVar("T")
 
@@ -24,3 +24,6 @@ class MergeProvider(Provider[T]):
             replace(self, providers=providers),
             tuple(value for sequence in sequences for value in sequence),
         )
+
+    def next_emission(self, after: date) -> date | None:
+        return earliest_emission(self.providers, after)
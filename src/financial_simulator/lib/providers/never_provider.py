@@ -11,3 +11,6 @@ T = TypeVar("T")
 class NeverProvider(Provider[T]):
     def get(self, current_date: date) -> Tuple[Self, Sequence[T]] | None:
         return None
+
+    def next_emission(self, after: date) -> date | None:
+        return None
@@ -1,13 +1,40 @@
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 from datetime import date
-from typing import Generic, Self, Sequence, Tuple, TypeVar
+from typing import Generic, Iterable, Self, Sequence, Tuple, TypeVar
 
 T = TypeVar("T")
 
+# How far providers that cannot calculate their next emission directly
+# will probe. They are asked again on every skipped tick, so the window is
+# kept short and its end is returned as a conservative wake-up date
+LOOK_AHEAD_DAYS = 31
+
 
 @dataclass(frozen=True)
 class Provider(Generic[T], metaclass=ABCMeta):
     @abstractmethod
     def get(self, current_date: date) -> Tuple[Self, Sequence[T]] | None:
         raise NotImplementedError
+
+    @abstractmethod
+    def next_emission(self, after: date) -> date | None:
+        # Returns the earliest date after the given date on which the provider
+        # may provide values, or None if it will never provide values again.
+        # Providers that have to search for it return the first date beyond
+        # the search limit if nothing is found, so there is never an emission
+        # before the returned date
+        raise NotImplementedError
+
+
+def earliest_emission(providers: Iterable[Provider], after: date) -> date | None:
+    return min(
+        (
+            next_emission
+            for next_emission in (
+                provider.next_emission(after) for provider in providers
+            )
+            if next_emission is not None
+        ),
+        default=None,
+    )
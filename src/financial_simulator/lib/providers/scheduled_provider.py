@@ -21,3 +21,6 @@ class ScheduledProvider(Provider[T]):
         schedule, scheduled = schedule_and_scheduled
         values = (self.value,) if scheduled else ()
         return replace(self, schedule=schedule), values
+
+    def next_emission(self, after: date) -> date | None:
+        return self.schedule.next_occurrence(after)
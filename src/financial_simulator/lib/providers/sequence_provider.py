@@ -0,0 +1,35 @@
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import Self, Sequence, Tuple, TypeVar
+
+from .provider import Provider
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SequenceProvider(Provider[T]):
+    # days are sorted and unique, index is a cursor on the next day that has
+    # not been provided so that the days and values are shared between states
+    days: Sequence[date]
+    values: Sequence[T]
+    index: int = 0
+
+    def get(self, current_date: date) -> Tuple[Self, Sequence[T]] | None:
+        index = self.index
+        if index < len(self.days) and self.days[index] < current_date:
+            # days that were skipped are dropped, as if we had seeked past them
+            index = bisect_left(self.days, current_date, index)
+        if index == len(self.days):
+            return None
+        if self.days[index] == current_date:
+            return replace(self, index=index + 1), (self.values[index],)
+        return (self if index == self.index else replace(self, index=index)), ()
+
+    def seek(self, current_date: date) -> Self:
+        return replace(self, index=bisect_left(self.days, current_date, self.index))
+
+    def next_emission(self, after: date) -> date | None:
+        index = bisect_right(self.days, after, self.index)
+        return self.days[index] if index < len(self.days) else None
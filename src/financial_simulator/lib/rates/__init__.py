@@ -7,11 +7,20 @@ from financial_simulator.lib.rates.continuous_rate import (
     ContinuousRate,
     ContinuousRateCalculation,
 )
+from financial_simulator.lib.rates.daily_rate_table import (
+    DAILY_RATE_TABLE,
+    DailyRateTable,
+)
 from financial_simulator.lib.rates.periodic_rate import (
     PeriodicRate,
     PeriodicRateCalculation,
 )
 from financial_simulator.lib.rates.rate import Rate, RateCalculation
+from financial_simulator.lib.rates.rate_cache import (
+    DEFAULT_RATE_CACHE_SIZE,
+    RateCache,
+    RateCacheStatistics,
+)
 
 __all__ = [
     "BandedRate",
@@ -19,8 +28,13 @@ __all__ = [
     "create_banded_rate",
     "ContinuousRate",
     "ContinuousRateCalculation",
+    "DAILY_RATE_TABLE",
+    "DailyRateTable",
     "PeriodicRate",
     "PeriodicRateCalculation",
+    "DEFAULT_RATE_CACHE_SIZE",
     "Rate",
+    "RateCache",
+    "RateCacheStatistics",
     "RateCalculation",
 ]
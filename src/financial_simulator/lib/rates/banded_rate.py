@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
-from functools import cache
-from typing import Mapping, Sequence, Tuple
+from typing import ClassVar, Iterable, Mapping, Sequence, Tuple
 
-from prettytable import PrettyTable, TableStyle
+import numpy as np
+import numpy.typing as npt
 
-from financial_simulator.lib.util.bands import Band, create_bands
-from financial_simulator.lib.util.format import format_day
+from financial_simulator.lib.reports import render_banded_rate, render_rate_calculation
+from financial_simulator.lib.util.bands import Band, BandTable, create_bands
+from financial_simulator.lib.util.date import year_spans
 
 from .rate import Rate, RateCalculation
+from .rate_cache import RateCache
+
+NOTHING = Decimal("0.0")
 
 
 @dataclass(frozen=True)
@@ -19,60 +23,41 @@ class BandedRateCalculation(RateCalculation):
     rate: BandedRate
     calculations: Sequence[RateCalculation]
 
-    @cache
-    def __str__(self) -> str:  # type: ignore
-        table = PrettyTable(["Band", "Rate", "Balance", "Accrued", "Calculation"])
-        table.set_style(TableStyle.SINGLE_BORDER)
-        table.add_rows(
-            [
-                [
-                    str(band),
-                    str(rate),
-                    f"{calculation.balance:.6f}",
-                    f"{calculation.accrued:.6f}",
-                    f"{calculation.calculation:.6f}",
-                ]
-                for (band, rate), calculation in zip(self.rate.bands, self.calculations)
-            ]
-        )
-        table.add_divider()
-        table.add_row(
-            [
-                format_day(self.current_date),
-                "Totals",
-                f"{self.balance:.6f}",
-                f"{self.accrued:.6f}",
-                f"{self.calculation:.6f}",
-            ]
-        )
-        table.align["Band"] = "l"
-        table.align["Rate"] = "r"
-        table.align["Balance"] = "r"
-        table.align["Accrued"] = "r"
-        table.align["Calculation"] = "r"
-        return table.get_string()  # type: ignore
+    def __str__(self) -> str:
+        return render_rate_calculation(self)
 
 
 @dataclass(frozen=True)
 class BandedRate(Rate):
     bands: Sequence[Tuple[Band, Rate]] = ()
+    table: BandTable = field(init=False, compare=False, repr=False)
+    calculation_cache: ClassVar[RateCache] = RateCache()
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "table", BandTable.create(tuple(band for band, _ in self.bands))
+        )
 
-    @cache
-    def __str__(self) -> str:  # type: ignore
-        table = PrettyTable(["Band", "Rate"])
-        table.set_style(TableStyle.SINGLE_BORDER)
-        table.add_rows([[str(band), str(rate)] for band, rate in self.bands])
-        table.align["Band"] = "l"
-        table.align["Rate"] = "r"
-        return table.get_string()  # type: ignore
-
-    @cache
-    def calculate(  # type: ignore
+    def __str__(self) -> str:
+        return render_banded_rate(self)
+
+    def precompute_daily_rates(self, years: Iterable[int]):
+        years = tuple(years)
+        for _, rate in self.bands:
+            rate.precompute_daily_rates(years)
+
+    def _calculate(
         self, current_date: date, balance: Decimal, accrued: Decimal
     ) -> BandedRateCalculation:
+        # only the bands that the total reaches into are portioned, the bands
+        # above get a calculation of nothing so that every band is reported
+        portions = self.table.portions(balance, accrued)
         calculations = tuple(
-            rate.calculate(current_date, *(band.portion([balance, accrued])))
-            for band, rate in self.bands
+            rate.calculate(current_date, band_balance, band_accrued)
+            for (_, rate), (band_balance, band_accrued) in zip(self.bands, portions)
+        ) + tuple(
+            rate.calculate(current_date, NOTHING, NOTHING)
+            for _, rate in self.bands[len(portions) :]
         )
         return BandedRateCalculation(
             rate=self,
@@ -85,6 +70,115 @@ class BandedRate(Rate):
             calculations=calculations,
         )
 
+    def _calculate_float(
+        self, current_date: date, balance: Decimal, accrued: Decimal
+    ) -> float:
+        return sum(
+            (
+                rate._calculate_float(current_date, band_balance, band_accrued)
+                for (_, rate), (band_balance, band_accrued) in zip(
+                    self.bands, self.table.portions(balance, accrued)
+                )
+            ),
+            0.0,
+        )
+
+    def _calculate_array(
+        self,
+        current_date: date,
+        balances: npt.NDArray[np.float64],
+        accrued: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        calculations = np.zeros(balances.shape, dtype=np.float64)
+        for band, rate in self.bands:
+            calculations += rate._calculate_array(
+                current_date, *band.portion_arrays(balances, accrued)
+            )
+        return calculations
+
+    def calculate_span(
+        self, start: date, end: date, balance: Decimal, accrued: Decimal
+    ) -> Decimal:
+        # While the amount stays in the same top band the daily calculation
+        # is affine in the accrued amount, so each run of days in a band is
+        # accrued in closed form, split where the amount moves into the next
+        # band. Negative amounts or rates can move down through the bands
+        # and other rates cannot be composed, so those are calculated by day
+        spans = tuple(
+            (
+                days,
+                tuple(rate.daily_coefficients(year) for _, rate in self.bands),
+            )
+            for year, days in year_spans(start, end)
+        )
+        if (
+            balance < 0
+            or accrued < 0
+            or any(
+                coefficients is None or min(coefficients) < 0
+                for _, band_coefficients in spans
+                for coefficients in band_coefficients
+            )
+        ):
+            return super().calculate_span(start, end, balance, accrued)
+        total = Decimal("0.0")
+        for days, band_coefficients in spans:
+            while days > 0:
+                current_accrued = accrued + total
+                amount = balance + current_accrued
+                calculation = Decimal("0.0")
+                top_band: Band | None = None
+                top_compound = Decimal("0.0")
+                for (band, _), coefficients, (band_balance, band_accrued) in zip(
+                    self.bands,
+                    band_coefficients,
+                    self.table.portions(balance, current_accrued),
+                ):
+                    assert coefficients is not None
+                    compound, simple = coefficients
+                    calculation += (
+                        compound * (band_balance + band_accrued) + simple * band_balance
+                    )
+                    top_band, top_compound = band, compound
+                if top_band is None or calculation == 0:
+                    break
+                band_days = (
+                    days
+                    if top_band.size is None
+                    else _days_in_band(
+                        calculation,
+                        top_compound,
+                        top_band.lower + top_band.size - amount,
+                        days,
+                    )
+                )
+                total += _affine_accrual(calculation, top_compound, band_days)
+                days -= band_days
+        return total
+
+
+def _affine_accrual(calculation: Decimal, compound: Decimal, days: int) -> Decimal:
+    # The total accrued over the given days when the first day's calculation
+    # grows by compound times everything accrued since
+    if compound == 0:
+        return calculation * days
+    return calculation * ((1 + compound) ** days - 1) / compound
+
+
+def _days_in_band(
+    calculation: Decimal, compound: Decimal, headroom: Decimal, days: int
+) -> int:
+    # The number of days, up to the given days, that start with the amount
+    # still within the headroom of the band, found by binary search
+    low, high = 1, days
+    while low < high:
+        middle = (low + high + 1) // 2
+        if _affine_accrual(calculation, compound, middle - 1) <= headroom:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
 
 def create_banded_rate(raw_bands: Mapping[Decimal, Rate]) -> BandedRate:
     return BandedRate(create_bands(raw_bands))
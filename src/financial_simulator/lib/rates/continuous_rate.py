@@ -3,14 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from functools import cache
+from typing import ClassVar, Tuple
 
-from prettytable import PrettyTable, TableStyle
-
-from financial_simulator.lib.util.date import days_in_year
-from financial_simulator.lib.util.format import format_day
+from financial_simulator.lib.reports import render_rate_calculation
+from financial_simulator.lib.util.date import days_in_year, year_spans
 
+from .daily_rate_table import DAILY_RATE_TABLE
 from .rate import Rate, RateCalculation
+from .rate_cache import RateCache
 
 
 @dataclass(frozen=True)
@@ -18,36 +18,28 @@ class ContinuousRateCalculation(RateCalculation):
     rate: ContinuousRate
     daily_rate: Decimal
 
-    @cache
-    def __str__(self) -> str:  # type: ignore
-        table = PrettyTable(["label", "value"])
-        table.add_row(["Current date", format_day(self.current_date)])
-        table.add_row(["Rate", str(self.rate)])
-        table.add_row(["Daily rate", f"{self.daily_rate * 100:.6f}"])
-        table.add_row(["Balance", f"{self.balance:.6f}"])
-        table.add_row(["Accrued", f"{self.accrued:.6f}"])
-        table.add_row(["Calculation", f"{self.calculation:.6f}"])
-        table.set_style(TableStyle.SINGLE_BORDER)
-        table.align["label"] = "l"
-        table.align["value"] = "r"
-        table.header = False
-        return table.get_string()  # type: ignore
+    def __str__(self) -> str:
+        return render_rate_calculation(self)
 
 
 @dataclass(frozen=True)
 class ContinuousRate(Rate):
     annual_rate: Decimal
+    calculation_cache: ClassVar[RateCache] = RateCache()
 
-    @cache
-    def __str__(self) -> str:  # type: ignore
+    def __str__(self) -> str:
         return f"ContinuousRate: {self.annual_rate * 100:.2f}%"
 
-    @cache
     def __daily_rate(self, year: int) -> Decimal:
-        return ((1 + self.annual_rate) ** (1 / Decimal(days_in_year(year)))) - 1
+        return DAILY_RATE_TABLE.get(
+            "ContinuousRate",
+            self.annual_rate,
+            None,
+            year,
+            lambda: ((1 + self.annual_rate) ** (1 / Decimal(days_in_year(year)))) - 1,
+        )
 
-    @cache
-    def calculate(  # type: ignore
+    def _calculate(
         self, current_date: date, balance: Decimal, accrued: Decimal
     ) -> ContinuousRateCalculation:
         daily_rate = self.__daily_rate(current_date.year)
@@ -59,3 +51,16 @@ class ContinuousRate(Rate):
             accrued=accrued,
             calculation=daily_rate * (balance + accrued),
         )
+
+    def daily_coefficients(self, year: int) -> Tuple[Decimal, Decimal] | None:
+        return (self.__daily_rate(year), Decimal("0.0"))
+
+    def calculate_span(
+        self, start: date, end: date, balance: Decimal, accrued: Decimal
+    ) -> Decimal:
+        total = Decimal("0.0")
+        for year, days in year_spans(start, end):
+            total += (balance + accrued + total) * (
+                (1 + self.__daily_rate(year)) ** days - 1
+            )
+        return total
@@ -0,0 +1,99 @@
+import json
+from dataclasses import dataclass, field
+from decimal import Decimal, getcontext
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, Tuple
+
+# (rate type, annual rate, period count, year, precision, rounding)
+DailyRateKey = Tuple[str, Decimal, int | None, int, int, str]
+
+
+@dataclass(eq=False)
+class DailyRateTable:
+    # Daily rates shared by every rate in the process, so that equal rates
+    # in different scenarios only pay for the fractional power once. The
+    # decimal context is part of the key as it changes the result
+    rates: Dict[DailyRateKey, Decimal] = field(default_factory=dict, repr=False)
+    lock: Lock = field(default_factory=Lock, repr=False)
+
+    def get(
+        self,
+        rate_type: str,
+        annual_rate: Decimal,
+        period_count: int | None,
+        year: int,
+        calculate: Callable[[], Decimal],
+    ) -> Decimal:
+        context = getcontext()
+        key = (
+            rate_type,
+            annual_rate,
+            period_count,
+            year,
+            context.prec,
+            str(context.rounding),
+        )
+        daily_rate = self.rates.get(key)
+        if daily_rate is None:
+            daily_rate = calculate()
+            with self.lock:
+                self.rates[key] = daily_rate
+        return daily_rate
+
+    def __len__(self) -> int:
+        return len(self.rates)
+
+    def clear(self):
+        with self.lock:
+            self.rates.clear()
+
+    def save(self, path: Path):
+        with self.lock:
+            entries = [
+                [
+                    rate_type,
+                    str(annual_rate),
+                    period_count,
+                    year,
+                    precision,
+                    rounding,
+                    str(daily_rate),
+                ]
+                for (
+                    rate_type,
+                    annual_rate,
+                    period_count,
+                    year,
+                    precision,
+                    rounding,
+                ), daily_rate in self.rates.items()
+            ]
+        Path(path).write_text(json.dumps(entries))
+
+    def load(self, path: Path):
+        # merges the saved daily rates into the table
+        entries = json.loads(Path(path).read_text())
+        with self.lock:
+            for (
+                rate_type,
+                annual_rate,
+                period_count,
+                year,
+                precision,
+                rounding,
+                daily_rate,
+            ) in entries:
+                self.rates[
+                    (
+                        rate_type,
+                        Decimal(annual_rate),
+                        period_count,
+                        year,
+                        precision,
+                        rounding,
+                    )
+                ] = Decimal(daily_rate)
+
+
+DAILY_RATE_TABLE = DailyRateTable()
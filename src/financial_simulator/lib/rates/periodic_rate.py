@@ -3,14 +3,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from functools import cache
+from typing import ClassVar, Tuple
 
-from prettytable import PrettyTable, TableStyle
-
-from financial_simulator.lib.util.date import days_in_year
-from financial_simulator.lib.util.format import format_day
+from financial_simulator.lib.reports import render_rate_calculation
+from financial_simulator.lib.util.date import days_in_year, year_spans
 
+from .daily_rate_table import DAILY_RATE_TABLE
 from .rate import Rate, RateCalculation
+from .rate_cache import RateCache
 
 
 @dataclass(frozen=True)
@@ -18,42 +18,37 @@ class PeriodicRateCalculation(RateCalculation):
     rate: PeriodicRate
     daily_rate: Decimal
 
-    @cache
-    def __str__(self) -> str:  # type: ignore
-        table = PrettyTable(["label", "value"])
-        table.add_row(["Current date", format_day(self.current_date)])
-        table.add_row(["Rate", str(self.rate)])
-        table.add_row(["Daily rate", f"{self.daily_rate * 100:.6f}"])
-        table.add_row(["Balance", f"{self.balance:.6f}"])
-        table.add_row(["Accrued", f"{self.accrued:.6f}"])
-        table.add_row(["Calculation", f"{self.calculation:.6f}"])
-        table.set_style(TableStyle.SINGLE_BORDER)
-        table.align["label"] = "l"
-        table.align["value"] = "r"
-        table.header = False
-        return table.get_string()  # type: ignore
+    def __str__(self) -> str:
+        return render_rate_calculation(self)
 
 
 @dataclass(frozen=True)
 class PeriodicRate(Rate):
     annual_rate: Decimal
     period_count: int
+    calculation_cache: ClassVar[RateCache] = RateCache()
 
-    @cache
-    def __str__(self) -> str:  # type: ignore
+    def __str__(self) -> str:
         return (
             f"PeriodicRate: {self.period_count} periods: {self.annual_rate * 100:.2f}%"
         )
 
-    @cache
     def __daily_rate(self, year: int) -> Decimal:
-        return (
-            self.period_count
-            * ((1 + self.annual_rate) ** (1 / Decimal(self.period_count)) - 1)
-        ) / days_in_year(year)
+        return DAILY_RATE_TABLE.get(
+            "PeriodicRate",
+            self.annual_rate,
+            self.period_count,
+            year,
+            lambda: (
+                (
+                    self.period_count
+                    * ((1 + self.annual_rate) ** (1 / Decimal(self.period_count)) - 1)
+                )
+                / days_in_year(year)
+            ),
+        )
 
-    @cache
-    def calculate(  # type: ignore
+    def _calculate(
         self, current_date: date, balance: Decimal, accrued: Decimal
     ) -> PeriodicRateCalculation:
         daily_rate = self.__daily_rate(current_date.year)
@@ -65,3 +60,16 @@ class PeriodicRate(Rate):
             accrued=accrued,
             calculation=daily_rate * balance,
         )
+
+    def daily_coefficients(self, year: int) -> Tuple[Decimal, Decimal] | None:
+        return (Decimal("0.0"), self.__daily_rate(year))
+
+    def calculate_span(
+        self, start: date, end: date, balance: Decimal, accrued: Decimal
+    ) -> Decimal:
+        return Decimal(
+            sum(
+                days * self.__daily_rate(year) * balance
+                for year, days in year_spans(start, end)
+            )
+        )
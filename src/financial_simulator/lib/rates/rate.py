@@ -2,8 +2,21 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
+from typing import ClassVar, Iterable, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from financial_simulator.lib.numeric import (
+    NumericBackend,
+    get_divergence_monitor,
+    get_numeric_backend,
+    numeric_backend,
+)
+
+from .rate_cache import RateCache
 
 
 @dataclass(frozen=True)
@@ -17,8 +30,136 @@ class RateCalculation:
 
 @dataclass(frozen=True)
 class Rate(metaclass=ABCMeta):
-    @abstractmethod
+    calculation_cache: ClassVar[RateCache] = RateCache()
+
     def calculate(
         self, current_date: date, balance: Decimal, accrued: Decimal
+    ) -> RateCalculation:
+        backend = get_numeric_backend()
+        key = (self, current_date, balance, accrued, backend)
+        calculation = self.calculation_cache.get(key)
+        if calculation is None:
+            if backend is NumericBackend.FLOAT64:
+                calculation = self._calculate_fast(current_date, balance, accrued)
+                monitor = get_divergence_monitor()
+                if monitor is not None and monitor.is_sampled(current_date):
+                    with numeric_backend(NumericBackend.DECIMAL):
+                        exact = self._calculate(current_date, balance, accrued)
+                    monitor.record(
+                        current_date, self, calculation.calculation, exact.calculation
+                    )
+            else:
+                calculation = self._calculate(current_date, balance, accrued)
+            self.calculation_cache.put(key, calculation)
+        return calculation
+
+    def _calculate_fast(
+        self, current_date: date, balance: Decimal, accrued: Decimal
+    ) -> RateCalculation:
+        # the float64 backend calculates in floats and only reports the total
+        # calculation, not the details of the exact calculation
+        return RateCalculation(
+            rate=self,
+            current_date=current_date,
+            balance=balance,
+            accrued=accrued,
+            calculation=Decimal(self._calculate_float(current_date, balance, accrued)),
+        )
+
+    def _calculate_float(
+        self, current_date: date, balance: Decimal, accrued: Decimal
+    ) -> float:
+        # the scalar counterpart of the array path, without the overhead of
+        # zero dimensional arrays
+        coefficients = self.daily_coefficients(current_date.year)
+        if coefficients is None:
+            return float(
+                self._calculate_array(
+                    current_date,
+                    np.array(float(balance), dtype=np.float64),
+                    np.array(float(accrued), dtype=np.float64),
+                )
+            )
+        compound, simple = coefficients
+        return float(compound) * (float(balance) + float(accrued)) + float(
+            simple
+        ) * float(balance)
+
+    @abstractmethod
+    def _calculate(
+        self, current_date: date, balance: Decimal, accrued: Decimal
     ) -> RateCalculation:
         raise NotImplementedError
+
+    def precompute_daily_rates(self, years: Iterable[int]):
+        # Fills the shared daily rate table for the given years, for instance
+        # the simulation horizon, before the rate is used
+        for year in years:
+            self.daily_coefficients(year)
+
+    def daily_coefficients(self, year: int) -> Tuple[Decimal, Decimal] | None:
+        # Rates whose daily calculation is compound * (balance + accrued) +
+        # simple * balance return (compound, simple) for the given year, so
+        # that other rates can compose them in closed form
+        return None
+
+    def calculate_span(
+        self, start: date, end: date, balance: Decimal, accrued: Decimal
+    ) -> Decimal:
+        # The total accrued over the days from start to end inclusive, with
+        # each day's calculation added to the accrued amount for the next.
+        # Rates that can should override this with a closed form
+        total = Decimal("0.0")
+        current_date = start
+        while current_date <= end:
+            total += self._calculate(current_date, balance, accrued + total).calculation
+            current_date += timedelta(days=1)
+        return total
+
+    def calculate_batch(
+        self, current_date: date, balances: npt.ArrayLike, accrued: npt.ArrayLike
+    ) -> npt.NDArray[np.float64] | npt.NDArray[np.object_]:
+        # Calculates many balances under the same rate in one call, for
+        # callers that hold them as arrays. The simulator itself calculates a
+        # balance at a time. Numeric arrays take the vectorized float64 path,
+        # object arrays of Decimal are calculated exactly entry by entry
+        balance_array, accrued_array = np.broadcast_arrays(
+            np.asarray(balances), np.asarray(accrued)
+        )
+        if balance_array.dtype == np.object_ or accrued_array.dtype == np.object_:
+            calculations = np.empty(balance_array.shape, dtype=np.object_)
+            for index, (balance, accrued_amount) in enumerate(
+                zip(balance_array.flat, accrued_array.flat)
+            ):
+                calculations.flat[index] = self.calculate(
+                    current_date, Decimal(balance), Decimal(accrued_amount)
+                ).calculation
+            return calculations
+        return self._calculate_array(
+            current_date,
+            balance_array.astype(np.float64),
+            accrued_array.astype(np.float64),
+        )
+
+    def _calculate_array(
+        self,
+        current_date: date,
+        balances: npt.NDArray[np.float64],
+        accrued: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        coefficients = self.daily_coefficients(current_date.year)
+        if coefficients is None:
+            return np.fromiter(
+                (
+                    float(
+                        self._calculate(
+                            current_date, Decimal(balance), Decimal(accrued_amount)
+                        ).calculation
+                    )
+                    for balance, accrued_amount in zip(balances.flat, accrued.flat)
+                ),
+                dtype=np.float64,
+                count=balances.size,
+            ).reshape(balances.shape)
+        compound, simple = coefficients
+        return float(compound) * (balances + accrued) + float(simple) * balances
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Hashable
+
+DEFAULT_RATE_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class RateCacheStatistics:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(eq=False)
+class RateCache:
+    # A bounded least recently used cache of rate calculations. Rate classes
+    # each hold one so that it can be resized, cleared or disabled per class
+    max_size: int = DEFAULT_RATE_CACHE_SIZE
+    enabled: bool = True
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    evictions: int = field(default=0, init=False)
+    entries: OrderedDict[Hashable, Any] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.max_size < 0:
+            raise ValueError("max_size must be greater than or equal to 0")
+
+    def get(self, key: Hashable) -> Any | None:
+        if not self.enabled or self.max_size == 0:
+            return None
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        if not self.enabled or self.max_size == 0:
+            return
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def statistics(self) -> RateCacheStatistics:
+        with self.lock:
+            return RateCacheStatistics(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self.entries),
+                max_size=self.max_size,
+            )
@@ -0,0 +1,6 @@
+from .balance_recorder import BalanceRecorder, ChunkFormat
+
+__all__ = [
+    "BalanceRecorder",
+    "ChunkFormat",
+]
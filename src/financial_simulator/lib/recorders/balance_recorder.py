@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Iterable, List, Literal, Self, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas import DataFrame
+
+from financial_simulator.lib.entities import Entity
+
+ChunkFormat = Literal["npy", "parquet"]
+Chunk = Tuple[npt.NDArray[np.datetime64], npt.NDArray[np.float64]]
+
+
+@dataclass
+class BalanceRecorder:
+    # Records the total balances of the given account paths for every entity
+    # as the simulator produces each day, so that entity snapshots do not
+    # have to be retained. Balances are buffered in columnar arrays and
+    # flushed in chunks, either kept in memory or written to the directory
+    account_paths: Sequence[Sequence[str]]
+    chunk_size: int = 1024
+    directory: Path | None = None
+    chunk_format: ChunkFormat = "npy"
+    entity_names: Tuple[str, ...] = field(default=(), init=False)
+    chunks: List[Chunk] = field(default_factory=list, init=False, repr=False)
+    chunk_count: int = field(default=0, init=False)
+    buffered: int = field(default=0, init=False)
+    date_buffer: npt.NDArray[np.datetime64] = field(init=False, repr=False)
+    balance_buffer: npt.NDArray[np.float64] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if self.directory is not None:
+            self.directory = Path(self.directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.date_buffer = np.empty(self.chunk_size, dtype="datetime64[D]")
+        self.balance_buffer = np.empty((self.chunk_size, 0), dtype=np.float64)
+
+    @property
+    def columns(self) -> Sequence[Tuple[str, Tuple[str, ...]]]:
+        return tuple(
+            (entity_name, tuple(account_path))
+            for entity_name in self.entity_names
+            for account_path in self.account_paths
+        )
+
+    def append(self, current_date: date, entities: Sequence[Entity]):
+        if not self.entity_names:
+            self.entity_names = tuple(entity.name for entity in entities)
+            self.balance_buffer = np.empty(
+                (self.chunk_size, len(self.columns)), dtype=np.float64
+            )
+        self.date_buffer[self.buffered] = current_date
+        self.balance_buffer[self.buffered] = tuple(
+            float(entity.books.get_total_balance(account_path))
+            for entity in entities
+            for account_path in self.account_paths
+        )
+        self.buffered += 1
+        if self.buffered == self.chunk_size:
+            self.flush()
+
+    def record(self, days: Iterable[Tuple[date, Sequence[Entity]]]) -> Self:
+        for current_date, entities in days:
+            self.append(current_date, entities)
+        self.flush()
+        return self
+
+    def __chunk_path(self, index: int, name: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"chunk-{index:05d}-{name}"
+
+    def flush(self):
+        if self.buffered == 0:
+            return
+        dates = self.date_buffer[: self.buffered].copy()
+        balances = self.balance_buffer[: self.buffered].copy()
+        if self.directory is None:
+            self.chunks.append((dates, balances))
+        elif self.chunk_format == "npy":
+            np.save(self.__chunk_path(self.chunk_count, "dates.npy"), dates)
+            np.save(self.__chunk_path(self.chunk_count, "balances.npy"), balances)
+        else:
+            DataFrame(
+                balances,
+                columns=[str(index) for index in range(balances.shape[1])],
+            ).assign(Date=dates).to_parquet(
+                self.__chunk_path(self.chunk_count, "balances.parquet")
+            )
+        self.chunk_count += 1
+        self.buffered = 0
+
+    def __read_chunk(self, index: int) -> Chunk:
+        if self.directory is None:
+            return self.chunks[index]
+        if self.chunk_format == "npy":
+            return (
+                np.load(self.__chunk_path(index, "dates.npy"), mmap_mode="r"),
+                np.load(self.__chunk_path(index, "balances.npy"), mmap_mode="r"),
+            )
+        data_frame = pd.read_parquet(self.__chunk_path(index, "balances.parquet"))
+        return (
+            data_frame.pop("Date").to_numpy(dtype="datetime64[D]"),
+            data_frame.to_numpy(dtype=np.float64),
+        )
+
+    def __read_chunks(self) -> Sequence[Chunk]:
+        return tuple(self.__read_chunk(index) for index in range(self.chunk_count)) + (
+            (
+                self.date_buffer[: self.buffered],
+                self.balance_buffer[: self.buffered],
+            ),
+        )
+
+    def dates(self) -> npt.NDArray[np.datetime64]:
+        return np.concatenate([dates for dates, _ in self.__read_chunks()])
+
+    def balances(self) -> npt.NDArray[np.float64]:
+        if not self.entity_names:
+            return np.empty((0, len(self.columns)), dtype=np.float64)
+        return np.concatenate([balances for _, balances in self.__read_chunks()])
+
+    def truncated(self, until_date: date) -> BalanceRecorder:
+        # an in memory copy of the balances recorded up to and including the
+        # until date, which can be appended to from the following day
+        dates = self.dates()
+        kept = dates <= np.datetime64(until_date, "D")
+        recorder = BalanceRecorder(
+            account_paths=self.account_paths, chunk_size=self.chunk_size
+        )
+        if self.entity_names:
+            recorder.entity_names = self.entity_names
+            recorder.balance_buffer = np.empty_like(self.balance_buffer)
+            recorder.chunks.append((dates[kept], self.balances()[kept]))
+            recorder.chunk_count = 1
+        return recorder
+
+    def to_data_frame(self) -> DataFrame:
+        columns = self.columns
+        dates = self.dates()
+        return DataFrame(
+            {
+                "Date": np.repeat(dates, len(columns)),
+                "Entity": [entity for _ in dates for entity, _ in columns],
+                "Account": [
+                    ":".join(account_path) for _ in dates for _, account_path in columns
+                ],
+                "Balance": self.balances().reshape(-1),
+            }
+        )
+
+    def account_balances(
+        self,
+        account_path: Sequence[str],
+        entity_labels: Sequence[str] | None = None,
+        is_debit_account: bool = False,
+    ) -> DataFrame:
+        column_indices = [
+            index
+            for index, (_, column_account_path) in enumerate(self.columns)
+            if column_account_path == tuple(account_path)
+        ]
+        labels = tuple(entity_labels or self.entity_names)
+        sign = -1.0 if is_debit_account else 1.0
+        wide_data_frame = DataFrame(
+            sign * self.balances()[:, column_indices], columns=labels
+        ).assign(Date=self.dates())
+        return wide_data_frame.melt(  # type: ignore
+            id_vars="Date", value_vars=labels, var_name="Entity", value_name="Balance"
+        )
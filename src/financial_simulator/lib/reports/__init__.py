@@ -0,0 +1,20 @@
+from .bands import render_bands
+from .rates import (
+    render_banded_rate,
+    render_rate_calculation,
+    render_rate_calculations,
+)
+from .table import ReportFormat, render_table
+from .tax import render_tax_bands, render_tax_calculations, render_tax_totals
+
+__all__ = [
+    "ReportFormat",
+    "render_banded_rate",
+    "render_bands",
+    "render_rate_calculation",
+    "render_rate_calculations",
+    "render_table",
+    "render_tax_bands",
+    "render_tax_calculations",
+    "render_tax_totals",
+]
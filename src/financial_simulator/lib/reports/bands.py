@@ -0,0 +1,18 @@
+from typing import Any, Sequence, Tuple
+
+from financial_simulator.lib.util.bands import Band
+
+from .table import ReportFormat, render_table
+
+
+def render_bands(
+    bands: Sequence[Tuple[Band, Any]],
+    value_name: str = "Value",
+    report_format: ReportFormat = "table",
+) -> str:
+    return render_table(
+        ["Band", value_name],
+        [[str(band), str(value)] for band, value in bands],
+        report_format,
+        align={"Band": "l", value_name: "r"},
+    )
@@ -0,0 +1,115 @@
+from typing import TYPE_CHECKING, Any, List, Sequence
+
+from financial_simulator.lib.util.format import format_day
+
+from .bands import render_bands
+from .table import ReportFormat, render_table
+
+if TYPE_CHECKING:
+    from financial_simulator.lib.rates import BandedRate, RateCalculation
+
+
+def _format_amount(amount: Any) -> str:
+    return f"{amount:.6f}"
+
+
+def _rate_label(rate: Any) -> str:
+    # a single line label, as banded rates render as a table
+    bands = getattr(rate, "bands", None)
+    if bands is None:
+        return str(rate)
+    return "; ".join(f"{band}: {_rate_label(band_rate)}" for band, band_rate in bands)
+
+
+def render_banded_rate(
+    rate: "BandedRate", report_format: ReportFormat = "table"
+) -> str:
+    return render_bands(rate.bands, "Rate", report_format)
+
+
+def render_rate_calculation(
+    calculation: "RateCalculation", report_format: ReportFormat = "table"
+) -> str:
+    # Banded calculations are rendered with a row per band, other
+    # calculations as a table of labelled values
+    band_calculations = getattr(calculation, "calculations", None)
+    if band_calculations is not None:
+        return render_table(
+            ["Band", "Rate", "Balance", "Accrued", "Calculation"],
+            [
+                [
+                    str(band),
+                    str(rate),
+                    _format_amount(band_calculation.balance),
+                    _format_amount(band_calculation.accrued),
+                    _format_amount(band_calculation.calculation),
+                ]
+                for (band, rate), band_calculation in zip(
+                    calculation.rate.bands,  # type: ignore
+                    band_calculations,
+                )
+            ],
+            report_format,
+            align={
+                "Band": "l",
+                "Rate": "r",
+                "Balance": "r",
+                "Accrued": "r",
+                "Calculation": "r",
+            },
+            totals=[
+                [
+                    format_day(calculation.current_date),
+                    "Totals",
+                    _format_amount(calculation.balance),
+                    _format_amount(calculation.accrued),
+                    _format_amount(calculation.calculation),
+                ]
+            ],
+        )
+    rows: List[List[str]] = [
+        ["Current date", format_day(calculation.current_date)],
+        ["Rate", str(calculation.rate)],
+    ]
+    daily_rate = getattr(calculation, "daily_rate", None)
+    if daily_rate is not None:
+        rows.append(["Daily rate", f"{daily_rate * 100:.6f}"])
+    rows += [
+        ["Balance", _format_amount(calculation.balance)],
+        ["Accrued", _format_amount(calculation.accrued)],
+        ["Calculation", _format_amount(calculation.calculation)],
+    ]
+    return render_table(
+        ["label", "value"],
+        rows,
+        report_format,
+        align={"label": "l", "value": "r"},
+        header=False,
+    )
+
+
+def render_rate_calculations(
+    calculations: Sequence["RateCalculation"], report_format: ReportFormat = "table"
+) -> str:
+    # many calculations as one table with a row per calculation
+    return render_table(
+        ["Date", "Rate", "Balance", "Accrued", "Calculation"],
+        [
+            [
+                calculation.current_date.isoformat(),
+                _rate_label(calculation.rate),
+                _format_amount(calculation.balance),
+                _format_amount(calculation.accrued),
+                _format_amount(calculation.calculation),
+            ]
+            for calculation in calculations
+        ],
+        report_format,
+        align={
+            "Date": "l",
+            "Rate": "l",
+            "Balance": "r",
+            "Accrued": "r",
+            "Calculation": "r",
+        },
+    )
@@ -0,0 +1,41 @@
+import csv
+from io import StringIO
+from typing import Any, Literal, Mapping, Sequence
+
+from prettytable import PrettyTable, TableStyle
+
+ReportFormat = Literal["table", "csv", "markdown"]
+Align = Literal["l", "c", "r"]
+
+
+def render_table(
+    field_names: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    report_format: ReportFormat = "table",
+    align: Mapping[str, Align] | None = None,
+    totals: Sequence[Sequence[Any]] = (),
+    header: bool = True,
+) -> str:
+    # Renders rows as a text table, CSV or Markdown. Totals rows follow a
+    # divider in text tables and are plain rows in the other formats
+    if report_format == "csv":
+        output = StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        if header:
+            writer.writerow(field_names)
+        writer.writerows(rows)
+        writer.writerows(totals)
+        return output.getvalue()
+    table = PrettyTable(list(field_names))
+    table.set_style(
+        TableStyle.MARKDOWN if report_format == "markdown" else TableStyle.SINGLE_BORDER
+    )
+    table.add_rows([list(row) for row in rows])
+    if totals:
+        if report_format == "table":
+            table.add_divider()
+        table.add_rows([list(row) for row in totals])
+    for field_name, field_align in (align or {}).items():
+        table.align[field_name] = field_align
+    table.header = header
+    return table.get_string()  # type: ignore
@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING, Sequence
+
+from .table import ReportFormat, render_table
+
+if TYPE_CHECKING:
+    from financial_simulator.lib.tax.tax_bands_by_year import TaxBands, TaxCalculations
+
+LABEL_COLUMN_NAME = "For the portion of the taxable amount"
+RATE_COLUMN_NAME = "Rate"
+TAXABLE_COLUMN_NAME = "Taxable portion"
+TAX_DUE_COLUMN_NAME = "Tax Due"
+TOTAL_LABEL = "Total"
+
+
+def render_tax_bands(
+    tax_bands: "TaxBands", report_format: ReportFormat = "table"
+) -> str:
+    labels, rates = tax_bands.format_columns()
+    return render_table(
+        [LABEL_COLUMN_NAME, RATE_COLUMN_NAME],
+        list(zip(labels, rates)),
+        report_format,
+        align={LABEL_COLUMN_NAME: "l", RATE_COLUMN_NAME: "r"},
+    )
+
+
+def render_tax_calculations(
+    tax_calculations: "TaxCalculations", report_format: ReportFormat = "table"
+) -> str:
+    taxable_portions, tax_due_portions = tax_calculations.format_columns()
+    taxable, tax_due = tax_calculations.format_totals()
+    return render_table(
+        [LABEL_COLUMN_NAME, RATE_COLUMN_NAME, TAXABLE_COLUMN_NAME, TAX_DUE_COLUMN_NAME],
+        list(
+            zip(
+                tax_calculations.labels,
+                tax_calculations.rates,
+                taxable_portions,
+                tax_due_portions,
+            )
+        ),
+        report_format,
+        align={
+            LABEL_COLUMN_NAME: "l",
+            RATE_COLUMN_NAME: "r",
+            TAXABLE_COLUMN_NAME: "r",
+            TAX_DUE_COLUMN_NAME: "r",
+        },
+        totals=[["", TOTAL_LABEL, taxable, tax_due]],
+    )
+
+
+def render_tax_totals(
+    tax_calculations: Sequence["TaxCalculations"],
+    report_format: ReportFormat = "table",
+) -> str:
+    return render_table(
+        [TAXABLE_COLUMN_NAME, TAX_DUE_COLUMN_NAME],
+        [calculation.format_totals() for calculation in tax_calculations],
+        report_format,
+        align={TAXABLE_COLUMN_NAME: "r", TAX_DUE_COLUMN_NAME: "r"},
+    )
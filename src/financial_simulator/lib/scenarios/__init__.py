@@ -0,0 +1,19 @@
+from .incremental_simulator import IncrementalSimulator, SimulationRun
+from .scenario import Scenario, ScenarioResult
+from .scenario_runner import (
+    ScenarioRun,
+    WorkerThroughput,
+    run_scenario,
+    run_scenarios,
+)
+
+__all__ = [
+    "IncrementalSimulator",
+    "Scenario",
+    "ScenarioResult",
+    "ScenarioRun",
+    "SimulationRun",
+    "WorkerThroughput",
+    "run_scenario",
+    "run_scenarios",
+]
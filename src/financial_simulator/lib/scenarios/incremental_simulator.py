@@ -0,0 +1,125 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from financial_simulator.lib.checkpoints import (
+    Checkpoint,
+    content_hash,
+    find_changes,
+    first_changed_date,
+    graft_changes,
+)
+from financial_simulator.lib.entities import Entity
+from financial_simulator.lib.financial_simulator import FinancialSimulator
+from financial_simulator.lib.recorders import BalanceRecorder
+
+
+@dataclass(frozen=True)
+class SimulationRun:
+    initial_date: date
+    entities: Sequence[Entity]
+    final_date: date
+    checkpoints: Sequence[Checkpoint]
+    recorder: BalanceRecorder
+
+
+@dataclass
+class IncrementalSimulator:
+    # Keeps the checkpoints and recorded balances of previous runs keyed by
+    # the content hash of their initial entity graph. A changed scenario is
+    # resumed from the latest checkpoint of the most similar previous run
+    # before the first date that the change can affect. Only the most
+    # recently used runs are kept
+    account_paths: Sequence[Sequence[str]]
+    interval_days: int = 30
+    max_runs: int = 16
+    skip_idle_days: bool = False
+    runs: Dict[str, SimulationRun] = field(default_factory=dict, init=False)
+    # the date that the last simulation resumed from, for instrumentation
+    resumed_from: date | None = field(default=None, init=False)
+
+    def __post_init__(self):
+        if self.interval_days < 1:
+            raise ValueError("interval_days must be at least 1")
+        if self.max_runs < 1:
+            raise ValueError("max_runs must be at least 1")
+
+    def __resume_point(
+        self, initial_date: date, entities: Sequence[Entity], final_date: date
+    ) -> Tuple[SimulationRun, List[Checkpoint]] | None:
+        best: Tuple[date, SimulationRun] | None = None
+        for run in self.runs.values():
+            if run.initial_date != initial_date or len(run.entities) != len(entities):
+                continue
+            until_date = min(run.final_date, final_date)
+            changed_date = first_changed_date(
+                run.entities, entities, initial_date, until_date
+            ) or until_date + timedelta(days=1)
+            if best is None or changed_date > best[0]:
+                best = changed_date, run
+        if best is None:
+            return None
+        changed_date, run = best
+        # the checkpoints before the change are valid for the new entities
+        # once the changed providers and schedules are grafted in
+        changes = tuple(find_changes(run.entities, entities))
+        checkpoints: List[Checkpoint] = []
+        for checkpoint in run.checkpoints:
+            if checkpoint.current_date >= changed_date:
+                break
+            grafted = graft_changes(
+                changes, checkpoint.entities, initial_date, checkpoint.current_date
+            )
+            if grafted is not None:
+                checkpoints.append(Checkpoint(checkpoint.current_date, tuple(grafted)))
+        if not checkpoints:
+            return None
+        return run, checkpoints
+
+    def __checkpoint(
+        self,
+        days: Iterable[Tuple[date, Sequence[Entity]]],
+        checkpoints: List[Checkpoint],
+    ) -> Iterator[Tuple[date, Sequence[Entity]]]:
+        for current_date, entities in days:
+            if (current_date - checkpoints[-1].current_date).days >= self.interval_days:
+                checkpoints.append(Checkpoint(current_date, entities))
+            yield current_date, entities
+
+    def simulate(
+        self, initial_date: date, entities: Sequence[Entity], number_of_days: int
+    ) -> BalanceRecorder:
+        entities = tuple(entities)
+        final_date = initial_date + timedelta(days=number_of_days)
+        key = content_hash((initial_date, entities))
+        run = self.runs.pop(key, None)
+        if run is not None:
+            self.runs[key] = run
+        if run is not None and run.final_date >= final_date:
+            self.resumed_from = final_date
+            return run.recorder.truncated(final_date)
+        resume_point = self.__resume_point(initial_date, entities, final_date)
+        if resume_point is None:
+            checkpoints = [Checkpoint(initial_date, entities)]
+            recorder = BalanceRecorder(account_paths=self.account_paths)
+        else:
+            base_run, checkpoints = resume_point
+            recorder = base_run.recorder.truncated(checkpoints[-1].current_date)
+        self.resumed_from = checkpoints[-1].current_date
+        simulator = FinancialSimulator.resume(
+            checkpoints[-1],
+            skip_idle_days=self.skip_idle_days,
+            final_date=final_date,
+        )
+        recorder.record(self.__checkpoint(simulator, checkpoints))
+        self.runs.pop(key, None)
+        while len(self.runs) >= self.max_runs:
+            del self.runs[next(iter(self.runs))]
+        self.runs[key] = SimulationRun(
+            initial_date=initial_date,
+            entities=entities,
+            final_date=final_date,
+            checkpoints=tuple(checkpoints),
+            recorder=recorder,
+        )
+        return recorder
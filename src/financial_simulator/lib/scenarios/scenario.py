@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from pandas import DataFrame
+
+from financial_simulator.lib.entities import Entity
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    initial_date: date
+    entities: Sequence[Entity]
+    number_of_days: int
+    # the account total balances to record for every entity
+    account_paths: Sequence[Sequence[str]]
+    skip_idle_days: bool = False
+
+
+@dataclass(frozen=True, eq=False)
+class ScenarioResult:
+    # Recorded balances are held in columns, one row per simulated day and one
+    # column per entity and account path
+    name: str
+    dates: npt.NDArray[np.datetime64]
+    columns: Sequence[Tuple[str, Tuple[str, ...]]]
+    balances: npt.NDArray[np.float64]
+    worker: int
+    elapsed: float
+
+    @property
+    def number_of_days(self) -> int:
+        return len(self.dates)
+
+    def to_data_frame(self) -> DataFrame:
+        return DataFrame(
+            {
+                "Scenario": self.name,
+                "Date": np.repeat(self.dates, len(self.columns)),
+                "Entity": [entity for _ in self.dates for entity, _ in self.columns],
+                "Account": [
+                    ":".join(account_path)
+                    for _ in self.dates
+                    for _, account_path in self.columns
+                ],
+                "Balance": self.balances.reshape(-1),
+            }
+        )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from time import perf_counter
+from typing import Dict, List, Sequence
+
+from financial_simulator.lib.financial_simulator import FinancialSimulator
+from financial_simulator.lib.recorders import BalanceRecorder
+
+from .scenario import Scenario, ScenarioResult
+
+
+@dataclass(frozen=True)
+class WorkerThroughput:
+    worker: int
+    scenarios: int
+    days: int
+    elapsed: float
+
+    @property
+    def days_per_second(self) -> float:
+        return self.days / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass(frozen=True)
+class ScenarioRun:
+    results: Sequence[ScenarioResult]
+    throughput: Sequence[WorkerThroughput]
+    elapsed: float
+
+
+def run_scenario(scenario: Scenario) -> ScenarioResult:
+    start = perf_counter()
+    final_date = scenario.initial_date + timedelta(days=scenario.number_of_days)
+    # fill the per process daily rate table for the horizon up front, so
+    # that later scenarios on the same worker find their rates there
+    years = range(scenario.initial_date.year, final_date.year + 1)
+    for entity in scenario.entities:
+        entity.precompute_daily_rates(years)
+    simulator = FinancialSimulator(
+        current_date=scenario.initial_date,
+        current_entities=scenario.entities,
+        skip_idle_days=scenario.skip_idle_days,
+        final_date=final_date,
+    )
+    recorder = BalanceRecorder(account_paths=scenario.account_paths).record(simulator)
+    return ScenarioResult(
+        name=scenario.name,
+        dates=recorder.dates(),
+        columns=recorder.columns,
+        balances=recorder.balances(),
+        worker=os.getpid(),
+        elapsed=perf_counter() - start,
+    )
+
+
+def run_scenarios(
+    scenarios: Sequence[Scenario], max_workers: int | None = None
+) -> ScenarioRun:
+    start = perf_counter()
+    # Scenarios are pickled once by the executor as they are sent to the
+    # workers, anything that cannot be, such as a lambda in a provider, is
+    # raised when its result is collected
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = tuple(executor.map(run_scenario, scenarios))
+    workers: Dict[int, List[ScenarioResult]] = {}
+    for result in results:
+        workers.setdefault(result.worker, []).append(result)
+    return ScenarioRun(
+        results=results,
+        throughput=tuple(
+            WorkerThroughput(
+                worker=worker,
+                scenarios=len(worker_results),
+                days=sum(result.number_of_days for result in worker_results),
+                elapsed=sum(result.elapsed for result in worker_results),
+            )
+            for worker, worker_results in sorted(workers.items())
+        ),
+        elapsed=perf_counter() - start,
+    )
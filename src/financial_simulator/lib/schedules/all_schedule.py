@@ -1,8 +1,8 @@
 from dataclasses import dataclass, replace
-from datetime import date
+from datetime import date, timedelta
 from typing import Self, Sequence, Tuple
 
-from .schedule import Schedule
+from .schedule import LOOK_AHEAD_DAYS, Schedule
 
 
 @dataclass(frozen=True)
@@ -22,3 +22,22 @@ class AllSchedule(Schedule):
             return None
         schedules, scheduled = zip(*schedules_and_scheduled)
         return replace(self, schedules=schedules), all(scheduled)
+
+    def next_occurrence(self, after: date) -> date | None:
+        if not self.schedules:
+            return None
+        limit = after + timedelta(days=LOOK_AHEAD_DAYS)
+        current_date = after
+        # Keep moving to the latest of the next occurrences until they all agree
+        while True:
+            next_occurrences = tuple(
+                schedule.next_occurrence(current_date) for schedule in self.schedules
+            )
+            if any(next_occurrence is None for next_occurrence in next_occurrences):
+                return None
+            latest: date = max(next_occurrences)  # type: ignore
+            if all(next_occurrence == latest for next_occurrence in next_occurrences):
+                return latest
+            if latest > limit:
+                return latest
+            current_date = latest - timedelta(days=1)
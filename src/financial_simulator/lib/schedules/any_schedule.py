@@ -21,3 +21,15 @@ class AnySchedule(Schedule):
             return None
         schedules, scheduled = zip(*schedules_and_scheduled)
         return replace(self, schedules=schedules), any(scheduled)
+
+    def next_occurrence(self, after: date) -> date | None:
+        return min(
+            (
+                next_occurrence
+                for next_occurrence in (
+                    schedule.next_occurrence(after) for schedule in self.schedules
+                )
+                if next_occurrence is not None
+            ),
+            default=None,
+        )
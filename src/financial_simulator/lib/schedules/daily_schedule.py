@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from typing import Self, Tuple
 
 from .schedule import Schedule
@@ -9,3 +9,6 @@ from .schedule import Schedule
 class DailySchedule(Schedule):
     def check(self, current_date: date) -> Tuple[Self, bool] | None:
         return self, True
+
+    def next_occurrence(self, after: date) -> date | None:
+        return after + timedelta(days=1)
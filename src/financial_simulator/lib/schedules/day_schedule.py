@@ -13,3 +13,6 @@ class DaySchedule(Schedule):
         if self.day < current_date:
             return None
         return self, self.day == current_date
+
+    def next_occurrence(self, after: date) -> date | None:
+        return self.day if self.day > after else None
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from typing import Self, Tuple
 
 from .schedule import Schedule
@@ -11,3 +11,6 @@ class FromSchedule(Schedule):
 
     def check(self, current_date: date) -> Tuple[Self, bool] | None:
         return self, current_date >= self.from_date
+
+    def next_occurrence(self, after: date) -> date | None:
+        return max(self.from_date, after + timedelta(days=1))
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from typing import Callable, Self, Tuple
 
-from .schedule import Schedule
+from .schedule import LOOK_AHEAD_DAYS, Schedule
 
 
 @dataclass(frozen=True)
@@ -14,3 +14,14 @@ class FunctionSchedule(Schedule):
         if result is None:
             return None
         return self, result
+
+    def next_occurrence(self, after: date) -> date | None:
+        # We know nothing about the function so we have to try each day in turn
+        for days in range(1, LOOK_AHEAD_DAYS + 1):
+            current_date = after + timedelta(days=days)
+            result = self.function(current_date)
+            if result is None:
+                return None
+            if result:
+                return current_date
+        return after + timedelta(days=LOOK_AHEAD_DAYS + 1)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Self, Tuple
 
-from financial_simulator.lib.util.date import correct_day_of_the_month
+from financial_simulator.lib.util.date import correct_day_of_the_month, corrected_date
 
 from .schedule import Schedule
 
@@ -15,3 +15,11 @@ class MonthlySchedule(Schedule):
         return self, current_date.day == correct_day_of_the_month(
             self.day, current_date
         )
+
+    def next_occurrence(self, after: date) -> date | None:
+        this_month = corrected_date(after.year, after.month, self.day)
+        if this_month > after:
+            return this_month
+        if after.month == 12:
+            return corrected_date(after.year + 1, 1, self.day)
+        return corrected_date(after.year, after.month + 1, self.day)
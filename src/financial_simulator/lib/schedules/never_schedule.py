@@ -9,3 +9,6 @@ from .schedule import Schedule
 class NeverSchedule(Schedule):
     def check(self, current_date: date) -> Tuple[Self, bool] | None:
         return None
+
+    def next_occurrence(self, after: date) -> date | None:
+        return None
@@ -3,9 +3,22 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Self, Tuple
 
+# How far schedules that cannot calculate their next occurrence directly
+# will search before giving up
+LOOK_AHEAD_DAYS = 366 * 100
+
 
 @dataclass(frozen=True)
 class Schedule(metaclass=ABCMeta):
     @abstractmethod
     def check(self, current_date: date) -> Tuple[Self, bool] | None:
         raise NotImplementedError
+
+    @abstractmethod
+    def next_occurrence(self, after: date) -> date | None:
+        # Returns the earliest date after the given date on which the schedule
+        # may be due, or None if it will never be due again. Schedules that
+        # have to search for it return the first date beyond the search limit
+        # if nothing is found, so there is never an occurrence before the
+        # returned date
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 from typing import Self, Tuple
 
 from .schedule import Schedule
@@ -13,3 +13,7 @@ class UntilSchedule(Schedule):
         if current_date >= self.until_date:
             return None
         return self, True
+
+    def next_occurrence(self, after: date) -> date | None:
+        next_date = after + timedelta(days=1)
+        return next_date if next_date < self.until_date else None
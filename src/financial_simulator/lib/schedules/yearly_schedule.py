@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Self, Tuple
 
-from financial_simulator.lib.util.date import correct_day_of_the_month
+from financial_simulator.lib.util.date import correct_day_of_the_month, corrected_date
 
 from .schedule import Schedule
 
@@ -17,3 +17,9 @@ class YearlySchedule(Schedule):
             if current_date.day == correct_day_of_the_month(self.day, current_date):
                 return self, True
         return self, False
+
+    def next_occurrence(self, after: date) -> date | None:
+        this_year = corrected_date(after.year, self.month, self.day)
+        if this_year > after:
+            return this_year
+        return corrected_date(after.year + 1, self.month, self.day)
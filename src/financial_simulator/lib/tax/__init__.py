@@ -1,7 +1,17 @@
 from .tax import Tax
+from .tax_band_data import (
+    TAX_BAND_DATA_CACHE,
+    TaxBandData,
+    TaxBandDataCache,
+    TaxBandDataError,
+)
 from .tax_bands_by_year import TaxBandsByYear
 
 __all__ = [
+    "TAX_BAND_DATA_CACHE",
     "Tax",
+    "TaxBandData",
+    "TaxBandDataCache",
+    "TaxBandDataError",
     "TaxBandsByYear",
 ]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+# Sidecar files start with a fixed size header holding the magic bytes, the
+# format version, the year and band counts and the modification time of the
+# source file that they were compiled from. The header is padded to a
+# multiple of 8 bytes so that the arrays following it can be mapped in place
+TAX_BAND_DATA_MAGIC = b"FSTB"
+TAX_BAND_DATA_VERSION = 1
+HEADER = struct.Struct("<4sHxxIIq")
+
+
+class TaxBandDataError(Exception):
+    pass
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _read_only(array: npt.NDArray[Any]) -> npt.NDArray[Any]:
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class TaxBandData:
+    # The bands for year i are thresholds[offsets[i]:offsets[i + 1]] and
+    # rates[offsets[i]:offsets[i + 1]], sorted by year and threshold
+    years: npt.NDArray[np.int64]
+    offsets: npt.NDArray[np.int64]
+    thresholds: npt.NDArray[np.float64]
+    rates: npt.NDArray[np.float64]
+
+    @staticmethod
+    def from_json(data: Any) -> TaxBandData:
+        if not isinstance(data, list):
+            raise TaxBandDataError("Tax band data must be a list of years")
+        years: Dict[int, List[Tuple[float, float]]] = {}
+        for year_bands in data:
+            try:
+                year = year_bands["year"]
+                bands = [(band["above"], band["rate"]) for band in year_bands["bands"]]
+            except (KeyError, TypeError) as error:
+                raise TaxBandDataError(f"Malformed tax bands: {year_bands}") from error
+            if not isinstance(year, int):
+                raise TaxBandDataError(f"Invalid year: {year}")
+            if year in years:
+                raise TaxBandDataError(f"Duplicate bands for year {year}")
+            if not bands:
+                raise TaxBandDataError(f"No bands for year {year}")
+            for above, rate in bands:
+                if not (_is_number(above) and math.isfinite(above) and above >= 0):
+                    raise TaxBandDataError(
+                        f"Invalid threshold for year {year}: {above}"
+                    )
+                if not (_is_number(rate) and math.isfinite(rate) and 0 <= rate <= 1):
+                    raise TaxBandDataError(f"Invalid rate for year {year}: {rate}")
+            if len({above for above, _ in bands}) != len(bands):
+                raise TaxBandDataError(f"Duplicate thresholds for year {year}")
+            years[year] = sorted((float(above), float(rate)) for above, rate in bands)
+        sorted_years = sorted(years.items())
+        offsets = np.cumsum([0] + [len(bands) for _, bands in sorted_years])
+        return TaxBandData(
+            years=_read_only(
+                np.array([year for year, _ in sorted_years], dtype=np.int64)
+            ),
+            offsets=_read_only(offsets.astype(np.int64)),
+            thresholds=_read_only(
+                np.array(
+                    [above for _, bands in sorted_years for above, _ in bands],
+                    dtype=np.float64,
+                )
+            ),
+            rates=_read_only(
+                np.array(
+                    [rate for _, bands in sorted_years for _, rate in bands],
+                    dtype=np.float64,
+                )
+            ),
+        )
+
+    def year_bands(self, index: int) -> Dict[float, float]:
+        # whole thresholds are given back as ints so that they are formatted
+        # without a fractional part in reports
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return {
+            int(threshold) if threshold.is_integer() else threshold: rate
+            for threshold, rate in zip(
+                self.thresholds[start:end].tolist(), self.rates[start:end].tolist()
+            )
+        }
+
+    def to_bytes(self, source_mtime_ns: int) -> bytes:
+        return (
+            HEADER.pack(
+                TAX_BAND_DATA_MAGIC,
+                TAX_BAND_DATA_VERSION,
+                len(self.years),
+                len(self.thresholds),
+                source_mtime_ns,
+            )
+            + self.years.astype("<i8").tobytes()
+            + self.offsets.astype("<i8").tobytes()
+            + self.thresholds.astype("<f8").tobytes()
+            + self.rates.astype("<f8").tobytes()
+        )
+
+    @staticmethod
+    def from_buffer(buffer: npt.NDArray[np.uint8], source_mtime_ns: int) -> TaxBandData:
+        # The arrays are views onto the buffer, so a memory mapped sidecar is
+        # shared between processes rather than copied into each of them
+        if len(buffer) < HEADER.size:
+            raise TaxBandDataError("Tax band data is truncated")
+        magic, version, year_count, band_count, mtime_ns = HEADER.unpack_from(buffer)
+        if magic != TAX_BAND_DATA_MAGIC:
+            raise TaxBandDataError("Not tax band data")
+        if version != TAX_BAND_DATA_VERSION:
+            raise TaxBandDataError(f"Unsupported tax band data version: {version}")
+        if mtime_ns != source_mtime_ns:
+            raise TaxBandDataError("Tax band data is stale")
+        sizes = (year_count, year_count + 1, band_count, band_count)
+        if len(buffer) != HEADER.size + 8 * sum(sizes):
+            raise TaxBandDataError("Tax band data is truncated")
+        arrays = []
+        offset = HEADER.size
+        for dtype, size in zip(("<i8", "<i8", "<f8", "<f8"), sizes):
+            arrays.append(_read_only(buffer[offset : offset + 8 * size].view(dtype)))
+            offset += 8 * size
+        years, offsets, thresholds, rates = arrays
+        return TaxBandData(
+            years=years, offsets=offsets, thresholds=thresholds, rates=rates
+        )
+
+    def write(self, path: Path, source_mtime_ns: int):
+        # write to a temporary file first so that workers never map a partial
+        # sidecar, the process id keeps concurrent writers apart
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary_path.write_bytes(self.to_bytes(source_mtime_ns))
+        temporary_path.replace(path)
+
+    @staticmethod
+    def read(path: Path, source_mtime_ns: int) -> TaxBandData:
+        return TaxBandData.from_buffer(
+            np.memmap(path, dtype=np.uint8, mode="r"), source_mtime_ns
+        )
+
+
+def sidecar_path(data_file: Path) -> Path:
+    return data_file.with_name(data_file.name + ".bin")
+
+
+@dataclass(eq=False)
+class TaxBandDataCache:
+    # Compiled tax band data shared by everything in the process, keyed on
+    # the resolved path of the source file. An entry is replaced when the
+    # source file is modified
+    entries: Dict[Path, Tuple[int, TaxBandData]] = field(
+        default_factory=dict, repr=False
+    )
+    lock: Lock = field(default_factory=Lock, repr=False)
+
+    def load(self, data_file: str | Path, sidecar: bool = False) -> TaxBandData:
+        path = Path(data_file).resolve()
+        mtime_ns = path.stat().st_mtime_ns
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1]
+        data = self.__compile(path, mtime_ns, sidecar)
+        with self.lock:
+            self.entries[path] = (mtime_ns, data)
+        return data
+
+    @staticmethod
+    def __compile(path: Path, mtime_ns: int, sidecar: bool) -> TaxBandData:
+        # a sidecar is only ever written from validated data, so a current
+        # one can be mapped without validating it again
+        if sidecar:
+            try:
+                return TaxBandData.read(sidecar_path(path), mtime_ns)
+            except (FileNotFoundError, ValueError, TaxBandDataError):
+                pass
+        data = TaxBandData.from_json(json.loads(path.read_text()))
+        if sidecar:
+            data.write(sidecar_path(path), mtime_ns)
+        return data
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+TAX_BAND_DATA_CACHE = TaxBandDataCache()
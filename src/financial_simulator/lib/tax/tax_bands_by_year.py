@@ -1,13 +1,14 @@
-import json
-from typing import Dict, List, Tuple
+from bisect import bisect_left, bisect_right
+from functools import cached_property
+from typing import Dict, List, Sequence, Tuple
+from weakref import WeakKeyDictionary
 
-from prettytable import PrettyTable, TableStyle
+import numpy as np
+import numpy.typing as npt
 
-LABEL_COLUMN_NAME = "For the portion of the taxable amount"
-RATE_COLUMN_NAME = "Rate"
-TAXABLE_COLUMN_NAME = "Taxable portion"
-TAX_DUE_COLUMN_NAME = "Tax Due"
-TOTAL_LABEL = "Total"
+from financial_simulator.lib.reports import render_tax_bands, render_tax_calculations
+
+from .tax_band_data import TAX_BAND_DATA_CACHE, TaxBandData
 
 
 def format_float(amount: float | None) -> str:
@@ -47,26 +48,30 @@ class TaxCalculation(object):
 
 
 class TaxCalculations(object):
-    labels: List[str]
-    rates: List[str]
-    calculations: List[TaxCalculation]
+    bands: "TaxBands"
+    total_taxable: float
     taxable: float
     tax_due: float
 
-    def __init__(
-        self, labels: List[str], rates: List[str], calculations: List[TaxCalculation]
-    ):
-        self.labels = labels
-        self.rates = rates
-        self.calculations = calculations
-        taxable, tax_due = zip(
-            *[
-                (calculation.taxable, calculation.tax_due)
-                for calculation in self.calculations
-            ]
-        )
-        self.taxable = sum(taxable)
-        self.tax_due = sum(tax_due)
+    def __init__(self, bands: "TaxBands", total_taxable: float):
+        # The totals come from the compiled bands, the breakdown per band is
+        # only calculated and formatted if a report asks for it
+        self.bands = bands
+        self.total_taxable = total_taxable
+        self.taxable = max(total_taxable - bands.thresholds[0], 0)
+        self.tax_due = bands.tax_due(total_taxable)
+
+    @cached_property
+    def calculations(self) -> List[TaxCalculation]:
+        return [band.calculate(self.total_taxable) for band in self.bands.bands]
+
+    @property
+    def labels(self) -> List[str]:
+        return self.bands.format_columns()[0]
+
+    @property
+    def rates(self) -> List[str]:
+        return self.bands.format_columns()[1]
 
     def format_columns(self) -> Tuple[List[str], List[str]]:
         taxable_portions: List[str]
@@ -80,17 +85,7 @@ class TaxCalculations(object):
         return f"{format_float(self.taxable)}", f"{format_float(self.tax_due)}"
 
     def __str__(self) -> str:
-        taxable_portions, tax_due_portions = self.format_columns()
-        taxable, tax_due = self.format_totals()
-        table = PrettyTable()
-        table.set_style(TableStyle.SINGLE_BORDER)
-        table.add_column(LABEL_COLUMN_NAME, self.labels, "l")
-        table.add_column(RATE_COLUMN_NAME, self.rates, "r")
-        table.add_column(TAXABLE_COLUMN_NAME, taxable_portions, "r")
-        table.add_column(TAX_DUE_COLUMN_NAME, tax_due_portions, "r")
-        table.add_divider()
-        table.add_row(["", TOTAL_LABEL, taxable, tax_due])
-        return table.get_string()  # type: ignore
+        return render_tax_calculations(self)
 
 
 class TaxBand(object):
@@ -131,10 +126,16 @@ class TaxBand(object):
 
 class TaxBands(object):
     bands: List[TaxBand]
+    thresholds: Sequence[float]
+    rates: Sequence[float]
+    cumulative_tax: Sequence[float]
+    threshold_array: npt.NDArray[np.float64]
+    rate_array: npt.NDArray[np.float64]
+    cumulative_tax_array: npt.NDArray[np.float64]
 
     def __init__(self, bands: Dict[float, float]):
         sorted_bands = sorted(bands.items())
-        if not bands[0.0]:
+        if 0.0 not in bands:
             # if no band is specified for above 0, then assume
             # the rate up to the first band is 0.0
             sorted_bands = [(0.0, 0.0)] + sorted_bands
@@ -147,12 +148,43 @@ class TaxBands(object):
             last_rate = rate
             last_above = above
         self.bands.append(TaxBand(last_above, None, last_rate))  # type: ignore
+        # Compile the bands into a piecewise linear function, the tax due at
+        # each threshold being the tax on all of the bands below it
+        self.thresholds = tuple(band.lower for band in self.bands)
+        self.rates = tuple(band.rate for band in self.bands)
+        cumulative_tax = [0.0]
+        for band in self.bands[:-1]:
+            cumulative_tax.append(
+                cumulative_tax[-1] + (band.upper - band.lower) * band.rate  # type: ignore
+            )
+        self.cumulative_tax = tuple(cumulative_tax)
+        self.threshold_array = np.array(self.thresholds, dtype=np.float64)
+        self.rate_array = np.array(self.rates, dtype=np.float64)
+        self.cumulative_tax_array = np.array(self.cumulative_tax, dtype=np.float64)
+
+    def tax_due(self, taxable: float) -> float:
+        # the band that the taxable amount reaches into is the last one with
+        # a threshold below it
+        index = bisect_left(self.thresholds, taxable) - 1
+        if index < 0:
+            return 0.0
+        return (
+            self.cumulative_tax[index]
+            + (taxable - self.thresholds[index]) * self.rates[index]
+        )
 
-    def calculate(self, taxable: float):
-        labels, rates = self.format_columns()
-        return TaxCalculations(
-            labels, rates, [band.calculate(taxable) for band in self.bands]
+    def tax_due_array(self, taxable: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        taxable = np.asarray(taxable, dtype=np.float64)
+        indices = np.searchsorted(self.threshold_array, taxable, side="left") - 1
+        clipped = np.maximum(indices, 0)
+        tax_due = (
+            self.cumulative_tax_array[clipped]
+            + (taxable - self.threshold_array[clipped]) * self.rate_array[clipped]
         )
+        return np.where(indices < 0, 0.0, tax_due)
+
+    def calculate(self, taxable: float) -> TaxCalculations:
+        return TaxCalculations(self, taxable)
 
     def format_columns(self) -> Tuple[List[str], List[str]]:
         labels: List[str]
@@ -161,36 +193,75 @@ class TaxBands(object):
         return labels, rates
 
     def __str__(self):
-        labels, rates = self.format_columns()
-        table = PrettyTable()
-        table.set_style(TableStyle.SINGLE_BORDER)
-        table.add_column(LABEL_COLUMN_NAME, labels, "l")
-        table.add_column(RATE_COLUMN_NAME, rates, "r")
-        return table.get_string()  # type: ignore
+        return render_tax_bands(self)
+
+
+# The bands compiled from each loaded data set, so that constructing another
+# TaxBandsByYear from the same file does not rebuild them
+_compiled_bands: WeakKeyDictionary[TaxBandData, Dict[int, TaxBands]] = (
+    WeakKeyDictionary()
+)
+
+
+def _compile_bands(data: TaxBandData) -> Dict[int, TaxBands]:
+    years = _compiled_bands.get(data)
+    if years is None:
+        years = {
+            int(year): TaxBands(data.year_bands(index))
+            for index, year in enumerate(data.years)
+        }
+        _compiled_bands[data] = years
+    return years
 
 
 class TaxBandsByYear(object):
-    def __init__(self, data_file: str):
-        years: Dict[int, TaxBands]
-
-        # Load the tax bands and sort them by year and threshold
-        with open(data_file) as f:
-            data = json.load(f)
-            years: Dict[int, TaxBands] = {}
-            for year_bands in data:
-                year = year_bands["year"]
-                bands: Dict[float, float] = {}
-                for band in year_bands["bands"]:
-                    bands[band["above"]] = band["rate"]
-                years[year] = TaxBands(bands)
-            self.years = dict(sorted(years.items()))
+    def __init__(self, data_file: str, sidecar: bool = False):
+        # Load the compiled tax bands, sorted by year and threshold
+        self.data = TAX_BAND_DATA_CACHE.load(data_file, sidecar)
+        self.years = _compile_bands(self.data)
+        self.year_keys = tuple(self.years.keys())
+        self.year_bands = tuple(self.years.values())
 
     def get_bands(self, year: int) -> TaxBands:
         # Search for the year equal to or lower than the required year.
         # We assume that if we do not have bands for a year, then the bands
         # have not changed since the previous year. If we cannot find a band
         # equal to or lower than the required year, then we throw an error
-        bands = [b for y, b in self.years.items() if y <= year]
-        if not bands:
+        index = bisect_right(self.year_keys, year) - 1
+        if index < 0:
             raise Exception("No bands found for year {}".format(year))
-        return bands[-1]
+        return self.year_bands[index]
+
+    def __year_indices(self, years: npt.ArrayLike) -> npt.NDArray[np.intp]:
+        years = np.asarray(years)
+        indices = np.searchsorted(self.year_keys, years, side="right") - 1
+        if np.any(indices < 0):
+            raise Exception(
+                "No bands found for year {}".format(years[indices < 0].min())
+            )
+        return indices
+
+    def calculate_batch(
+        self, taxable: npt.ArrayLike, years: npt.ArrayLike
+    ) -> npt.NDArray[np.float64]:
+        # Evaluate each distinct year's bands over all of the amounts that
+        # fall in it, there are far fewer years than scenarios or paths
+        amounts, indices = np.broadcast_arrays(
+            np.asarray(taxable, dtype=np.float64), self.__year_indices(years)
+        )
+        tax_due = np.zeros(amounts.shape, dtype=np.float64)
+        for index in np.unique(indices):
+            in_year = indices == index
+            tax_due[in_year] = self.year_bands[index].tax_due_array(amounts[in_year])
+        return tax_due
+
+    def calculate_breakdowns(
+        self, taxable: npt.ArrayLike, years: npt.ArrayLike
+    ) -> List[TaxCalculations]:
+        amounts, indices = np.broadcast_arrays(
+            np.asarray(taxable, dtype=np.float64), self.__year_indices(years)
+        )
+        return [
+            self.year_bands[index].calculate(float(amount))
+            for amount, index in zip(amounts.ravel(), indices.ravel())
+        ]
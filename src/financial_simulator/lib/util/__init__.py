@@ -1 +1,7 @@
+from .bands import Band, BandTable, create_bands
 
+__all__ = [
+    "Band",
+    "BandTable",
+    "create_bands",
+]
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
+from bisect import bisect_left
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import List, Mapping, Sequence, Tuple, TypeVar
 
+import numpy as np
+import numpy.typing as npt
+
 T = TypeVar("T")
 
 
@@ -44,6 +50,74 @@ class Band:
         else:
             return [Decimal("0.0")] * len(amounts)
 
+    def portion_arrays(
+        self, balances: npt.NDArray[np.float64], accrued: npt.NDArray[np.float64]
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        # portion([balance, accrued]) for arrays of balances and accrued amounts
+        lower = float(self.lower)
+        remainder = balances + accrued - lower
+        to_allocate = (
+            remainder if self.size is None else np.minimum(remainder, float(self.size))
+        )
+        balance_portions = np.where(
+            balances - lower > 0,
+            np.minimum(np.minimum(to_allocate, balances - lower), balances),
+            0.0,
+        )
+        accrued_portions = np.minimum(
+            np.minimum(to_allocate - balance_portions, remainder), accrued
+        )
+        active = remainder > 0
+        return (
+            np.where(active, balance_portions, 0.0),
+            np.where(active, accrued_portions, 0.0),
+        )
+
+
+@dataclass(frozen=True)
+class BandTable:
+    # Bands compiled into sorted boundaries, the lower bounds being the
+    # cumulative widths of the bands below, so that the bands an amount
+    # reaches can be found by bisection
+    lowers: Sequence[Decimal]
+    sizes: Sequence[Decimal | None]
+
+    @staticmethod
+    def create(bands: Sequence[Band]) -> BandTable:
+        return BandTable(
+            lowers=tuple(band.lower for band in bands),
+            sizes=tuple(band.size for band in bands),
+        )
+
+    def active_count(self, amount: Decimal) -> int:
+        # the number of bands that the amount reaches into, bands are only
+        # reached if the amount is above their lower bound
+        return bisect_left(self.lowers, amount)
+
+    def portions(
+        self, balance: Decimal, accrued: Decimal
+    ) -> Sequence[Tuple[Decimal, Decimal]]:
+        # Band.portion([balance, accrued]) for the bands that the total
+        # reaches into, the bands above would all be zero
+        total = balance + accrued
+        portions: List[Tuple[Decimal, Decimal]] = []
+        for index in range(self.active_count(total)):
+            lower = self.lowers[index]
+            size = self.sizes[index]
+            remainder = total - lower
+            to_allocate = remainder if size is None else min(remainder, size)
+            if balance > lower:
+                balance_portion = min(to_allocate, balance - lower, balance)
+            else:
+                balance_portion = Decimal("0.0")
+            portions.append(
+                (
+                    balance_portion,
+                    min(to_allocate - balance_portion, remainder, accrued),
+                )
+            )
+        return portions
+
 
 def create_bands(raw_bands: Mapping[Decimal, T]) -> Sequence[Tuple[Band, T]]:
     bands: List[Tuple[Band, T]] = []
@@ -1,6 +1,7 @@
 from calendar import isleap, monthrange
 from datetime import date
 from functools import cache
+from typing import Iterator, Tuple
 
 DAYS_IN_REGULAR_YEAR = 365
 DAYS_IN_LEAP_YEAR = 366
@@ -14,3 +15,17 @@ def correct_day_of_the_month(day: int, current_date: date) -> int:
 @cache
 def days_in_year(year: int) -> int:
     return DAYS_IN_LEAP_YEAR if isleap(year) else DAYS_IN_REGULAR_YEAR
+
+
+def corrected_date(year: int, month: int, day: int) -> date:
+    _, days_in_month = monthrange(year, month)
+    return date(year, month, days_in_month if day > days_in_month else day)
+
+
+def year_spans(start: date, end: date) -> Iterator[Tuple[int, int]]:
+    # The years covered by the days from start to end inclusive, with the
+    # number of those days that fall in each year
+    for year in range(start.year, end.year + 1):
+        first = start if year == start.year else date(year, 1, 1)
+        last = end if year == end.year else date(year, 12, 31)
+        yield year, (last - first).days + 1
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, replace
+from decimal import Decimal
+from typing import Self, Sequence, Tuple
+
+from financial_simulator.lib.accounting import Change, Transaction
+from financial_simulator.lib.actions import Action, TickAction
+from financial_simulator.lib.entities import Entity
+from financial_simulator.lib.providers import Provider
+from financial_simulator.lib.util.immutable import provider_get
+
+CASH = ("assets", "cash")
+EQUITY = ("liabilities", "equity")
+
+
+@dataclass(frozen=True)
+class MockIncomeEntity(Entity):
+    # enters each amount provided on a tick as cash paid in from equity
+    income: Provider[Decimal] | None
+
+    def _on_action(self, action: Action) -> Tuple[Self, Sequence[Action]]:
+        if isinstance(action, TickAction):
+            entity, amounts = provider_get(self, self.income, "income", action.current_date)
+            return replace(
+                entity,
+                books=entity.books.enter_transactions(
+                    tuple(
+                        Transaction(
+                            transaction_date=action.current_date,
+                            description="Income",
+                            changes=(
+                                Change(amount=-amount, account_path=CASH),
+                                Change(amount=amount, account_path=EQUITY),
+                            ),
+                        )
+                        for amount in amounts
+                    )
+                ),
+            ), ()
+        return self, ()
+
+
+@dataclass(frozen=True)
+class MockCountingEntity(Entity):
+    ticks: int = 0
+
+    def _on_action(self, action: Action) -> Tuple[Self, Sequence[Action]]:
+        if isinstance(action, TickAction):
+            return replace(self, ticks=self.ticks + action.days), ()
+        return self, ()
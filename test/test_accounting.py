@@ -1,10 +1,14 @@
-from datetime import date
+import pickle
+from dataclasses import replace
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Generator
+from typing import Generator, Tuple
 
 from pytest import raises
 
-from financial_simulator.lib.accounting import Books, Account, Change, Transaction
+from financial_simulator.lib.accounting import Books, Account, AccountPath, Change, Transaction, Journal, FlatBooks
+from financial_simulator.lib.accounting.account_path import MAX_INTERNED_ACCOUNT_PATHS
+from financial_simulator.lib.accounting.journal import SEGMENT_SIZE
 
 
 def generate_books() -> Generator[Books, None, None]:
@@ -109,3 +113,144 @@ def test_unbalanced_transaction():
                                     account_path=('Test account 2',)),
                              Change(amount=Decimal('-50.0'),
                                     account_path=('Test account 3',))))
+
+
+def generate_transactions(count: int) -> Tuple[Transaction, ...]:
+    return tuple(Transaction(transaction_date=date(2020, 1, 1) + timedelta(days=day),
+                             description=f'Test transaction {day}',
+                             changes=(Change(amount=Decimal(day),
+                                             account_path=('Test account 1',)),
+                                      Change(amount=Decimal(-day),
+                                             account_path=('Test account 2',))))
+                 for day in range(count))
+
+
+def test_journal_append():
+    transactions = generate_transactions(SEGMENT_SIZE * 3 + 5)
+    journal = Journal.create()
+    for transaction in transactions:
+        journal = journal.append(transaction)
+    assert len(journal) == len(transactions)
+    assert tuple(journal) == transactions
+    assert journal == transactions
+    assert journal == Journal.create(transactions)
+    assert journal[0] == transactions[0]
+    assert journal[SEGMENT_SIZE] == transactions[SEGMENT_SIZE]
+    assert journal[-1] == transactions[-1]
+    assert journal[10:20] == transactions[10:20]
+    with raises(IndexError):
+        _ = journal[len(transactions)]
+
+
+def test_journal_is_persistent():
+    transactions = generate_transactions(SEGMENT_SIZE * 2)
+    journal = Journal.create(transactions[:SEGMENT_SIZE])
+    first = journal.append(transactions[SEGMENT_SIZE])
+    second = journal.extend(transactions[SEGMENT_SIZE + 1:])
+    assert journal == transactions[:SEGMENT_SIZE]
+    assert first == transactions[:SEGMENT_SIZE + 1]
+    assert second == transactions[:SEGMENT_SIZE] + transactions[SEGMENT_SIZE + 1:]
+
+
+def test_journal_between():
+    transactions = generate_transactions(SEGMENT_SIZE * 3)
+    journal = Journal.create(transactions)
+    assert journal.between(date(2020, 1, 1) + timedelta(days=70),
+                           date(2020, 1, 1) + timedelta(days=150)) == transactions[70:150]
+    assert journal.between(from_date=date(2020, 1, 1) + timedelta(days=100)) == transactions[100:]
+    assert journal.between(until_date=date(2020, 1, 1) + timedelta(days=10)) == transactions[:10]
+
+
+def test_account_lookup():
+    account = Account(name='Ledger', sub_accounts=())
+    for index in range(100):
+        account = account.enter_transaction((Change(amount=Decimal(index),
+                                                    account_path=(f'Account {index}', 'Sub account')),
+                                             Change(amount=Decimal(-index),
+                                                    account_path=('Equity',))))
+    assert account.get_balance(('Account 42', 'Sub account')) == Decimal(42)
+    assert account.get_total_balance(('Account 42',)) == Decimal(42)
+    assert account.get_balance(('Account 42',)) == Decimal('0.0')
+    assert account.get_balance(('Unknown account',)) == Decimal('0.0')
+    assert account.get_total_balance(('Equity',)) == Decimal(-sum(range(100)))
+    assert account.get_total_balance(()) == Decimal(0)
+    assert account == Account(name='Ledger', sub_accounts=tuple(account.sub_accounts))
+    replaced = replace(account, sub_accounts=tuple(reversed(account.sub_accounts)))
+    assert replaced.get_balance(('Account 42', 'Sub account')) == Decimal(42)
+    assert replaced.get_total_balance(('Equity',)) == Decimal(-sum(range(100)))
+    # the index is carried across entered changes, not rebuilt
+    assert account.sub_account_index == {sub_account.name: position
+                                         for position, sub_account in enumerate(account.sub_accounts)}
+    changed = account.enter_transaction((Change(amount=Decimal(1), account_path=('Equity',)),))
+    assert changed.sub_account_index is account.sub_account_index
+
+
+def test_account_path():
+    account_path = AccountPath(('assets', 'bank_accounts', 'current'))
+    assert account_path is AccountPath(['assets', 'bank_accounts', 'current'])
+    assert account_path == ('assets', 'bank_accounts', 'current')
+    assert hash(account_path) == hash(('assets', 'bank_accounts', 'current'))
+    assert pickle.loads(pickle.dumps(account_path)) is account_path
+
+
+def test_account_path_interning_is_bounded():
+    first = AccountPath(('generated', 'first'))
+    for index in range(MAX_INTERNED_ACCOUNT_PATHS):
+        AccountPath(('generated', str(index)))
+    assert AccountPath(('generated', 'first')) == first
+    assert AccountPath(('generated', 'first')) is not first
+
+
+def test_flat_books():
+    books = Books.create_empty(date(2020, 1, 1))
+    flat_books = FlatBooks.create_empty(date(2020, 1, 1))
+    for transaction in generate_transactions(10) + (Transaction(transaction_date=date(2020, 1, 11),
+                                                                description='Nested transaction',
+                                                                changes=(Change(amount=Decimal('12.5'),
+                                                                                account_path=('Test account 3', 'A')),
+                                                                         Change(amount=Decimal('-12.5'),
+                                                                                account_path=('Test account 1', 'B')))),):
+        books = books.enter_transaction(transaction)
+        flat_books = flat_books.enter_transaction(transaction)
+    assert flat_books.journal == books.journal
+    assert flat_books.ledger == books.ledger
+    assert flat_books.get_open_changes() == books.ledger.get_open_changes()
+    for account_path in (('Test account 1',), ('Test account 1', 'B'), ('Test account 3', 'A'), ('Unknown',), ()):
+        assert flat_books.get_balance(account_path) == books.get_balance(account_path)
+        assert flat_books.get_total_balance(account_path) == books.get_total_balance(account_path)
+    assert flat_books.open_journal(date(2020, 1, 12)).journal == books.open_journal(date(2020, 1, 12)).journal
+
+
+def test_flat_books_rounding():
+    flat_books = FlatBooks.create(Transaction(transaction_date=date(2020, 1, 1),
+                                              description='Fractional transaction',
+                                              changes=(Change(amount=Decimal('0.0000005'),
+                                                              account_path=('Test account 1',)),
+                                                       Change(amount=Decimal('0.0000005'),
+                                                              account_path=('Test account 2',)),
+                                                       Change(amount=Decimal('-0.000001'),
+                                                              account_path=('Test account 3',)))),
+                                  scale=10 ** 6)
+    assert flat_books.get_total_balance(()) == Decimal('0.0')
+    assert flat_books.get_balance(('Test account 3',)) == Decimal('-0.000001')
+    assert flat_books.get_balance(('Test account 1',)) + flat_books.get_balance(('Test account 2',)) == Decimal('0.000001')
+
+
+def test_enter_transactions():
+    transactions = generate_transactions(5) + (Transaction(transaction_date=date(2020, 1, 6),
+                                                           description='Nested transaction',
+                                                           changes=(Change(amount=Decimal('12.5'),
+                                                                           account_path=('Test account 3', 'A')),
+                                                                    Change(amount=Decimal('-12.5'),
+                                                                           account_path=('Test account 1', 'B')))),)
+    books = Books.create_empty(date(2020, 1, 1))
+    flat_books = FlatBooks.create_empty(date(2020, 1, 1))
+    expected = books
+    for transaction in transactions:
+        expected = expected.enter_transaction(transaction)
+    assert books.enter_transactions(transactions) == expected
+    assert books.enter_transactions(()) is books
+    assert flat_books.enter_transactions(transactions).ledger == expected.ledger
+    assert books.ledger.enter_changes(tuple(change
+                                            for transaction in transactions
+                                            for change in transaction.changes)) == expected.ledger
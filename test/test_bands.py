@@ -2,7 +2,7 @@ from decimal import Decimal
 
 from pytest import raises
 
-from financial_simulator.lib.util import create_bands, Band
+from financial_simulator.lib.util import create_bands, Band, BandTable
 
 
 def test_create_bands():
@@ -54,3 +54,23 @@ def test_band_portion_spread():
                                                         Decimal('500.0'),
                                                         Decimal('500.0'),
                                                         Decimal('0.0'))
+
+
+def test_band_table():
+    bands = create_bands({Decimal('0.0'): 'band 1',
+                          Decimal('1000.0'): 'band 2',
+                          Decimal('3000.0'): 'band 3', })
+    table = BandTable.create(tuple(band for band, _ in bands))
+    assert table.active_count(Decimal('0.0')) == 0
+    assert table.active_count(Decimal('1000.0')) == 1
+    assert table.active_count(Decimal('1000.01')) == 2
+    assert table.active_count(Decimal('5000.0')) == 3
+    for balance, accrued in ((Decimal('-10.0'), Decimal('0.0')),
+                             (Decimal('500.0'), Decimal('20.0')),
+                             (Decimal('990.0'), Decimal('20.0')),
+                             (Decimal('2000.0'), Decimal('-5.0')),
+                             (Decimal('3500.0'), Decimal('100.0'))):
+        portions = table.portions(balance, accrued)
+        expected = tuple(tuple(band.portion([balance, accrued])) for band, _ in bands)
+        assert tuple(portions) == expected[:len(portions)]
+        assert all(portion == (Decimal('0.0'), Decimal('0.0')) for portion in expected[len(portions):])
@@ -0,0 +1,79 @@
+import pickle
+import zlib
+from dataclasses import replace
+from datetime import date, timedelta
+from itertools import islice
+from typing import Sequence
+
+import pytest
+
+from financial_simulator import FinancialSimulator
+from financial_simulator.lib.accounting import Books
+from financial_simulator.lib.checkpoints import (
+    Checkpoint,
+    CheckpointError,
+    Checkpointer,
+)
+from financial_simulator.lib.checkpoints.checkpoint import HEADER
+from financial_simulator.lib.entities import Entity
+from mock_entities import MockCountingEntity
+
+INITIAL_DATE = date(2020, 1, 1)
+EMPTY_BOOKS = Books.create_empty(INITIAL_DATE)
+
+
+def create_entities() -> Sequence[Entity]:
+    return (
+        MockCountingEntity("Entity 1", EMPTY_BOOKS),
+        MockCountingEntity("Entity 2", EMPTY_BOOKS, 10),
+    )
+
+
+def test_checkpoint_bytes():
+    checkpoint = Checkpoint(INITIAL_DATE, create_entities())
+    data = checkpoint.to_bytes()
+    assert data[:4] == b"FSCP"
+    assert Checkpoint.read_date(data) == INITIAL_DATE
+    assert Checkpoint.from_bytes(data) == replace(
+        checkpoint, entities=tuple(checkpoint.entities)
+    )
+    with pytest.raises(CheckpointError):
+        Checkpoint.from_bytes(b"XXXX" + data[4:])
+    with pytest.raises(CheckpointError):
+        Checkpoint.from_bytes(data[:4] + b"\x00\x63" + data[6:])
+    with pytest.raises(CheckpointError):
+        Checkpoint.from_bytes(data[:3])
+    header = data[:HEADER.size]
+    payload = pickle.dumps(tuple(checkpoint.entities))
+    for corrupt_payload in (data[HEADER.size:-4], zlib.compress(payload[:len(payload) // 2]),
+                            zlib.compress(b"not a pickle"), zlib.compress(payload.replace(b"Entity", b"Xntity")),
+                            # a pickle that raises KeyError while it is loaded
+                            zlib.compress(b"coperator\ngetitem\n(}S'x'\ntR.")):
+        with pytest.raises(CheckpointError, match="corrupt"):
+            Checkpoint.from_bytes(header + corrupt_payload)
+
+
+def test_checkpoint_interval_and_retention(tmp_path):
+    checkpointer = Checkpointer(tmp_path, interval_days=10, retention=2)
+    engine = FinancialSimulator(INITIAL_DATE, create_entities(), checkpointer=checkpointer)
+    tuple(islice(engine, 45))
+    assert [path.name for path in checkpointer.paths()] == [
+        "checkpoint-2020-01-31.fscp",
+        "checkpoint-2020-02-10.fscp",
+    ]
+    latest = checkpointer.latest()
+    assert latest is not None
+    assert latest.current_date == INITIAL_DATE + timedelta(days=40)
+    assert tuple(entity.ticks for entity in latest.entities) == (40, 50)
+
+
+def test_resume(tmp_path):
+    checkpointer = Checkpointer(tmp_path, interval_days=7)
+    expected = tuple(islice(FinancialSimulator(INITIAL_DATE, create_entities()), 30))
+    tuple(islice(FinancialSimulator(INITIAL_DATE, create_entities(), checkpointer=checkpointer), 17))
+    latest = checkpointer.latest()
+    assert latest is not None
+    assert latest.current_date == INITIAL_DATE + timedelta(days=14)
+    engine = FinancialSimulator.resume(latest, checkpointer=checkpointer)
+    assert tuple(islice(engine, 16)) == expected[14:]
+    assert checkpointer.latest().current_date == INITIAL_DATE + timedelta(days=28)
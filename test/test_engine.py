@@ -1,12 +1,18 @@
 from dataclasses import dataclass, replace
 from datetime import date, timedelta
-from itertools import islice
+from decimal import Decimal
+from itertools import islice, takewhile
 from typing import Tuple, Self, Sequence
 
 from financial_simulator import FinancialSimulator
-from financial_simulator.lib.accounting import Books
+from financial_simulator.lib.accounting import Books, Change, Transaction
 from financial_simulator.lib.actions import Action, TickAction
-from financial_simulator.lib.entities import Entity
+from financial_simulator.lib.entities import Entity, Individual
+from financial_simulator.lib.factories.bank_accounts import create_abn_amro_personal_current, \
+    create_abn_amro_personal_savings
+from financial_simulator.lib.providers import NeverProvider
+from financial_simulator.lib.rates import DAILY_RATE_TABLE
+from financial_simulator.lib.scenarios import Scenario, run_scenario
 
 
 @dataclass(frozen=True)
@@ -64,3 +70,120 @@ def test_iterator():
                                                  MockEntity('Entity 3', EMPTY_BOOKS, DAY_3, 'Entity 1', ('Entity 2',
                                                                                                          'Entity 2',
                                                                                                          'Entity 2')))))
+
+
+@dataclass(frozen=True)
+class MockPeriodicEntity(Entity):
+    period: int
+    until: date
+    ticks: Sequence[Tuple[date, int]] = ()
+
+    def next_tick(self, after: date) -> date | None:
+        next_tick = after + timedelta(days=self.period - (after - INITIAL_DATE).days % self.period)
+        return next_tick if next_tick <= self.until else None
+
+    def _on_action(self, action: Action) -> Tuple[Self, Sequence[Action]]:
+        if isinstance(action, TickAction):
+            return replace(self, ticks=tuple(self.ticks) + ((action.current_date, action.days),)), ()
+        return self, ()
+
+
+def test_skip_idle_days():
+    engine = FinancialSimulator(INITIAL_DATE,
+                                (MockPeriodicEntity('Entity 1', EMPTY_BOOKS, 3, INITIAL_DATE + timedelta(days=9)),
+                                 MockPeriodicEntity('Entity 2', EMPTY_BOOKS, 4, INITIAL_DATE + timedelta(days=8))),
+                                skip_idle_days=True)
+    days = tuple(engine)
+    assert tuple(current_date for current_date, _ in days) == (INITIAL_DATE + timedelta(days=3),
+                                                               INITIAL_DATE + timedelta(days=4),
+                                                               INITIAL_DATE + timedelta(days=6),
+                                                               INITIAL_DATE + timedelta(days=8),
+                                                               INITIAL_DATE + timedelta(days=9))
+    _, entities = days[-1]
+    assert entities[0].ticks == ((INITIAL_DATE + timedelta(days=3), 3),
+                                 (INITIAL_DATE + timedelta(days=4), 1),
+                                 (INITIAL_DATE + timedelta(days=6), 2),
+                                 (INITIAL_DATE + timedelta(days=8), 2),
+                                 (INITIAL_DATE + timedelta(days=9), 1))
+
+
+def test_skip_idle_days_default_daily():
+    engine = FinancialSimulator(INITIAL_DATE, INITIAL_ENTITIES, skip_idle_days=True)
+    assert tuple(current_date for current_date, _ in islice(engine, 3)) == (DAY_1, DAY_2, DAY_3)
+
+
+def test_final_date():
+    engine = FinancialSimulator(INITIAL_DATE, INITIAL_ENTITIES, final_date=DAY_3)
+    assert tuple(current_date for current_date, _ in engine) == (DAY_1, DAY_2, DAY_3)
+    # the day after the final date is never simulated
+    assert engine.current_date == DAY_3
+    engine = FinancialSimulator(INITIAL_DATE,
+                                (MockPeriodicEntity('Entity 1', EMPTY_BOOKS, 3, INITIAL_DATE + timedelta(days=9)),),
+                                skip_idle_days=True, final_date=INITIAL_DATE + timedelta(days=5))
+    assert tuple(current_date for current_date, _ in engine) == (INITIAL_DATE + timedelta(days=3),)
+    assert engine.current_date == INITIAL_DATE + timedelta(days=3)
+
+
+def test_action_routing():
+    engine = FinancialSimulator(INITIAL_DATE,
+                                INITIAL_ENTITIES + (MockEntity('Entity 4', EMPTY_BOOKS, INITIAL_DATE, 'Nobody'),))
+    for _ in range(2):
+        _, entities = next(engine)
+        assert engine.broadcast_actions == 1
+        assert engine.routed_actions == 4
+    assert tuple(entity.action_sources for entity in entities) == (('Entity 3', 'Entity 3'),
+                                                                   ('Entity 1', 'Entity 1'),
+                                                                   ('Entity 2', 'Entity 2'),
+                                                                   ())
+
+
+def create_individual() -> Individual:
+    return Individual(name='jack',
+                      books=Books.create(Transaction(
+                          transaction_date=INITIAL_DATE,
+                          description='Initial transaction',
+                          changes=(Change(amount=Decimal('-100.0'), account_path=('assets', 'bank_accounts', 'current')),
+                                   Change(amount=Decimal('-5000.0'),
+                                          account_path=('assets', 'bank_accounts', 'savings')),
+                                   Change(amount=Decimal('5100.0'), account_path=('liabilities', 'equity'))))),
+                      expenses=NeverProvider(),
+                      bank_accounts=(create_abn_amro_personal_current('current'),
+                                     create_abn_amro_personal_savings('savings')),
+                      investments=(),
+                      properties=(),
+                      loans=())
+
+
+def test_skip_idle_days_bank_accounts():
+    end_date = INITIAL_DATE + timedelta(days=400)
+    daily = {current_date: entities[0].books
+             for current_date, entities in islice(FinancialSimulator(INITIAL_DATE, (create_individual(),)), 400)}
+    skipped = tuple(takewhile(lambda day: day[0] <= end_date,
+                              FinancialSimulator(INITIAL_DATE, (create_individual(),), skip_idle_days=True)))
+    # only the days on which fees and interest are due or paid are ticked
+    assert len(skipped) < 400 / 4
+    assert skipped[0][0] == date(2020, 1, 15)
+    for current_date, entities in skipped:
+        books = entities[0].books
+        for account_path in (('assets', 'bank_accounts', 'current'),
+                             ('assets', 'bank_accounts', 'savings'),
+                             ('receivable', 'bank_accounts', 'interest', 'savings'),
+                             ('payable', 'assets', 'bank_accounts', 'fees', 'current'),
+                             ('income', 'assets', 'bank_accounts', 'interest', 'savings')):
+            assert abs(books.get_balance(account_path) - daily[current_date].get_balance(account_path)) < Decimal(
+                '1e-20')
+    savings = skipped[-1][1][0].books.get_balance(('assets', 'bank_accounts', 'savings'))
+    assert Decimal('-5070') < savings < Decimal('-5060')
+
+
+def test_precompute_daily_rates():
+    DAILY_RATE_TABLE.clear()
+    create_individual().precompute_daily_rates(range(2020, 2022))
+    # one daily rate per band of the savings account per year
+    assert len(DAILY_RATE_TABLE) == 6
+    tuple(islice(FinancialSimulator(INITIAL_DATE, (create_individual(),)), 400))
+    assert len(DAILY_RATE_TABLE) == 6
+    DAILY_RATE_TABLE.clear()
+    run_scenario(Scenario(name='savings', initial_date=INITIAL_DATE, entities=(create_individual(),),
+                          number_of_days=0, account_paths=()))
+    assert len(DAILY_RATE_TABLE) == 3
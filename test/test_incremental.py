@@ -0,0 +1,103 @@
+from dataclasses import replace
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Sequence
+
+import numpy as np
+
+from financial_simulator.lib.accounting import Books
+from financial_simulator.lib.checkpoints import (
+    content_hash,
+    find_changes,
+    first_changed_date,
+)
+from financial_simulator.lib.entities import Entity
+from financial_simulator.lib.providers import MergeProvider, ScheduledProvider
+from financial_simulator.lib.scenarios import IncrementalSimulator
+from financial_simulator.lib.schedules import DaySchedule, MonthlySchedule
+from mock_entities import CASH, MockIncomeEntity
+
+INITIAL_DATE = date(2019, 12, 31)
+CHANGED_DATE = date(2020, 7, 15)
+
+
+def create_entities(extra: bool) -> Sequence[Entity]:
+    monthly = ScheduledProvider(Decimal("10.0"), MonthlySchedule(1))
+    return (
+        MockIncomeEntity(
+            "Entity 1",
+            Books.create_empty(INITIAL_DATE),
+            MergeProvider((monthly, ScheduledProvider(Decimal("5.0"), DaySchedule(CHANGED_DATE))))
+            if extra
+            else MergeProvider((monthly, ScheduledProvider(Decimal("5.0"), DaySchedule(date(2030, 1, 1))))),
+        ),
+        MockIncomeEntity("Entity 2", Books.create_empty(INITIAL_DATE), monthly),
+    )
+
+
+def test_content_hash():
+    assert content_hash(create_entities(True)) == content_hash(create_entities(True))
+    assert content_hash(create_entities(True)) != content_hash(create_entities(False))
+    assert content_hash(lambda x: x + 1) == content_hash(lambda x: x + 1)
+    assert content_hash(lambda x: x + 1) != content_hash(lambda x: x + 2)
+    assert content_hash(lambda x: [y for y in x]) == content_hash(lambda x: [y for y in x])
+    assert content_hash(lambda x, y=1: x + y) != content_hash(lambda x, y=2: x + y)
+    assert content_hash(np.arange(1000)) == content_hash(np.arange(1000))
+    assert content_hash(np.arange(1000)) != content_hash(np.arange(1000).reshape(10, 100))
+    changed = np.arange(1000)
+    changed[500] = 0
+    assert content_hash(np.arange(1000)) != content_hash(changed)
+
+
+def test_first_changed_date():
+    old, new = create_entities(False), create_entities(True)
+    assert tuple(path for path, _, _ in find_changes(old, new)) == ((0, "income"),)
+    assert first_changed_date(old, new, INITIAL_DATE, date(2021, 1, 1)) == CHANGED_DATE
+    assert first_changed_date(old, new, INITIAL_DATE, date(2020, 6, 1)) is None
+    assert first_changed_date(old, old, INITIAL_DATE, date(2021, 1, 1)) is None
+    changed_books = replace(old[1], books=Books.create_empty(date(2019, 12, 30)))
+    assert first_changed_date(old, (old[0], changed_books), INITIAL_DATE,
+                              date(2021, 1, 1)) == INITIAL_DATE + timedelta(days=1)
+
+
+def test_incremental_simulation():
+    full = IncrementalSimulator(account_paths=(CASH,)).simulate(INITIAL_DATE, create_entities(True), 500)
+    simulator = IncrementalSimulator(account_paths=(CASH,), interval_days=30)
+    simulator.simulate(INITIAL_DATE, create_entities(False), 500)
+    assert simulator.resumed_from == INITIAL_DATE
+    incremental = simulator.simulate(INITIAL_DATE, create_entities(True), 500)
+    assert simulator.resumed_from == INITIAL_DATE + timedelta(days=180)
+    assert np.array_equal(incremental.dates(), full.dates())
+    assert np.array_equal(incremental.balances(), full.balances())
+    assert incremental.balances()[-1, 0] == -175.0
+    simulator.simulate(INITIAL_DATE, create_entities(True), 400)
+    assert simulator.resumed_from == INITIAL_DATE + timedelta(days=400)
+    longer = simulator.simulate(INITIAL_DATE, create_entities(True), 600)
+    assert simulator.resumed_from == INITIAL_DATE + timedelta(days=480)
+    assert np.array_equal(longer.balances()[:500], full.balances())
+    assert len(longer.dates()) == 600
+
+
+def test_incremental_simulation_skipping_idle_days():
+    full = IncrementalSimulator(account_paths=(CASH,)).simulate(INITIAL_DATE, create_entities(True), 500)
+    simulator = IncrementalSimulator(account_paths=(CASH,), skip_idle_days=True)
+    simulator.simulate(INITIAL_DATE, create_entities(False), 500)
+    skipped = simulator.simulate(INITIAL_DATE, create_entities(True), 500)
+    assert simulator.resumed_from is not None and simulator.resumed_from > INITIAL_DATE
+    assert skipped.dates()[-1] <= np.datetime64(INITIAL_DATE + timedelta(days=500))
+    assert skipped.balances()[-1, 0] == full.balances()[-1, 0]
+
+
+def test_incremental_simulation_evicts_old_runs():
+    first, second = create_entities(True), create_entities(False)
+    third = (replace(first[0], name="Entity 3"), first[1])
+    simulator = IncrementalSimulator(account_paths=(CASH,), max_runs=2)
+    simulator.simulate(INITIAL_DATE, first, 100)
+    simulator.simulate(INITIAL_DATE, second, 100)
+    simulator.simulate(INITIAL_DATE, first, 100)
+    simulator.simulate(INITIAL_DATE, third, 100)
+    assert len(simulator.runs) == 2
+    simulator.simulate(INITIAL_DATE, first, 100)
+    assert simulator.resumed_from == INITIAL_DATE + timedelta(days=100)
+    simulator.simulate(INITIAL_DATE, second, 100)
+    assert simulator.resumed_from != INITIAL_DATE + timedelta(days=100)
@@ -0,0 +1,105 @@
+from calendar import JANUARY
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+
+from financial_simulator.lib.bank_accounts import BankFee
+from financial_simulator.lib.monte_carlo import (
+    ConstantRateModel,
+    MonteCarloAccount,
+    MonteCarloSimulation,
+    VasicekRateModel,
+)
+from financial_simulator.lib.providers import ScheduledProvider
+from financial_simulator.lib.rates import ContinuousRate, PeriodicRate
+from financial_simulator.lib.schedules import DailySchedule, MonthlySchedule, YearlySchedule
+
+INITIAL_DATE = date(2019, 12, 31)
+SAVINGS = ("assets", "savings")
+
+
+def deterministic_balance(rate, days: int) -> Decimal:
+    balance = Decimal("1000.0")
+    accrued = Decimal("0.0")
+    current_date = INITIAL_DATE
+    for current_date in (date.fromordinal(INITIAL_DATE.toordinal() + day) for day in range(1, days + 1)):
+        accrued += rate.calculate(current_date, balance, accrued).calculation
+        if current_date.month == JANUARY and current_date.day == 1:
+            balance += accrued
+            accrued = Decimal("0.0")
+    return balance
+
+
+def test_constant_rate_matches_rates():
+    for rate, period_count in ((ContinuousRate(Decimal("0.05")), None), (PeriodicRate(Decimal("0.05"), 12), 12)):
+        result = MonteCarloSimulation(
+            initial_date=INITIAL_DATE,
+            number_of_days=367,
+            accounts=(
+                MonteCarloAccount(
+                    account_path=SAVINGS,
+                    initial_balance=Decimal("1000.0"),
+                    rate_model=ConstantRateModel(0.05),
+                    period_count=period_count,
+                    interest_payment_schedule=YearlySchedule(JANUARY, 1),
+                ),
+            ),
+            paths=10,
+            seed=1,
+        ).run()
+        assert len(result.dates) == 367
+        assert result.dates[-1] == np.datetime64(date(2021, 1, 1), "D")
+        expected = float(deterministic_balance(rate, 367))
+        assert np.allclose(result.final_balances[SAVINGS], expected)
+        assert np.allclose(result.bands[SAVINGS][-1], expected)
+
+
+def test_fees():
+    result = MonteCarloSimulation(
+        initial_date=INITIAL_DATE,
+        number_of_days=60,
+        accounts=(
+            MonteCarloAccount(
+                account_path=SAVINGS,
+                initial_balance=Decimal("1000.0"),
+                rate_model=ConstantRateModel(0.0),
+                fees_provider=ScheduledProvider(BankFee("Fee", Decimal("1.0")), DailySchedule()),
+                fee_payment_schedule=MonthlySchedule(1),
+            ),
+        ),
+        paths=3,
+    ).run()
+    assert np.allclose(result.final_balances[SAVINGS], 1000.0 - 32.0)
+
+
+def create_stochastic_simulation(seed: int) -> MonteCarloSimulation:
+    return MonteCarloSimulation(
+        initial_date=INITIAL_DATE,
+        number_of_days=365,
+        accounts=(
+            MonteCarloAccount(
+                account_path=SAVINGS,
+                initial_balance=Decimal("1000.0"),
+                rate_model=VasicekRateModel(0.03, 0.04, 0.5, 0.02),
+                interest_payment_schedule=MonthlySchedule(1),
+            ),
+        ),
+        paths=2000,
+        seed=seed,
+    )
+
+
+def test_stochastic_paths():
+    result = create_stochastic_simulation(42).run()
+    bands = result.bands[SAVINGS]
+    assert bands.shape == (365, 5)
+    assert np.all(np.diff(bands, axis=1) >= 0)
+    assert bands[-1, 0] < bands[-1, -1]
+    assert 1020.0 < bands[-1, 2] < 1045.0
+    data_frame = result.to_data_frame(SAVINGS)
+    assert tuple(data_frame.columns) == ("Date", "P5", "P25", "P50", "P75", "P95")
+    assert np.array_equal(create_stochastic_simulation(42).run().final_balances[SAVINGS],
+                          result.final_balances[SAVINGS])
+    assert not np.array_equal(create_stochastic_simulation(43).run().final_balances[SAVINGS],
+                              result.final_balances[SAVINGS])
@@ -0,0 +1,45 @@
+from datetime import date, timedelta
+from decimal import Decimal, localcontext
+
+from financial_simulator.lib.accounting import Books, FlatBooks, Transaction, create_books
+from financial_simulator.lib.numeric import (
+    DivergenceMonitor,
+    NumericBackend,
+    get_numeric_backend,
+    numeric_backend,
+)
+from financial_simulator.lib.rates import ContinuousRate, PeriodicRate, RateCalculation, create_banded_rate
+
+INITIAL_DATE = date(2020, 1, 1)
+
+
+def test_numeric_backend():
+    assert get_numeric_backend() is NumericBackend.DECIMAL
+    assert isinstance(create_books(Transaction.create_empty_open(INITIAL_DATE)), Books)
+    with numeric_backend(NumericBackend.FLOAT64):
+        assert get_numeric_backend() is NumericBackend.FLOAT64
+        assert isinstance(create_books(Transaction.create_empty_open(INITIAL_DATE)), FlatBooks)
+    assert get_numeric_backend() is NumericBackend.DECIMAL
+
+
+def test_float64_rates():
+    rate = create_banded_rate({Decimal('0.0'): ContinuousRate(Decimal('0.015')),
+                               Decimal('1000.0'): PeriodicRate(Decimal('0.02'), 12)})
+    balance = Decimal('1500.0')
+    accrued = Decimal('3.0')
+    with localcontext(prec=100):
+        exact = rate.calculate(INITIAL_DATE, balance, accrued)
+        monitor = DivergenceMonitor(sample_every_days=7)
+        with numeric_backend(NumericBackend.FLOAT64, monitor):
+            fast = rate.calculate(INITIAL_DATE, balance, accrued)
+            for day in range(70):
+                rate.calculate(INITIAL_DATE + timedelta(days=day), balance, accrued)
+        assert type(fast) is RateCalculation
+        assert abs(fast.calculation - exact.calculation) < Decimal('1e-15')
+        assert abs(float(fast.calculation) - rate.calculate_batch(INITIAL_DATE, [1500.0], [3.0])[0]) < 1e-15
+        report = monitor.report()
+        assert report.samples == 10
+        assert report.max_divergence < Decimal('1e-15')
+        assert report.max_relative_divergence < Decimal('1e-13')
+        assert report.worst_source in (None, rate)
+        assert rate.calculate(INITIAL_DATE, balance, accrued) is exact
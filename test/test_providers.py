@@ -1,10 +1,13 @@
-from calendar import JANUARY
+from calendar import DECEMBER, FEBRUARY, JANUARY
+from dataclasses import replace
 from datetime import date, timedelta
 from itertools import islice
 from typing import Tuple, Generator, TypeVar, Sequence, Mapping
 
 from financial_simulator.lib.providers import Provider, NeverProvider, AlwaysProvider, ScheduledProvider, FunctionProvider, \
-    MapProvider, FlatMapProvider, NextProvider, MergeProvider, MergeMapProvider, create_sequence_provider
+    MapProvider, FlatMapProvider, NextProvider, MergeProvider, MergeMapProvider, SequenceProvider, \
+    create_sequence_provider
+from financial_simulator.lib.providers.provider import LOOK_AHEAD_DAYS
 from financial_simulator.lib.schedules import DaySchedule, UntilSchedule
 
 T = TypeVar("T")
@@ -46,6 +49,13 @@ def check(provider: Provider,
     expected = tuple((day, provided(day, provided_days, completed_from)) for day in days)
     actual = tuple(islice(generate(provider, start_date), number_of_days))
     assert actual == expected
+    # the next emission may be early but must never be later than the first provided values
+    first_provided = min((day for day, sequence in expected if sequence), default=None)
+    next_emission = provider.next_emission(start_date - timedelta(days=1))
+    if next_emission is None:
+        assert first_provided is None
+    elif first_provided is not None:
+        assert next_emission <= first_provided
 
 
 def test_never_provider():
@@ -292,3 +302,117 @@ def test_create_sequence_provider():
               date(2021, JANUARY, 12): (300,),
           },
           completed_from=date(2021, JANUARY, 13))
+
+
+def test_create_sequence_provider_unsorted():
+    check(provider=create_sequence_provider({date(2021, JANUARY, 9): 100,
+                                             date(2020, JANUARY, 1): 50,
+                                             date(2021, JANUARY, 5): 200}),
+          start_date=date(2021, JANUARY, 1),
+          number_of_days=15,
+          provided_days={
+              date(2021, JANUARY, 5): (200,),
+              date(2021, JANUARY, 9): (100,),
+          },
+          completed_from=date(2021, JANUARY, 10))
+
+
+def test_sequence_provider_seek():
+    days = tuple(date(2021, JANUARY, 1) + timedelta(days=i) for i in range(0, 3650, 10))
+    provider = SequenceProvider(days=days, values=tuple(range(len(days))))
+    assert provider.next_emission(date(2020, JANUARY, 1)) == date(2021, JANUARY, 1)
+    assert provider.next_emission(date(2021, JANUARY, 1)) == date(2021, JANUARY, 11)
+    provider = provider.seek(date(2021, JANUARY, 12))
+    assert provider.index == 2
+    assert provider.days is days
+    assert provider.next_emission(date(2021, JANUARY, 1)) == date(2021, JANUARY, 21)
+    provider, values = provider.get(date(2021, JANUARY, 21))
+    assert values == (2,)
+    assert provider.get(date(2040, JANUARY, 1)) is None
+    assert provider.next_emission(days[-1]) is None
+
+
+def test_next_emission():
+    after = date(2021, JANUARY, 1)
+    day_5 = ScheduledProvider('Hi!', DaySchedule(date(2021, JANUARY, 5)))
+    day_9 = ScheduledProvider('Hi!', DaySchedule(date(2021, JANUARY, 9)))
+    assert NeverProvider().next_emission(after) is None
+    assert AlwaysProvider('Hi!').next_emission(after) == date(2021, JANUARY, 2)
+    assert day_5.next_emission(after) == date(2021, JANUARY, 5)
+    assert day_5.next_emission(date(2021, JANUARY, 5)) is None
+    assert MapProvider(transform=str.upper, provider=day_5).next_emission(after) == date(2021, JANUARY, 5)
+    assert FlatMapProvider(transform=tuple, provider=day_5).next_emission(after) == date(2021, JANUARY, 5)
+    assert MergeProvider(providers=(day_9, day_5)).next_emission(after) == date(2021, JANUARY, 5)
+    assert NextProvider(providers=(day_9, day_5)).next_emission(date(2021, JANUARY, 5)) == date(2021, JANUARY, 9)
+    assert MergeProvider(providers=()).next_emission(after) is None
+    merge_map = MergeMapProvider(transform=lambda current_date, value: create_sequence_provider(
+        {current_date + timedelta(days=2): value}), provider=day_9, sub_providers=(day_5,))
+    assert merge_map.next_emission(after) == date(2021, JANUARY, 5)
+    assert merge_map.next_emission(date(2021, JANUARY, 5)) == date(2021, JANUARY, 9)
+    assert replace(merge_map, provider=None).next_emission(date(2021, JANUARY, 5)) is None
+
+
+def test_function_provider_next_emission():
+    provider = FunctionProvider(lambda current_date: (current_date,) if current_date.day == 15 else ())
+    assert provider.next_emission(date(2021, JANUARY, 1)) == date(2021, JANUARY, 15)
+    assert provider.next_emission(date(2021, JANUARY, 15)) == date(2021, FEBRUARY, 15)
+    provider = FunctionProvider(lambda current_date: () if current_date < date(2021, JANUARY, 5) else None)
+    assert provider.next_emission(date(2021, JANUARY, 1)) is None
+    provider = FunctionProvider(lambda current_date: ())
+    assert provider.next_emission(date(2021, JANUARY, 1)) == date(2021, JANUARY, 1) + timedelta(
+        days=LOOK_AHEAD_DAYS + 1)
+    # only the look ahead window is probed, its end is a conservative wake-up date
+    probed = []
+    provider = FunctionProvider(lambda current_date: probed.append(current_date) or
+                                ((current_date,) if current_date == date(2021, DECEMBER, 25) else ()))
+    assert provider.next_emission(date(2021, JANUARY, 1)) == date(2021, FEBRUARY, 2)
+    assert len(probed) == LOOK_AHEAD_DAYS
+    assert provider.next_emission(date(2021, DECEMBER, 1)) == date(2021, DECEMBER, 25)
+
+
+def test_merge_map_provider_pruning():
+    start_date = date(2021, JANUARY, 1)
+    # each monthly salary payment starts twelve monthly pension contributions
+    salaries = create_sequence_provider({date(2021 + month // 12, month % 12 + 1, 25): month for month in range(36)})
+    provider = MergeMapProvider(transform=lambda current_date, value: create_sequence_provider(
+        {date(current_date.year + (current_date.month + i) // 12, (current_date.month + i) % 12 + 1, 1): value
+         for i in range(12)}), provider=salaries)
+    live = []
+    provided = {}
+    for day, sequence in islice(generate(provider, start_date), 365 * 5):
+        if sequence:
+            provided[day] = sequence
+        if provider is not None:
+            provided_and_provider = provider.get(day)
+            provider = None if provided_and_provider is None else provided_and_provider[0]
+            if provider is not None:
+                live.append(provider.live_sub_providers)
+                total = provider.total_sub_providers
+    assert max(live) == 12
+    assert total == 36
+    assert provided[date(2021, FEBRUARY, 1)] == (0,)
+    assert provided[date(2022, JANUARY, 1)] == tuple(range(12))
+    assert provided[date(2024, DECEMBER, 1)] == (35,)
+    assert max(provided) == date(2024, DECEMBER, 1)
+
+
+def test_merge_map_provider_skipped_days():
+    provider = MergeMapProvider(transform=lambda current_date, value: create_sequence_provider(
+        {current_date + timedelta(days=i): f'{value}-{i}' for i in range(1, 4)}),
+                                provider=None,
+                                sub_providers=(create_sequence_provider({date(2021, JANUARY, 2): 'a'}),
+                                               create_sequence_provider({date(2021, JANUARY, 5): 'b',
+                                                                         date(2021, JANUARY, 9): 'c'})))
+    assert provider.live_sub_providers == 2
+    assert provider.next_emission(date(2021, JANUARY, 1)) == date(2021, JANUARY, 2)
+    provider, values = provider.get(date(2021, JANUARY, 2))
+    assert values == ('a',)
+    assert provider.live_sub_providers == 1
+    assert provider.total_sub_providers == 2
+    assert provider.next_emission(date(2021, JANUARY, 2)) == date(2021, JANUARY, 5)
+    provider, values = provider.get(date(2021, JANUARY, 7))
+    assert values == ()
+    provider, values = provider.get(date(2021, JANUARY, 9))
+    assert values == ('c',)
+    assert provider.live_sub_providers == 0
+    assert provider.get(date(2021, JANUARY, 10)) is None
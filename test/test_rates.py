@@ -1,9 +1,12 @@
 from calendar import JANUARY
 from datetime import date
-from decimal import Decimal
+from decimal import Decimal, localcontext
+
+import numpy as np
 
 from financial_simulator.lib.rates import ContinuousRate, ContinuousRateCalculation, PeriodicRate, \
-    PeriodicRateCalculation, create_banded_rate, BandedRateCalculation
+    PeriodicRateCalculation, create_banded_rate, BandedRateCalculation, RateCache, Rate, \
+    DAILY_RATE_TABLE, DailyRateTable
 
 
 def test_continuous_rate():
@@ -128,3 +131,119 @@ def test_banded_rate():
                                                                                           daily_rate=daily_rate_3,
                                                                                           calculation=(
                                                                                                               balance + accrued - band_3_start) * daily_rate_3)))
+
+
+
+def test_banded_rate_unreached_bands():
+    continuous_rate_3 = ContinuousRate(Decimal('0.03'))
+    banded_rate = create_banded_rate({Decimal('0.0'): ContinuousRate(Decimal('0.01')),
+                                      Decimal('1000.0'): ContinuousRate(Decimal('0.02')),
+                                      Decimal('5000.0'): continuous_rate_3})
+    banded_rate_calculation = banded_rate.calculate(date(2021, JANUARY, 1), Decimal('1500.0'), Decimal('5.0'))
+    assert len(banded_rate_calculation.calculations) == 3
+    assert banded_rate_calculation.calculations[2] == continuous_rate_3.calculate(date(2021, JANUARY, 1),
+                                                                                   Decimal('0.0'),
+                                                                                   Decimal('0.0'))
+    assert 'above 5000.00' in str(banded_rate_calculation)
+
+def test_rate_cache():
+    cache = RateCache(max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    statistics = cache.statistics()
+    assert (statistics.hits, statistics.misses, statistics.evictions, statistics.size) == (3, 1, 1, 2)
+    assert statistics.hit_rate == 0.75
+    cache.clear()
+    assert cache.statistics().size == 0
+
+
+def test_rate_calculation_cache():
+    previous_cache = ContinuousRate.calculation_cache
+    try:
+        ContinuousRate.calculation_cache = RateCache(max_size=1)
+        rate = ContinuousRate(Decimal('0.015'))
+        first = rate.calculate(date(2021, JANUARY, 1), Decimal('100.0'), Decimal('0.0'))
+        assert rate.calculate(date(2021, JANUARY, 1), Decimal('100.0'), Decimal('0.0')) is first
+        rate.calculate(date(2021, JANUARY, 2), Decimal('100.0'), Decimal('0.0'))
+        assert rate.calculate(date(2021, JANUARY, 1), Decimal('100.0'), Decimal('0.0')) is not first
+        statistics = ContinuousRate.calculation_cache.statistics()
+        assert (statistics.hits, statistics.misses, statistics.evictions, statistics.size) == (1, 3, 2, 1)
+        ContinuousRate.calculation_cache = RateCache(enabled=False)
+        second = rate.calculate(date(2021, JANUARY, 1), Decimal('100.0'), Decimal('0.0'))
+        assert second == first
+        assert rate.calculate(date(2021, JANUARY, 1), Decimal('100.0'), Decimal('0.0')) is not second
+        assert ContinuousRate.calculation_cache.statistics().size == 0
+    finally:
+        ContinuousRate.calculation_cache = previous_cache
+
+
+def check_calculate_span(rate, balance, accrued):
+    start = date(2023, 6, 1)
+    end = date(2025, 3, 1)
+    expected = Rate.calculate_span(rate, start, end, balance, accrued)
+    assert abs(rate.calculate_span(start, end, balance, accrued) - expected) < Decimal('1e-15')
+    assert rate.calculate_span(start, start, balance, accrued) == rate.calculate(start, balance, accrued).calculation
+
+
+def test_calculate_span():
+    check_calculate_span(ContinuousRate(Decimal('0.05')), Decimal('1000.0'), Decimal('20.0'))
+    check_calculate_span(PeriodicRate(Decimal('0.05'), 12), Decimal('1000.0'), Decimal('20.0'))
+    banded_rate = create_banded_rate({
+        Decimal('0.0'): ContinuousRate(Decimal('0.5')),
+        Decimal('1000.0'): PeriodicRate(Decimal('0.3'), 12),
+        Decimal('1100.0'): ContinuousRate(Decimal('0.1')),
+        Decimal('2000.0'): ContinuousRate(Decimal('0.0')),
+    })
+    check_calculate_span(banded_rate, Decimal('900.0'), Decimal('50.0'))
+    check_calculate_span(banded_rate, Decimal('1050.0'), Decimal('0.0'))
+    check_calculate_span(banded_rate, Decimal('-100.0'), Decimal('0.0'))
+    check_calculate_span(create_banded_rate({
+        Decimal('0.0'): ContinuousRate(Decimal('-0.01')),
+        Decimal('1000.0'): ContinuousRate(Decimal('0.02')),
+    }), Decimal('1000.5'), Decimal('0.0'))
+
+
+def test_calculate_batch():
+    banded_rate = create_banded_rate({
+        Decimal('0.0'): ContinuousRate(Decimal('0.015')),
+        Decimal('1000.0'): PeriodicRate(Decimal('0.02'), 12),
+        Decimal('5000.0'): ContinuousRate(Decimal('0.0')),
+    })
+    current_date = date(2024, JANUARY, 1)
+    balances = [Decimal('-100.0'), Decimal('0.0'), Decimal('500.0'), Decimal('990.0'), Decimal('3000.0'),
+                Decimal('7000.0')]
+    accrued = [Decimal('5.0'), Decimal('0.0'), Decimal('10.0'), Decimal('20.0'), Decimal('-5.0'), Decimal('1.0')]
+    for rate in (ContinuousRate(Decimal('0.015')), PeriodicRate(Decimal('0.015'), 4), banded_rate):
+        exact = rate.calculate_batch(current_date, np.array(balances, dtype=object), np.array(accrued, dtype=object))
+        assert tuple(exact) == tuple(rate.calculate(current_date, balance, accrued_amount).calculation
+                                     for balance, accrued_amount in zip(balances, accrued))
+        fast = rate.calculate_batch(current_date, np.array(balances, dtype=np.float64),
+                                    np.array(accrued, dtype=np.float64))
+        assert fast.dtype == np.float64
+        assert np.allclose(fast, np.array(exact, dtype=np.float64), rtol=1e-12, atol=1e-15)
+    assert banded_rate.calculate_batch(current_date, np.array([[1000.0, 2000.0]]), 0.0).shape == (1, 2)
+
+
+def test_daily_rate_table(tmp_path):
+    DAILY_RATE_TABLE.clear()
+    banded_rate = create_banded_rate({Decimal('0.0'): ContinuousRate(Decimal('0.015')),
+                                      Decimal('1000.0'): PeriodicRate(Decimal('0.02'), 12)})
+    banded_rate.precompute_daily_rates(range(2020, 2030))
+    assert len(DAILY_RATE_TABLE) == 20
+    ContinuousRate(Decimal('0.015')).calculate(date(2025, JANUARY, 1), Decimal('1.0'), Decimal('0.0'))
+    assert len(DAILY_RATE_TABLE) == 20
+    with localcontext(prec=10):
+        calculation = ContinuousRate(Decimal('0.015')).calculate(date(2025, JANUARY, 2), Decimal('1.0'),
+                                                                 Decimal('0.0'))
+        assert calculation.daily_rate == ((1 + Decimal('0.015')) ** (1 / Decimal('365'))) - 1
+    assert len(DAILY_RATE_TABLE) == 21
+    path = tmp_path / 'daily_rates.json'
+    DAILY_RATE_TABLE.save(path)
+    table = DailyRateTable()
+    table.load(path)
+    assert table.rates == DAILY_RATE_TABLE.rates
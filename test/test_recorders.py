@@ -0,0 +1,88 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import islice
+
+import numpy as np
+import pytest
+
+from financial_simulator import FinancialSimulator
+from financial_simulator.lib.accounting import Books
+from financial_simulator.lib.providers import AlwaysProvider
+from financial_simulator.lib.recorders import BalanceRecorder
+from mock_entities import CASH, EQUITY, MockIncomeEntity
+
+INITIAL_DATE = date(2020, 1, 1)
+
+
+def simulate(number_of_days: int):
+    return islice(
+        FinancialSimulator(
+            INITIAL_DATE,
+            (
+                MockIncomeEntity("Entity 1", Books.create_empty(INITIAL_DATE), AlwaysProvider(Decimal("1"))),
+                MockIncomeEntity("Entity 2", Books.create_empty(INITIAL_DATE), AlwaysProvider(Decimal("2"))),
+            ),
+        ),
+        number_of_days,
+    )
+
+
+def check_recorder(recorder: BalanceRecorder):
+    assert recorder.columns == (
+        ("Entity 1", CASH),
+        ("Entity 1", EQUITY),
+        ("Entity 2", CASH),
+        ("Entity 2", EQUITY),
+    )
+    dates = recorder.dates()
+    assert len(dates) == 10
+    assert dates[0] == np.datetime64(INITIAL_DATE + timedelta(days=1), "D")
+    assert dates[-1] == np.datetime64(INITIAL_DATE + timedelta(days=10), "D")
+    days = np.arange(1, 11, dtype=np.float64)
+    assert np.array_equal(recorder.balances(), np.column_stack((-days, days, -2 * days, 2 * days)))
+    data_frame = recorder.to_data_frame()
+    assert len(data_frame) == 40
+    assert tuple(data_frame.iloc[2]) == (dates[0], "Entity 2", "assets:cash", -2.0)
+    balances = recorder.account_balances(CASH, ("One", "Two"), is_debit_account=True)
+    assert tuple(balances.columns) == ("Date", "Entity", "Balance")
+    assert tuple(balances["Entity"].unique()) == ("One", "Two")
+    assert tuple(balances.iloc[-1])[1:] == ("Two", 20.0)
+
+
+def test_record_in_memory():
+    recorder = BalanceRecorder(account_paths=(CASH, EQUITY), chunk_size=3).record(simulate(10))
+    assert recorder.chunk_count == 4
+    check_recorder(recorder)
+
+
+def test_record_partial_chunk():
+    recorder = BalanceRecorder(account_paths=(CASH, EQUITY), chunk_size=4)
+    for current_date, entities in simulate(10):
+        recorder.append(current_date, entities)
+    assert recorder.chunk_count == 2
+    assert recorder.buffered == 2
+    check_recorder(recorder)
+
+
+def test_record_npy(tmp_path):
+    recorder = BalanceRecorder(account_paths=(CASH, EQUITY), chunk_size=4, directory=tmp_path).record(simulate(10))
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"chunk-{index:05d}-{name}.npy" for index in range(3) for name in ("balances", "dates")
+    ]
+    check_recorder(recorder)
+
+
+def test_record_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    recorder = BalanceRecorder(
+        account_paths=(CASH, EQUITY), chunk_size=4, directory=tmp_path, chunk_format="parquet"
+    ).record(simulate(10))
+    assert len(tuple(tmp_path.glob("*.parquet"))) == 3
+    check_recorder(recorder)
+
+
+def test_record_nothing():
+    recorder = BalanceRecorder(account_paths=(CASH, EQUITY)).record(())
+    assert recorder.dates().shape == (0,)
+    assert recorder.balances().shape == (0, 0)
+    assert recorder.to_data_frame().empty
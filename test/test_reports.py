@@ -0,0 +1,52 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from financial_simulator.lib.rates import ContinuousRate, PeriodicRate, create_banded_rate
+from financial_simulator.lib.reports import (
+    render_rate_calculation,
+    render_rate_calculations,
+    render_table,
+    render_tax_bands,
+    render_tax_calculations,
+    render_tax_totals,
+)
+from financial_simulator.lib.tax.tax_bands_by_year import TaxBands
+
+INITIAL_DATE = date(2021, 1, 1)
+
+
+def test_render_table():
+    rows = [['a', '1'], ['b', '2']]
+    assert render_table(['Name', 'Value'], rows, 'csv', totals=[['Total', '3']]) == 'Name,Value\na,1\nb,2\nTotal,3\n'
+    assert render_table(['Name', 'Value'], rows, 'markdown').splitlines() == ['| Name | Value |',
+                                                                              '| :--: | :---: |',
+                                                                              '|  a   |   1   |',
+                                                                              '|  b   |   2   |']
+    table = render_table(['Name', 'Value'], rows, totals=[['Total', '3']])
+    assert table.count('├') == 2
+
+
+def test_render_rate_calculations():
+    rate = create_banded_rate({Decimal('0.0'): ContinuousRate(Decimal('0.01')),
+                               Decimal('1000.0'): PeriodicRate(Decimal('0.02'), 12)})
+    calculations = [rate.calculate(INITIAL_DATE + timedelta(days=day), Decimal('1500.0'), Decimal('5.0'))
+                    for day in range(3)]
+    assert str(calculations[0]) == render_rate_calculation(calculations[0])
+    assert 'Totals' in str(calculations[0])
+    csv = render_rate_calculations(calculations, 'csv').splitlines()
+    assert csv[0] == 'Date,Rate,Balance,Accrued,Calculation'
+    assert len(csv) == 4
+    assert csv[1].startswith('2021-01-01,')
+    detail = render_rate_calculation(calculations[0].calculations[0], 'csv').splitlines()
+    assert detail[0] == 'Current date,2021-01-01 : Fri'
+    assert detail[2] == 'Daily rate,0.002726'
+
+
+def test_render_tax():
+    tax_bands = TaxBands({0.0: 0.1, 1000.0: 0.2})
+    assert str(tax_bands) == render_tax_bands(tax_bands)
+    calculations = tax_bands.calculate(2500.0)
+    assert str(calculations) == render_tax_calculations(calculations)
+    assert render_tax_calculations(calculations, 'csv').splitlines()[-1] == ',Total,2_500.00,400.00'
+    assert render_tax_totals([calculations, tax_bands.calculate(500.0)], 'csv').splitlines() == [
+        'Taxable portion,Tax Due', '2_500.00,400.00', '500.00,50.00']
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+
+from financial_simulator.lib.accounting import Books
+from financial_simulator.lib.providers import AlwaysProvider
+from financial_simulator.lib.scenarios import Scenario, run_scenario, run_scenarios
+from mock_entities import CASH, MockIncomeEntity
+
+INITIAL_DATE = date(2020, 1, 1)
+
+
+def create_scenario(name: str, amount: str) -> Scenario:
+    return Scenario(
+        name=name,
+        initial_date=INITIAL_DATE,
+        entities=(
+            MockIncomeEntity(
+                name="saver",
+                books=Books.create_empty(INITIAL_DATE),
+                income=AlwaysProvider(Decimal(amount)),
+            ),
+        ),
+        number_of_days=10,
+        account_paths=(CASH,),
+    )
+
+
+def test_run_scenario():
+    result = run_scenario(create_scenario("single", "1.5"))
+    assert result.name == "single"
+    assert result.columns == (("saver", CASH),)
+    assert result.number_of_days == 10
+    assert result.dates[0] == np.datetime64(INITIAL_DATE + timedelta(days=1), "D")
+    assert result.dates[-1] == np.datetime64(INITIAL_DATE + timedelta(days=10), "D")
+    assert np.array_equal(
+        result.balances[:, 0], -1.5 * np.arange(1, 11, dtype=np.float64)
+    )
+    data_frame = result.to_data_frame()
+    assert len(data_frame) == 10
+    assert tuple(data_frame.columns) == (
+        "Scenario",
+        "Date",
+        "Entity",
+        "Account",
+        "Balance",
+    )
+    assert data_frame["Account"].iloc[0] == "assets:cash"
+
+
+def test_run_scenarios():
+    scenarios = tuple(
+        create_scenario(f"scenario_{index}", str(index)) for index in range(4)
+    )
+    scenario_run = run_scenarios(scenarios, max_workers=2)
+    assert tuple(result.name for result in scenario_run.results) == tuple(
+        scenario.name for scenario in scenarios
+    )
+    for index, result in enumerate(scenario_run.results):
+        assert result.balances[-1, 0] == -10.0 * index
+    assert sum(throughput.scenarios for throughput in scenario_run.throughput) == 4
+    assert sum(throughput.days for throughput in scenario_run.throughput) == 40
@@ -47,6 +47,18 @@ def check(schedule: Schedule,
     assert actual == expected
 
 
+def check_next_occurrences(schedule: Schedule, start_date: date, number_of_days: int) -> None:
+    days = tuple(islice(generate(schedule, start_date), number_of_days))
+    for index, (day, _) in enumerate(days[:-1]):
+        expected = next(((later_day, scheduled) for later_day, scheduled in days[index + 1:] if scheduled is not False),
+                        None)
+        if expected is None:
+            # nothing happens within the window so we cannot tell what to expect
+            continue
+        later_day, scheduled = expected
+        assert schedule.next_occurrence(day) == (later_day if scheduled else None)
+
+
 def test_never_schedule():
     check(schedule=NeverSchedule(),
           start_date=date(2021, JANUARY, 1),
@@ -239,3 +251,33 @@ def test_all_schedule():
               date(2021, JANUARY, 16),
           },
           completed_from=date(2021, JANUARY, 17))
+
+
+def test_next_occurrence():
+    start_date = date(2021, JANUARY, 1)
+    for schedule in (NeverSchedule(),
+                     DailySchedule(),
+                     WeeklySchedule(TUESDAY),
+                     MonthlySchedule(30),
+                     MonthlySchedule(1),
+                     YearlySchedule(FEBRUARY, 30),
+                     YearlySchedule(DECEMBER, 31),
+                     DaySchedule(date(2021, MARCH, 7)),
+                     FromSchedule(date(2021, MARCH, 20)),
+                     UntilSchedule(date(2021, JANUARY, 7)),
+                     RangeSchedule(from_date=date(2021, JANUARY, 7), until_date=date(2021, JANUARY, 14)),
+                     FunctionSchedule(function=lambda current_date: current_date.weekday() < SATURDAY
+                                      if current_date < date(2021, JANUARY, 16) else None),
+                     AnySchedule((DaySchedule(date(2021, JANUARY, 17)),
+                                  DaySchedule(date(2021, FEBRUARY, 10)),
+                                  DaySchedule(date(2021, MARCH, 24)))),
+                     AllSchedule((UntilSchedule(date(2021, JANUARY, 17)),
+                                  FromSchedule(date(2021, JANUARY, 10)))),
+                     AllSchedule((WeeklySchedule(TUESDAY),
+                                  MonthlySchedule(30)))):
+        check_next_occurrences(schedule, start_date, 800)
+
+
+def test_next_occurrence_never_agrees():
+    schedule = AllSchedule((YearlySchedule(JANUARY, 1), YearlySchedule(APRIL, 1)))
+    assert schedule.next_occurrence(date(2021, JANUARY, 1)) > date(2121, JANUARY, 1)
@@ -0,0 +1,134 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from financial_simulator.lib.tax import TaxBandData, TaxBandDataCache, TaxBandDataError, TaxBandsByYear
+from financial_simulator.lib.tax.tax_bands_by_year import TaxBands
+
+
+def test_tax_bands_tax_due():
+    tax_bands = TaxBands({0.0: 0.1, 1000.0: 0.2, 5000.0: 0.4})
+    assert tax_bands.thresholds == (0.0, 1000.0, 5000.0)
+    assert tax_bands.cumulative_tax == (0.0, 100.0, 900.0)
+    for taxable in [-10.0, 0.0, 500.0, 1000.0, 2500.0, 5000.0, 12345.0]:
+        expected = sum(band.calculate(taxable).tax_due for band in tax_bands.bands)
+        assert tax_bands.tax_due(taxable) == pytest.approx(expected)
+    calculations = tax_bands.calculate(2500.0)
+    assert calculations.taxable == 2500.0
+    assert calculations.tax_due == pytest.approx(400.0)
+    assert [calculation.tax_due for calculation in calculations.calculations] == pytest.approx([100.0, 300.0, 0.0])
+
+
+def test_tax_bands_without_zero_band():
+    tax_bands = TaxBands({1000.0: 0.2})
+    assert tax_bands.thresholds == (0.0, 1000.0)
+    assert tax_bands.tax_due(500.0) == 0.0
+    assert tax_bands.tax_due(1500.0) == pytest.approx(100.0)
+
+
+def test_tax_bands_by_year(tmp_path):
+    data_file = tmp_path / 'bands.json'
+    data_file.write_text(json.dumps([
+        {'year': 2023, 'bands': [{'rate': 0.2, 'above': 0}]},
+        {'year': 2020, 'bands': [{'rate': 0.1, 'above': 0}]},
+    ]))
+    tax_bands_by_year = TaxBandsByYear(str(data_file))
+    assert tax_bands_by_year.year_keys == (2020, 2023)
+    assert tax_bands_by_year.get_bands(2020).rates == (0.1,)
+    assert tax_bands_by_year.get_bands(2022).rates == (0.1,)
+    assert tax_bands_by_year.get_bands(2030).rates == (0.2,)
+    with pytest.raises(Exception, match='No bands found for year 2019'):
+        tax_bands_by_year.get_bands(2019)
+
+
+
+def test_tax_bands_by_year_labels(tmp_path):
+    data_file = tmp_path / 'bands.json'
+    data_file.write_text(json.dumps([
+        {'year': 2025, 'bands': [{'rate': 0.19, 'above': 0}, {'rate': 0.258, 'above': 200000},
+                                 {'rate': 0.3, 'above': 250000.5}]},
+    ]))
+    labels, rates = TaxBandsByYear(str(data_file)).get_bands(2025).format_columns()
+    assert labels == ('up to 200_000', 'from 200_000 to 250_000.5', 'above 250_000.5')
+    assert rates == ('19.00%', '25.80%', '30.00%')
+
+def test_tax_bands_tax_due_array():
+    tax_bands = TaxBands({0.0: 0.1, 1000.0: 0.2, 5000.0: 0.4})
+    taxable = np.array([-10.0, 0.0, 500.0, 1000.0, 2500.0, 5000.0, 12345.0])
+    expected = [tax_bands.tax_due(amount) for amount in taxable]
+    assert tax_bands.tax_due_array(taxable) == pytest.approx(expected)
+
+
+def test_tax_bands_by_year_calculate_batch(tmp_path):
+    data_file = tmp_path / 'bands.json'
+    data_file.write_text(json.dumps([
+        {'year': 2020, 'bands': [{'rate': 0.1, 'above': 0}, {'rate': 0.3, 'above': 1000}]},
+        {'year': 2023, 'bands': [{'rate': 0.2, 'above': 0}]},
+    ]))
+    tax_bands_by_year = TaxBandsByYear(str(data_file))
+    taxable = np.array([500.0, 2000.0, 2000.0, 3000.0])
+    years = np.array([2020, 2021, 2023, 2030])
+    assert tax_bands_by_year.calculate_batch(taxable, years) == pytest.approx([50.0, 400.0, 400.0, 600.0])
+    assert tax_bands_by_year.calculate_batch(taxable, 2020) == pytest.approx([50.0, 400.0, 400.0, 700.0])
+    breakdowns = tax_bands_by_year.calculate_breakdowns(taxable, years)
+    assert [breakdown.tax_due for breakdown in breakdowns] == pytest.approx([50.0, 400.0, 400.0, 600.0])
+    assert [calculation.tax_due for calculation in breakdowns[1].calculations] == pytest.approx([100.0, 300.0])
+    assert tax_bands_by_year.calculate_batch(2000.0, years) == pytest.approx([400.0, 400.0, 400.0, 400.0])
+    assert tax_bands_by_year.calculate_batch(taxable[:, np.newaxis], years).shape == (4, 4)
+    assert len(tax_bands_by_year.calculate_breakdowns(3000.0, years)) == 4
+    with pytest.raises(Exception, match='No bands found for year 2019'):
+        tax_bands_by_year.calculate_batch(taxable, [2020, 2019, 2021, 2023])
+
+
+def test_tax_band_data_validation():
+    with pytest.raises(TaxBandDataError, match='Duplicate bands for year 2020'):
+        TaxBandData.from_json([{'year': 2020, 'bands': [{'rate': 0.1, 'above': 0}]}] * 2)
+    with pytest.raises(TaxBandDataError, match='Invalid rate'):
+        TaxBandData.from_json([{'year': 2020, 'bands': [{'rate': 1.5, 'above': 0}]}])
+    with pytest.raises(TaxBandDataError, match='Malformed'):
+        TaxBandData.from_json([{'year': 2020}])
+    data = TaxBandData.from_json([
+        {'year': 2023, 'bands': [{'rate': 0.3, 'above': 1000}, {'rate': 0.2, 'above': 0}]},
+        {'year': 2020, 'bands': [{'rate': 0.1, 'above': 0}]},
+    ])
+    assert data.years.tolist() == [2020, 2023]
+    assert data.offsets.tolist() == [0, 1, 3]
+    assert data.year_bands(1) == {0.0: 0.2, 1000.0: 0.3}
+    assert not data.thresholds.flags.writeable
+
+
+def test_tax_band_data_cache(tmp_path):
+    data_file = tmp_path / 'bands.json'
+    data_file.write_text(json.dumps([{'year': 2020, 'bands': [{'rate': 0.1, 'above': 0}]}]))
+    cache = TaxBandDataCache()
+    data = cache.load(data_file)
+    assert cache.load(str(data_file)) is data
+    assert len(cache) == 1
+    data_file.write_text(json.dumps([{'year': 2020, 'bands': [{'rate': 0.2, 'above': 0}]}]))
+    os.utime(data_file, ns=(0, data_file.stat().st_mtime_ns + 1))
+    reloaded = cache.load(data_file)
+    assert reloaded is not data
+    assert reloaded.rates.tolist() == [0.2]
+    assert len(cache) == 1
+    assert TaxBandsByYear(str(data_file)).years is TaxBandsByYear(str(data_file)).years
+
+
+def test_tax_band_data_sidecar(tmp_path):
+    data_file = tmp_path / 'bands.json'
+    data_file.write_text(json.dumps([
+        {'year': 2020, 'bands': [{'rate': 0.1, 'above': 0}, {'rate': 0.3, 'above': 1000}]},
+    ]))
+    data = TaxBandDataCache().load(data_file, sidecar=True)
+    sidecar = tmp_path / 'bands.json.bin'
+    assert sidecar.exists()
+    mapped = TaxBandDataCache().load(data_file, sidecar=True)
+    assert isinstance(mapped.thresholds.base, np.memmap)
+    assert mapped.thresholds.tolist() == data.thresholds.tolist()
+    assert mapped.rates.tolist() == data.rates.tolist()
+    with pytest.raises(TaxBandDataError, match='stale'):
+        TaxBandData.read(sidecar, data_file.stat().st_mtime_ns + 1)
+    sidecar.write_bytes(b'junk')
+    assert TaxBandDataCache().load(data_file, sidecar=True).rates.tolist() == [0.1, 0.3]
+    assert sidecar.stat().st_size > 4